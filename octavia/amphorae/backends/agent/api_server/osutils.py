@@ -13,6 +13,7 @@
 # under the License.
 
 import errno
+import functools
 import ipaddress
 import os
 import shutil
@@ -38,6 +39,13 @@ j2_env = jinja2.Environment(autoescape=True, loader=jinja2.FileSystemLoader(
     os.path.dirname(os.path.realpath(__file__)) + consts.AGENT_API_TEMPLATES))
 
 
+@functools.lru_cache(maxsize=None)
+def _get_template(name):
+    # The templates do not change while the agent runs, so there is no need
+    # for get_template to check the template file on every call.
+    return j2_env.get_template(name)
+
+
 class BaseOS(object):
 
     def __init__(self, os_name):
@@ -157,6 +165,9 @@ class BaseOS(object):
         if fixed_ips is None:
             text = template_port.render(interface=netns_interface)
         else:
+            # Each rendered interface is preceded by a newline, they are
+            # joined once all of them are rendered.
+            texts = [text]
             for index, fixed_ip in enumerate(fixed_ips, -1):
                 try:
                     ip_addr = fixed_ip['ip_address']
@@ -178,7 +189,8 @@ class BaseOS(object):
                                                 netmask=netmask,
                                                 mtu=mtu,
                                                 host_routes=host_routes)
-                text = '\n'.join([text, new_text])
+                texts.append(new_text)
+            text = '\n'.join(texts)
         return text
 
     @classmethod
@@ -306,7 +318,7 @@ class Ubuntu(BaseOS):
                                  netmask, gateway, mtu, vrrp_ip, vrrp_version,
                                  render_host_routes, template_vip=None):
         if not template_vip:
-            template_vip = j2_env.get_template(self.ETH_X_VIP_CONF)
+            template_vip = _get_template(self.ETH_X_VIP_CONF)
         super().write_vip_interface_file(
             interface_file_path, primary_interface, vip, ip, broadcast,
             netmask, gateway, mtu, vrrp_ip, vrrp_version, render_host_routes,
@@ -319,7 +331,7 @@ class Ubuntu(BaseOS):
             interface_file_path = self.get_network_interface_file(
                 netns_interface)
         if not template_port:
-            template_port = j2_env.get_template(self.ETH_X_PORT_CONF)
+            template_port = _get_template(self.ETH_X_PORT_CONF)
         super().write_port_interface_file(
             netns_interface, fixed_ips, mtu, interface_file_path,
             template_port)
@@ -409,7 +421,7 @@ class RH(BaseOS):
                                  netmask, gateway, mtu, vrrp_ip, vrrp_version,
                                  render_host_routes, template_vip=None):
         if not template_vip:
-            template_vip = j2_env.get_template(self.ETH_X_VIP_CONF)
+            template_vip = _get_template(self.ETH_X_VIP_CONF)
         super().write_vip_interface_file(
             interface_file_path, primary_interface, vip, ip, broadcast,
             netmask, gateway, mtu, vrrp_ip, vrrp_version, render_host_routes,
@@ -422,7 +434,7 @@ class RH(BaseOS):
             # Create an IPv4 alias interface, needed in RH based flavors
             alias_interface_file_path = self.get_alias_network_interface_file(
                 primary_interface)
-            template_vip_alias = j2_env.get_template(self.ETH_X_ALIAS_VIP_CONF)
+            template_vip_alias = _get_template(self.ETH_X_ALIAS_VIP_CONF)
             super().write_vip_interface_file(
                 alias_interface_file_path, primary_interface, vip, ip,
                 broadcast, netmask, gateway, mtu, vrrp_ip, vrrp_version,
@@ -431,7 +443,7 @@ class RH(BaseOS):
         routes_interface_file_path = (
             self.get_static_routes_interface_file(primary_interface,
                                                   ip.version))
-        template_routes = j2_env.get_template(self.ROUTE_ETH_X_CONF)
+        template_routes = _get_template(self.ROUTE_ETH_X_CONF)
 
         self.write_static_routes_interface_file(
             routes_interface_file_path, primary_interface,
@@ -443,7 +455,7 @@ class RH(BaseOS):
             route_rules_interface_file_path = (
                 self.get_route_rules_interface_file(primary_interface,
                                                     ip.version))
-            template_rules = j2_env.get_template(self.RULE_ETH_X_CONF)
+            template_rules = _get_template(self.RULE_ETH_X_CONF)
 
             self.write_static_routes_interface_file(
                 route_rules_interface_file_path, primary_interface,
@@ -485,7 +497,7 @@ class RH(BaseOS):
             interface_file_path = self.get_network_interface_file(
                 netns_interface)
         if not template_port:
-            template_port = j2_env.get_template(self.ETH_X_PORT_CONF)
+            template_port = _get_template(self.ETH_X_PORT_CONF)
         super().write_port_interface_file(
             netns_interface, fixed_ips, mtu, interface_file_path,
             template_port)
@@ -503,7 +515,7 @@ class RH(BaseOS):
 
             routes_interface_file_path = (
                 self.get_static_routes_interface_file(netns_interface, 4))
-            template_routes = j2_env.get_template(self.ROUTE_ETH_X_CONF)
+            template_routes = _get_template(self.ROUTE_ETH_X_CONF)
 
             self.write_static_routes_interface_file(
                 routes_interface_file_path, netns_interface,
@@ -511,7 +523,7 @@ class RH(BaseOS):
 
             routes_interface_file_path_ipv6 = (
                 self.get_static_routes_interface_file(netns_interface, 6))
-            template_routes = j2_env.get_template(self.ROUTE_ETH_X_CONF)
+            template_routes = _get_template(self.ROUTE_ETH_X_CONF)
 
             self.write_static_routes_interface_file(
                 routes_interface_file_path_ipv6, netns_interface,
@@ -534,10 +546,10 @@ class RH(BaseOS):
 
     def _write_ifup_ifdown_local_scripts_if_possible(self):
         if self._check_ifup_ifdown_local_scripts_exists():
-            template_ifup_local = j2_env.get_template(
+            template_ifup_local = _get_template(
                 self.ETH_IFUP_LOCAL_SCRIPT)
             self.write_port_interface_if_local_scripts(template_ifup_local)
-            template_ifdown_local = j2_env.get_template(
+            template_ifdown_local = _get_template(
                 self.ETH_IFDOWN_LOCAL_SCRIPT)
             self.write_port_interface_if_local_scripts(template_ifdown_local,
                                                        ifup=False)
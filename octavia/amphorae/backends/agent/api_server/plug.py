@@ -13,6 +13,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import contextlib
 import ipaddress
 import os
 import socket
@@ -39,6 +40,32 @@ LOG = logging.getLogger(__name__)
 class Plug(object):
     def __init__(self, osutils):
         self._osutils = osutils
+        # Names of the interfaces of the default namespace, by lowercased MAC
+        self._mac_if_cache = {}
+        self._ipr = None
+
+    @contextlib.contextmanager
+    def _iproute(self):
+        # The netlink socket of the default namespace is opened on first use,
+        # after the agent has forked, and shared by all of the requests. It
+        # lives as long as the agent worker process, unless an error leaves
+        # it in an unknown state, in which case the next request opens a new
+        # one.
+        if self._ipr is None:
+            self._ipr = pyroute2.IPRoute()
+        try:
+            yield self._ipr
+        except Exception:
+            self._close_iproute()
+            raise
+
+    def _close_iproute(self):
+        ipr, self._ipr = self._ipr, None
+        if ipr is not None:
+            try:
+                ipr.close()
+            except Exception as e:
+                LOG.debug('Failed to close the netlink socket: %s', str(e))
 
     def plug_vip(self, vip, subnet_cidr, gateway,
                  mac_address, mtu=None, vrrp_ip=None, host_routes=None):
@@ -115,26 +142,27 @@ class Plug(object):
         sysctl.wait()
         sysctl.release()
 
-        cmd_list = [['modprobe', 'ip_vs'],
-                    [consts.SYSCTL_CMD, '-w', 'net.ipv4.vs.conntrack=1']]
+        # For lvs function, enable ip_vs kernel module, enable ip_forward
+        # conntrack in amphora network namespace. All of the settings are
+        # written by a single sysctl process.
+        sysctl_cmd = [consts.SYSCTL_CMD, '-w', 'net.ipv4.vs.conntrack=1']
         if ip.version == 4:
-            # For lvs function, enable ip_vs kernel module, enable ip_forward
-            # conntrack in amphora network namespace.
-            cmd_list.append([consts.SYSCTL_CMD, '-w', 'net.ipv4.ip_forward=1'])
+            sysctl_cmd.append('net.ipv4.ip_forward=1')
         elif ip.version == 6:
-            cmd_list.append([consts.SYSCTL_CMD, '-w',
-                             'net.ipv6.conf.all.forwarding=1'])
+            sysctl_cmd.append('net.ipv6.conf.all.forwarding=1')
+        cmd_list = [['modprobe', 'ip_vs'], sysctl_cmd]
         for cmd in cmd_list:
             ns_exec = pyroute2.NSPopen(consts.AMPHORA_NAMESPACE, cmd,
                                        stdout=subprocess.PIPE)
             ns_exec.wait()
             ns_exec.release()
 
-        with pyroute2.IPRoute() as ipr:
-            # Move the interfaces into the namespace
+        # Move the interfaces into the namespace
+        with self._iproute() as ipr:
             idx = ipr.link_lookup(address=mac_address)[0]
             ipr.link('set', index=idx, net_ns_fd=consts.AMPHORA_NAMESPACE,
                      IFLA_IFNAME=primary_interface)
+        self._mac_if_cache.pop(mac_address.lower(), None)
 
         # In an ha amphora, keepalived should bring the VIP interface up
         if (CONF.controller_worker.loadbalancer_topology ==
@@ -200,12 +228,13 @@ class Plug(object):
         # Update the list of interfaces to add to the namespace
         self._update_plugged_interfaces_file(netns_interface, mac_address)
 
-        with pyroute2.IPRoute() as ipr:
-            # Move the interfaces into the namespace
+        # Move the interfaces into the namespace
+        with self._iproute() as ipr:
             idx = ipr.link_lookup(address=mac_address)[0]
             ipr.link('set', index=idx,
                      net_ns_fd=consts.AMPHORA_NAMESPACE,
                      IFLA_IFNAME=netns_interface)
+        self._mac_if_cache.pop(mac_address.lower(), None)
 
         self._osutils._bring_if_down(netns_interface)
         self._osutils._bring_if_up(netns_interface, 'network')
@@ -216,13 +245,18 @@ class Plug(object):
                 interface=netns_interface)), status=202)
 
     def _interface_by_mac(self, mac):
+        mac_key = mac.lower()
+        interface = self._mac_if_cache.get(mac_key)
+        if interface:
+            return interface
         try:
-            with pyroute2.IPRoute() as ipr:
+            with self._iproute() as ipr:
                 idx = ipr.link_lookup(address=mac)[0]
                 addr = ipr.get_links(idx)[0]
-                for attr in addr['attrs']:
-                    if attr[0] == 'IFLA_IFNAME':
-                        return attr[1]
+            for attr in addr['attrs']:
+                if attr[0] == 'IFLA_IFNAME':
+                    self._mac_if_cache[mac_key] = attr[1]
+                    return attr[1]
         except Exception as e:
             LOG.info('Unable to find interface with MAC: %s, rescanning '
                      'and returning 404. Reported error: %s', mac, str(e))
@@ -254,8 +288,4 @@ class Plug(object):
     def _netns_interface_exists(self, mac_address):
         with pyroute2.NetNS(consts.AMPHORA_NAMESPACE,
                             flags=os.O_CREAT) as netns:
-            for link in netns.get_links():
-                for attr in link['attrs']:
-                    if attr[0] == 'IFLA_ADDRESS' and attr[1] == mac_address:
-                        return True
-        return False
+            return bool(netns.link_lookup(address=mac_address))
@@ -249,6 +249,9 @@ networking_opts = [
     cfg.IntOpt('retry_max', default=10,
                help=_('The maximum interval in seconds between retry '
                       'attempts.')),
+    cfg.IntOpt('retry_total_timeout', default=300, min=1,
+               help=_('The maximum time, in seconds, to keep retrying the '
+                      'creation of a port with the networking service.')),
     cfg.IntOpt('port_detach_timeout', default=300,
                help=_('Seconds to wait for a port to detach from an '
                       'amphora.')),
@@ -274,6 +277,15 @@ networking_opts = [
                        "this True may allow users to access resources on "
                        "subnets they do not normally have access to via "
                        "neutron RBAC policies.")),
+    cfg.IntOpt('max_concurrent_requests', default=10, min=1,
+               help=_('The maximum number of requests a single controller '
+                      'task will send to the networking service in '
+                      'parallel.')),
+    cfg.IntOpt('object_cache_ttl', default=30, min=0,
+               help=_('Number of seconds the networks, subnets and VIP '
+                      'security group IDs retrieved from the networking '
+                      'service are cached for. Set to 0 to disable the '
+                      'cache.')),
 ]
 
 health_manager_opts = [
@@ -17,7 +17,6 @@ import datetime
 
 from oslo_config import cfg
 from oslo_log import log as logging
-from sqlalchemy.orm import exc as sqlalchemy_exceptions
 
 from octavia.common import constants
 from octavia.controller.worker.v1 import controller_worker as cw1
@@ -41,24 +40,27 @@ class DatabaseCleanup(object):
             seconds=CONF.house_keeping.amphora_expiry_age)
 
         session = db_api.get_session()
-        amp_ids = self.amp_repo.get_all_deleted_expiring(session,
-                                                         exp_age=exp_age)
-
-        for amp_id in amp_ids:
-            # If we're here, we already think the amp is expiring according to
-            # the amphora table. Now check it is expired in the health table.
-            # In this way, we ensure that amps aren't deleted unless they are
-            # both expired AND no longer receiving zombie heartbeats.
-            if self.amp_health_repo.check_amphora_health_expired(
-                    session, amp_id, exp_age):
-                LOG.debug('Attempting to purge db record for Amphora ID: %s',
-                          amp_id)
-                self.amp_repo.delete(session, id=amp_id)
-                try:
-                    self.amp_health_repo.delete(session, amphora_id=amp_id)
-                except sqlalchemy_exceptions.NoResultFound:
-                    pass  # Best effort delete, this record might not exist
-                LOG.info('Purged db record for Amphora ID: %s', amp_id)
+        for amp_ids in self.amp_repo.get_all_deleted_expiring_paginated(
+                session, exp_age=exp_age):
+            self._delete_expired_amphorae(session, amp_ids, exp_age)
+
+    def _delete_expired_amphorae(self, session, amp_ids, exp_age):
+        # If we're here, we already think the amps are expiring according to
+        # the amphora table. Now check they are expired in the health table.
+        # In this way, we ensure that amps aren't deleted unless they are
+        # both expired AND no longer receiving zombie heartbeats.
+        expired_amp_ids = sorted(
+            self.amp_health_repo.check_amphora_health_expired_batch(
+                session, amp_ids, exp_age))
+        if not expired_amp_ids:
+            return
+        LOG.debug('Attempting to purge db records for Amphora IDs: %s',
+                  ', '.join(expired_amp_ids))
+        self.amp_repo.delete_batch(session, ids=expired_amp_ids)
+        # Amphorae without a health record are skipped by the delete.
+        self.amp_health_repo.delete_batch(session, ids=expired_amp_ids)
+        LOG.info('Purged db records for Amphora IDs: %s',
+                 ', '.join(expired_amp_ids))
 
     def cleanup_load_balancers(self):
         """Checks the DB for old load balancers and triggers their removal."""
@@ -66,13 +68,12 @@ class DatabaseCleanup(object):
             seconds=CONF.house_keeping.load_balancer_expiry_age)
 
         session = db_api.get_session()
-        lb_ids = self.lb_repo.get_all_deleted_expiring(session,
-                                                       exp_age=exp_age)
-
-        for lb_id in lb_ids:
-            LOG.info('Attempting to delete load balancer id : %s', lb_id)
-            self.lb_repo.delete(session, id=lb_id)
-            LOG.info('Deleted load balancer id : %s', lb_id)
+        for lb_ids in self.lb_repo.get_all_deleted_expiring_paginated(
+                session, exp_age=exp_age):
+            LOG.info('Attempting to delete load balancer ids : %s',
+                     ', '.join(lb_ids))
+            self.lb_repo.delete_batch(session, ids=lb_ids)
+            LOG.info('Deleted load balancer ids : %s', ', '.join(lb_ids))
 
 
 class CertRotation(object):
@@ -91,11 +92,14 @@ class CertRotation(object):
             session = db_api.get_session()
             rotation_count = 0
             while True:
-                amp = amp_repo.get_cert_expiring_amphora(session)
-                if not amp:
+                # Retrieve enough amphorae to keep all of the threads busy
+                amps = amp_repo.get_cert_expiring_amphorae(
+                    session, limit=self.threads)
+                if not amps:
                     break
-                rotation_count += 1
-                LOG.debug("Cert expired amphora's id is: %s", amp.id)
-                executor.submit(self.cw.amphora_cert_rotation, amp.id)
+                for amp in amps:
+                    rotation_count += 1
+                    LOG.debug("Cert expired amphora's id is: %s", amp.id)
+                    executor.submit(self.cw.amphora_cert_rotation, amp.id)
             if rotation_count > 0:
                 LOG.info("Rotated certificates for %s amphora", rotation_count)
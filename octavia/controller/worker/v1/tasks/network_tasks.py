@@ -59,10 +59,10 @@ class CalculateAmphoraDelta(BaseNetworkTask):
 
         if vrrp_port is None:
             vrrp_port = self.network_driver.get_port(amphora.vrrp_port_id)
-        if availability_zone:
-            management_nets = (
-                [availability_zone.get(constants.MANAGEMENT_NETWORK)] or
-                CONF.controller_worker.amp_boot_network_list)
+        management_net = (availability_zone.get(constants.MANAGEMENT_NETWORK)
+                          if availability_zone else None)
+        if management_net:
+            management_nets = [management_net]
         else:
             management_nets = CONF.controller_worker.amp_boot_network_list
         desired_network_ids = {vrrp_port.network_id}.union(management_nets)
@@ -724,7 +724,7 @@ class DeletePort(BaseNetworkTask):
                 # Let's at least attempt to disable it so if the instance
                 # comes back from the dead it doesn't conflict with anything.
                 try:
-                    self.network_driver.admin_down_port(port_id)
+                    self.network_driver.set_port_admin_state_up(port_id, False)
                     LOG.info('Successfully disabled (admin down) network port '
                              '%s that failed to delete.', port_id)
                 except Exception:
@@ -12,8 +12,11 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 #
+from concurrent import futures
+import threading
 import time
 
+import cachetools
 from oslo_config import cfg
 from oslo_log import log as logging
 from oslo_utils import excutils
@@ -33,71 +36,140 @@ from octavia.network import data_models as n_data_models
 LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
 
+# Initial delay, in seconds, between the port status checks of AdminDownPort
+ADMIN_DOWN_PORT_FIRST_POLL_DELAY = 0.1
+# Maximum number of VIP security group IDs cached by GetVIPSecurityGroupID
+SG_ID_CACHE_SIZE = 4096
+
 
 class BaseNetworkTask(task.Task):
     """Base task to load drivers common to the tasks."""
 
+    # The network driver is loaded once and shared by all of the network
+    # tasks of the process.
+    _network_driver = None
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._network_driver = None
         self.task_utils = task_utils.TaskUtils()
         self.loadbalancer_repo = repo.LoadBalancerRepository()
         self.amphora_repo = repo.AmphoraRepository()
 
     @property
     def network_driver(self):
-        if self._network_driver is None:
-            self._network_driver = utils.get_network_driver()
-        return self._network_driver
+        if BaseNetworkTask._network_driver is None:
+            BaseNetworkTask._network_driver = utils.get_network_driver()
+        return BaseNetworkTask._network_driver
+
+    def _fill_port_networks_and_subnets(self, ports):
+        """Attach the network and subnet objects to a list of ports.
+
+        The networks and subnets are retrieved with one bulk request each,
+        instead of one request per port and per fixed IP.
+        """
+        network_ids = {port.network_id for port in ports}
+        subnet_ids = {fixed_ip.subnet_id
+                      for port in ports for fixed_ip in port.fixed_ips}
+        networks = {network.id: network for network in
+                    self.network_driver.get_networks(network_ids)}
+        subnets = {subnet.id: subnet for subnet in
+                   self.network_driver.get_subnets(subnet_ids)}
+        for port in ports:
+            port.network = networks[port.network_id]
+            for fixed_ip in port.fixed_ips:
+                fixed_ip.subnet = subnets[fixed_ip.subnet_id]
+
+    @staticmethod
+    def _concurrent_map(func, items):
+        """Call func on each of the items concurrently.
+
+        All of the calls are completed before the first exception raised by
+        any of them, if any, is re-raised.
+
+        :returns: list of the results, in the order of the items
+        """
+        items = list(items)
+        if len(items) < 2:
+            return [func(item) for item in items]
+        with futures.ThreadPoolExecutor(
+                max_workers=min(len(items),
+                                CONF.networking.max_concurrent_requests)
+        ) as executor:
+            results = [executor.submit(func, item) for item in items]
+        return [result.result() for result in results]
 
 
 class CalculateAmphoraDelta(BaseNetworkTask):
 
     default_provides = constants.DELTA
 
+    def _get_pool_network_ids(self, db_lb):
+        """Resolve the networks of the load balancer members.
+
+        All of the member subnets are resolved with a single request.
+        """
+        member_subnet_ids = {member.subnet_id
+                             for pool in db_lb.pools
+                             for member in pool.members
+                             if member.subnet_id}
+        if not member_subnet_ids:
+            return set()
+        return {subnet.network_id for subnet in
+                self.network_driver.get_subnets(member_subnet_ids)}
+
     def execute(self, loadbalancer, amphora, availability_zone,
-                vrrp_port=None):
+                vrrp_port=None, pool_network_ids=None, port_cache=None):
+        """Compute the NICs to plug and unplug on an amphora.
+
+        :param pool_network_ids: optional set of the member network ids of
+                                 the load balancer, looked up if not provided
+        :param port_cache: optional dict of port id to port, shared between
+                           calls to avoid looking up the same ports again
+        """
         LOG.debug("Calculating network delta for amphora id: %s",
                   amphora.get(constants.ID))
 
+        if port_cache is None:
+            port_cache = {}
+
         if vrrp_port is None:
-            vrrp_port = self.network_driver.get_port(
-                amphora[constants.VRRP_PORT_ID])
-            vrrp_port_network_id = vrrp_port.network_id
+            vrrp_port_id = amphora[constants.VRRP_PORT_ID]
+            if vrrp_port_id not in port_cache:
+                port_cache[vrrp_port_id] = self.network_driver.get_port(
+                    vrrp_port_id)
+            vrrp_port_network_id = port_cache[vrrp_port_id].network_id
         else:
             vrrp_port_network_id = vrrp_port[constants.NETWORK_ID]
 
         # Figure out what networks we want
         # seed with lb network(s)
-        if availability_zone:
-            management_nets = (
-                [availability_zone.get(constants.MANAGEMENT_NETWORK)] or
-                CONF.controller_worker.amp_boot_network_list)
+        management_net = (availability_zone.get(constants.MANAGEMENT_NETWORK)
+                          if availability_zone else None)
+        if management_net:
+            management_nets = [management_net]
         else:
             management_nets = CONF.controller_worker.amp_boot_network_list
         desired_network_ids = {vrrp_port_network_id}.union(management_nets)
-        db_lb = self.loadbalancer_repo.get(
-            db_apis.get_session(), id=loadbalancer[constants.LOADBALANCER_ID])
-        for pool in db_lb.pools:
-            member_networks = [
-                self.network_driver.get_subnet(member.subnet_id).network_id
-                for member in pool.members
-                if member.subnet_id
-            ]
-            desired_network_ids.update(member_networks)
+        if pool_network_ids is None:
+            db_lb = self.loadbalancer_repo.get(
+                db_apis.get_session(),
+                id=loadbalancer[constants.LOADBALANCER_ID])
+            pool_network_ids = self._get_pool_network_ids(db_lb)
+        desired_network_ids.update(pool_network_ids)
 
         nics = self.network_driver.get_plugged_networks(
             amphora[constants.COMPUTE_ID])
-        # assume we don't have two nics in the same network
-        actual_network_nics = dict((nic.network_id, nic) for nic in nics)
-
-        del_ids = set(actual_network_nics) - desired_network_ids
-        delete_nics = list(
-            n_data_models.Interface(network_id=net_id) for net_id in del_ids)
+        actual_network_ids = {nic.network_id for nic in nics}
 
-        add_ids = desired_network_ids - set(actual_network_nics)
-        add_nics = list(n_data_models.Interface(
-            network_id=net_id) for net_id in add_ids)
+        if actual_network_ids == desired_network_ids:
+            delete_nics = add_nics = []
+        else:
+            delete_nics = [
+                n_data_models.Interface(network_id=net_id)
+                for net_id in actual_network_ids - desired_network_ids]
+            add_nics = [
+                n_data_models.Interface(network_id=net_id)
+                for net_id in desired_network_ids - actual_network_ids]
         delta = n_data_models.Delta(
             amphora_id=amphora[constants.ID],
             compute_id=amphora[constants.COMPUTE_ID],
@@ -130,15 +202,25 @@ class CalculateDelta(BaseNetworkTask):
 
         calculate_amp = CalculateAmphoraDelta()
         deltas = {}
+        port_cache = {}
         db_lb = self.loadbalancer_repo.get(
             db_apis.get_session(), id=loadbalancer[constants.LOADBALANCER_ID])
-        for amphora in filter(
-            lambda amp: amp.status == constants.AMPHORA_ALLOCATED,
-                db_lb.amphorae):
-
-            delta = calculate_amp.execute(loadbalancer, amphora.to_dict(),
-                                          availability_zone)
-            deltas[amphora.id] = delta
+        # The amphorae share the load balancer members, so only resolve
+        # their networks once.
+        pool_network_ids = calculate_amp._get_pool_network_ids(db_lb)
+        # Each amphora delta is dominated by networking service round trips,
+        # so calculate them in parallel.
+        with futures.ThreadPoolExecutor(
+                max_workers=CONF.networking.max_concurrent_requests) as ex:
+            delta_futures = {
+                amphora.id: ex.submit(calculate_amp.execute, loadbalancer,
+                                      amphora.to_dict(), availability_zone,
+                                      pool_network_ids=pool_network_ids,
+                                      port_cache=port_cache)
+                for amphora in db_lb.amphorae
+                if amphora.status == constants.AMPHORA_ALLOCATED}
+        for amp_id, delta_future in delta_futures.items():
+            deltas[amp_id] = delta_future.result()
         return deltas
 
 
@@ -179,9 +261,10 @@ class PlugNetworks(BaseNetworkTask):
             return
 
         # add nics
-        for nic in delta[constants.ADD_NICS]:
-            self.network_driver.plug_network(amphora[constants.COMPUTE_ID],
-                                             nic[constants.NETWORK_ID])
+        self._concurrent_map(
+            lambda nic: self.network_driver.plug_network(
+                amphora[constants.COMPUTE_ID], nic[constants.NETWORK_ID]),
+            delta[constants.ADD_NICS])
 
     def revert(self, amphora, delta, *args, **kwargs):
         """Handle a failed network plug by removing all nics added."""
@@ -191,7 +274,7 @@ class PlugNetworks(BaseNetworkTask):
         if not delta:
             return
 
-        for nic in delta[constants.ADD_NICS]:
+        def _unplug_nic(nic):
             try:
                 self.network_driver.unplug_network(
                     amphora[constants.COMPUTE_ID],
@@ -199,6 +282,8 @@ class PlugNetworks(BaseNetworkTask):
             except base.NetworkNotFound:
                 pass
 
+        self._concurrent_map(_unplug_nic, delta[constants.ADD_NICS])
+
 
 class UnPlugNetworks(BaseNetworkTask):
     """Task to unplug the networks
@@ -216,7 +301,7 @@ class UnPlugNetworks(BaseNetworkTask):
                       amphora[constants.ID])
             return
 
-        for nic in delta[constants.DELETE_NICS]:
+        def _unplug_nic(nic):
             try:
                 self.network_driver.unplug_network(
                     amphora[constants.COMPUTE_ID], nic[constants.NETWORK_ID])
@@ -226,6 +311,8 @@ class UnPlugNetworks(BaseNetworkTask):
                 LOG.exception("Unable to unplug network")
                 # TODO(xgerman) follow up if that makes sense
 
+        self._concurrent_map(_unplug_nic, delta[constants.DELETE_NICS])
+
 
 class GetMemberPorts(BaseNetworkTask):
 
@@ -234,19 +321,18 @@ class GetMemberPorts(BaseNetworkTask):
         member_ports = []
         interfaces = self.network_driver.get_plugged_networks(
             amphora[constants.COMPUTE_ID])
-        for interface in interfaces:
-            port = self.network_driver.get_port(interface.port_id)
+        ports = self.network_driver.get_ports(
+            [interface.port_id for interface in interfaces])
+        mgmt_ips = {amphora['lb_network_ip']}
+        for port in ports:
             if vip_port.network_id == port.network_id:
                 continue
-            port.network = self.network_driver.get_network(port.network_id)
-            for fixed_ip in port.fixed_ips:
-                if amphora['lb_network_ip'] == fixed_ip.ip_address:
-                    break
-                fixed_ip.subnet = self.network_driver.get_subnet(
-                    fixed_ip.subnet_id)
             # Only add the port to the list if the IP wasn't the mgmt IP
-            else:
-                member_ports.append(port)
+            if any(fixed_ip.ip_address in mgmt_ips
+                   for fixed_ip in port.fixed_ips):
+                continue
+            member_ports.append(port)
+        self._fill_port_networks_and_subnets(member_ports)
         return member_ports
 
 
@@ -256,20 +342,18 @@ class HandleNetworkDelta(BaseNetworkTask):
     Plug or unplug networks based on delta
     """
 
-    def execute(self, amphora, delta):
-        """Handle network plugging based off deltas."""
-        added_ports = {}
-        added_ports[amphora[constants.ID]] = []
+    def _handle_delta(self, delta):
+        """Plug and unplug the networks of one delta.
+
+        :returns: list of the ports added, as dicts
+        """
+        ports = []
         for nic in delta[constants.ADD_NICS]:
             interface = self.network_driver.plug_network(
                 delta[constants.COMPUTE_ID], nic[constants.NETWORK_ID])
-            port = self.network_driver.get_port(interface.port_id)
-            port.network = self.network_driver.get_network(port.network_id)
-            for fixed_ip in port.fixed_ips:
-                fixed_ip.subnet = self.network_driver.get_subnet(
-                    fixed_ip.subnet_id)
-            added_ports[amphora[constants.ID]].append(port.to_dict(
-                recurse=True))
+            ports.append(self.network_driver.get_port(interface.port_id))
+        self._fill_port_networks_and_subnets(ports)
+        added_ports = [port.to_dict(recurse=True) for port in ports]
         for nic in delta[constants.DELETE_NICS]:
             try:
                 self.network_driver.unplug_network(
@@ -280,6 +364,10 @@ class HandleNetworkDelta(BaseNetworkTask):
                 LOG.exception("Unable to unplug network")
         return added_ports
 
+    def execute(self, amphora, delta):
+        """Handle network plugging based off deltas."""
+        return {amphora[constants.ID]: self._handle_delta(delta)}
+
     def revert(self, result, amphora, delta, *args, **kwargs):
         """Handle a network plug or unplug failures."""
 
@@ -300,7 +388,7 @@ class HandleNetworkDelta(BaseNetworkTask):
                 pass
 
 
-class HandleNetworkDeltas(BaseNetworkTask):
+class HandleNetworkDeltas(HandleNetworkDelta):
     """Task to plug and unplug networks
 
     Loop through the deltas and plug or unplug
@@ -309,29 +397,14 @@ class HandleNetworkDeltas(BaseNetworkTask):
 
     def execute(self, deltas):
         """Handle network plugging based off deltas."""
-        added_ports = {}
-        for amp_id, delta in deltas.items():
-            added_ports[amp_id] = []
-            for nic in delta[constants.ADD_NICS]:
-                interface = self.network_driver.plug_network(
-                    delta[constants.COMPUTE_ID], nic[constants.NETWORK_ID])
-                port = self.network_driver.get_port(interface.port_id)
-                port.network = self.network_driver.get_network(port.network_id)
-                for fixed_ip in port.fixed_ips:
-                    fixed_ip.subnet = self.network_driver.get_subnet(
-                        fixed_ip.subnet_id)
-                added_ports[amp_id].append(port.to_dict(recurse=True))
-            for nic in delta[constants.DELETE_NICS]:
-                try:
-                    self.network_driver.unplug_network(
-                        delta[constants.COMPUTE_ID],
-                        nic[constants.NETWORK_ID])
-                except base.NetworkNotFound:
-                    LOG.debug("Network %d not found ",
-                              nic[constants.NETWORK_ID])
-                except Exception:
-                    LOG.exception("Unable to unplug network")
-        return added_ports
+        # Plug and unplug the networks of the amphorae in parallel
+        with futures.ThreadPoolExecutor(
+                max_workers=CONF.networking.max_concurrent_requests) as ex:
+            port_futures = {
+                amp_id: ex.submit(self._handle_delta, delta)
+                for amp_id, delta in deltas.items()}
+        return {amp_id: port_future.result()
+                for amp_id, port_future in port_futures.items()}
 
     def revert(self, result, deltas, *args, **kwargs):
         """Handle a network plug or unplug failures."""
@@ -381,11 +454,10 @@ class PlugVIP(BaseNetworkTask):
             id=loadbalancer[constants.LOADBALANCER_ID])
         try:
             # Make sure we have the current port IDs for cleanup
+            amphorae = {amphora.id: amphora for amphora in db_lb.amphorae}
             for amp_data in result:
-                for amphora in filter(
-                        # pylint: disable=cell-var-from-loop
-                        lambda amp: amp.id == amp_data['id'],
-                        db_lb.amphorae):
+                amphora = amphorae.get(amp_data['id'])
+                if amphora:
                     amphora.vrrp_port_id = amp_data['vrrp_port_id']
                     amphora.ha_port_id = amp_data['ha_port_id']
 
@@ -405,6 +477,7 @@ class UpdateVIPSecurityGroup(BaseNetworkTask):
         LOG.debug("Setup SG for loadbalancer id: %s", loadbalancer_id)
         db_lb = self.loadbalancer_repo.get(
             db_apis.get_session(), id=loadbalancer_id)
+        GetVIPSecurityGroupID.invalidate(loadbalancer_id)
         return self.network_driver.update_vip_sg(db_lb, db_lb.vip)
 
 
@@ -542,6 +615,7 @@ class DeallocateVIP(BaseNetworkTask):
             db_apis.get_session(), id=loadbalancer[constants.LOADBALANCER_ID])
         vip = db_lb.vip
         vip.load_balancer = db_lb
+        GetVIPSecurityGroupID.invalidate(db_lb.id)
         self.network_driver.deallocate_vip(vip)
 
 
@@ -573,10 +647,10 @@ class GetAmphoraNetworkConfigs(BaseNetworkTask):
 
     def execute(self, loadbalancer, amphora=None):
         LOG.debug("Retrieving vip network details.")
-        db_amp = self.amphora_repo.get(db_apis.get_session(),
-                                       id=amphora.get(constants.ID))
+        session = db_apis.get_session()
+        db_amp = self.amphora_repo.get(session, id=amphora.get(constants.ID))
         db_lb = self.loadbalancer_repo.get(
-            db_apis.get_session(), id=loadbalancer[constants.LOADBALANCER_ID])
+            session, id=loadbalancer[constants.LOADBALANCER_ID])
         db_configs = self.network_driver.get_network_configs(
             db_lb, amphora=db_amp)
         provider_dict = {}
@@ -590,9 +664,9 @@ class GetAmphoraNetworkConfigsByID(BaseNetworkTask):
 
     def execute(self, loadbalancer_id, amphora_id=None):
         LOG.debug("Retrieving vip network details.")
-        loadbalancer = self.loadbalancer_repo.get(db_apis.get_session(),
-                                                  id=loadbalancer_id)
-        amphora = self.amphora_repo.get(db_apis.get_session(), id=amphora_id)
+        session = db_apis.get_session()
+        loadbalancer = self.loadbalancer_repo.get(session, id=loadbalancer_id)
+        amphora = self.amphora_repo.get(session, id=amphora_id)
         db_configs = self.network_driver.get_network_configs(loadbalancer,
                                                              amphora=amphora)
         provider_dict = {}
@@ -636,17 +710,18 @@ class RetrievePortIDsOnAmphoraExceptLBNetwork(BaseNetworkTask):
         interfaces = self.network_driver.get_plugged_networks(
             compute_id=amphora[constants.COMPUTE_ID])
 
-        ports = []
+        seen_port_ids = set()
+        port_ids = []
         for interface_ in interfaces:
-            if interface_.port_id not in ports:
-                port = self.network_driver.get_port(port_id=interface_.port_id)
-                ips = port.fixed_ips
-                lb_network = False
-                for ip in ips:
-                    if ip.ip_address == amphora[constants.LB_NETWORK_IP]:
-                        lb_network = True
-                if not lb_network:
-                    ports.append(port)
+            if interface_.port_id not in seen_port_ids:
+                seen_port_ids.add(interface_.port_id)
+                port_ids.append(interface_.port_id)
+
+        ports = []
+        for port in self.network_driver.get_ports(port_ids):
+            if not any(ip.ip_address == amphora[constants.LB_NETWORK_IP]
+                       for ip in port.fixed_ips):
+                ports.append(port)
 
         return ports
 
@@ -657,13 +732,23 @@ class PlugPorts(BaseNetworkTask):
     def execute(self, amphora, ports):
         db_amp = self.amphora_repo.get(db_apis.get_session(),
                                        id=amphora[constants.ID])
-        for port in ports:
+
+        def _plug_port(port):
             LOG.debug('Plugging port ID: %(port_id)s into compute instance: '
                       '%(compute_id)s.',
                       {constants.PORT_ID: port.id,
                        constants.COMPUTE_ID: amphora[constants.COMPUTE_ID]})
             self.network_driver.plug_port(db_amp, port)
 
+        self._concurrent_map(_plug_port, ports)
+
+
+def _should_skip_qos(qos_policy_id, update_dict):
+    """Whether there is no QoS policy to apply or to remove from the VIP."""
+    vip_dict = update_dict.get(constants.VIP) if update_dict else None
+    return not qos_policy_id and not (
+        vip_dict and constants.QOS_POLICY_ID in vip_dict)
+
 
 class ApplyQos(BaseNetworkTask):
     """Apply Quality of Services to the VIP"""
@@ -679,9 +764,10 @@ class ApplyQos(BaseNetworkTask):
             amps_data = db_lb.amphorae
 
         apply_qos = ApplyQosAmphora()
-        for amp_data in amps_data:
-            apply_qos._apply_qos_on_vrrp_port(loadbalancer, amp_data.to_dict(),
-                                              qos_policy_id)
+        self._concurrent_map(
+            lambda amp_data: apply_qos._apply_qos_on_vrrp_port(
+                loadbalancer, amp_data.to_dict(), qos_policy_id),
+            amps_data)
 
     def execute(self, loadbalancer, amps_data=None, update_dict=None):
         """Apply qos policy on the vrrp ports which are related with vip."""
@@ -690,10 +776,7 @@ class ApplyQos(BaseNetworkTask):
             id=loadbalancer[constants.LOADBALANCER_ID])
 
         qos_policy_id = db_lb.vip.qos_policy_id
-        if not qos_policy_id and (
-            not update_dict or (
-                'vip' not in update_dict or
-                'qos_policy_id' not in update_dict[constants.VIP])):
+        if _should_skip_qos(qos_policy_id, update_dict):
             return
         if update_dict and update_dict.get(constants.VIP):
             vip_dict = update_dict[constants.VIP]
@@ -739,10 +822,7 @@ class ApplyQosAmphora(BaseNetworkTask):
     def execute(self, loadbalancer, amp_data=None, update_dict=None):
         """Apply qos policy on the vrrp ports which are related with vip."""
         qos_policy_id = loadbalancer['vip_qos_policy_id']
-        if not qos_policy_id and (
-            update_dict and (
-                'vip' not in update_dict or
-                'qos_policy_id' not in update_dict[constants.VIP])):
+        if _should_skip_qos(qos_policy_id, update_dict):
             return
         self._apply_qos_on_vrrp_port(loadbalancer, amp_data, qos_policy_id)
 
@@ -767,36 +847,43 @@ class ApplyQosAmphora(BaseNetworkTask):
 class DeletePort(BaseNetworkTask):
     """Task to delete a network port."""
 
+    # Only the number of attempts limits the retries, so the last attempt is
+    # known before it is made. With retry_max and retry_interval, this also
+    # bounds the total time spent retrying.
     @tenacity.retry(retry=tenacity.retry_if_exception_type(),
                     stop=tenacity.stop_after_attempt(
                         CONF.networking.max_retries),
-                    wait=tenacity.wait_exponential(
+                    wait=(tenacity.wait_exponential(
                         multiplier=CONF.networking.retry_backoff,
                         min=CONF.networking.retry_interval,
-                        max=CONF.networking.retry_max), reraise=True)
+                        max=CONF.networking.retry_max) +
+                        tenacity.wait_random(
+                            0, CONF.networking.retry_interval)),
+                    reraise=True)
     def execute(self, port_id, passive_failure=False):
         """Delete the network port."""
         if port_id is None:
             return
-        if self.execute.retry.statistics.get(constants.ATTEMPT_NUMBER, 1) == 1:
+        max_attempts = self.execute.retry.stop.max_attempt_number
+        # Don't use get with a default for 'attempt_number', we need to fail
+        # if that number is missing.
+        attempt = self.execute.retry.statistics[constants.ATTEMPT_NUMBER]
+        if attempt == 1:
             LOG.debug("Deleting network port %s", port_id)
         else:
             LOG.warning('Retrying network port %s delete attempt %s of %s.',
-                        port_id,
-                        self.execute.retry.statistics[
-                            constants.ATTEMPT_NUMBER],
-                        self.execute.retry.stop.max_attempt_number)
-        # Let the Taskflow engine know we are working and alive
-        # Don't use get with a default for 'attempt_number', we need to fail
-        # if that number is missing.
-        self.update_progress(
-            self.execute.retry.statistics[constants.ATTEMPT_NUMBER] /
-            self.execute.retry.stop.max_attempt_number)
+                        port_id, attempt, max_attempts)
+            # Let the Taskflow engine know we are working and alive
+            self.update_progress(attempt / max_attempts)
+        # On the last attempt, have the driver disable the port if it cannot
+        # be deleted so if the instance comes back from the dead it doesn't
+        # conflict with anything.
+        admin_down_on_failure = passive_failure and attempt >= max_attempts
         try:
-            self.network_driver.delete_port(port_id)
+            self.network_driver.delete_port(
+                port_id, admin_down_on_failure=admin_down_on_failure)
         except Exception:
-            if (self.execute.retry.statistics[constants.ATTEMPT_NUMBER] !=
-                    self.execute.retry.stop.max_attempt_number):
+            if attempt < max_attempts:
                 LOG.warning('Network port delete for port id: %s failed. '
                             'Retrying.', port_id)
                 raise
@@ -805,16 +892,6 @@ class DeletePort(BaseNetworkTask):
                               'This resource will be abandoned and should '
                               'manually be cleaned up once the '
                               'network service is functional.', port_id)
-                # Let's at least attempt to disable it so if the instance
-                # comes back from the dead it doesn't conflict with anything.
-                try:
-                    self.network_driver.admin_down_port(port_id)
-                    LOG.info('Successfully disabled (admin down) network port '
-                             '%s that failed to delete.', port_id)
-                except Exception:
-                    LOG.warning('Attempt to disable (admin down) network port '
-                                '%s failed. The network service has failed. '
-                                'Continuing.', port_id)
             else:
                 LOG.exception('Network port delete for port ID: %s failed. '
                               'The network service has failed. '
@@ -826,12 +903,18 @@ class CreateVIPBasePort(BaseNetworkTask):
     """Task to create the VIP base port for an amphora."""
 
     @tenacity.retry(retry=tenacity.retry_if_exception_type(),
-                    stop=tenacity.stop_after_attempt(
-                        CONF.networking.max_retries),
-                    wait=tenacity.wait_exponential(
+                    stop=tenacity.stop_any(
+                        tenacity.stop_after_attempt(
+                            CONF.networking.max_retries),
+                        tenacity.stop_after_delay(
+                            CONF.networking.retry_total_timeout)),
+                    wait=(tenacity.wait_exponential(
                         multiplier=CONF.networking.retry_backoff,
                         min=CONF.networking.retry_interval,
-                        max=CONF.networking.retry_max), reraise=True)
+                        max=CONF.networking.retry_max) +
+                        tenacity.wait_random(
+                            0, CONF.networking.retry_interval)),
+                    reraise=True)
     def execute(self, vip, vip_sg_id, amphora_id):
         port_name = constants.AMP_BASE_PORT_PREFIX + amphora_id
         fixed_ips = [{constants.SUBNET_ID: vip[constants.SUBNET_ID]}]
@@ -866,26 +949,83 @@ class CreateVIPBasePort(BaseNetworkTask):
 class AdminDownPort(BaseNetworkTask):
 
     def execute(self, port_id):
+        try:
+            port = self.network_driver.get_port(port_id)
+        except base.PortNotFound:
+            return
+        if port.status == constants.DOWN and port.admin_state_up is False:
+            LOG.debug('Port %s is already disabled.', port_id)
+            return
         try:
             self.network_driver.set_port_admin_state_up(port_id, False)
         except base.PortNotFound:
             return
-        for i in range(CONF.networking.max_retries):
-            port = self.network_driver.get_port(port_id)
-            if port.status == constants.DOWN:
-                LOG.debug('Disabled port: %s', port_id)
-                return
-            LOG.debug('Port %s is %s instead of DOWN, waiting.',
-                      port_id, port.status)
-            time.sleep(CONF.networking.retry_interval)
-        LOG.error('Port %s failed to go DOWN. Port status is still %s. '
-                  'Ignoring and continuing.', port_id, port.status)
+        self._wait_ports_down([port_id], ports=[port])
+
+    def _wait_ports_down(self, port_ids, ports=None):
+        """Wait for the ports to go DOWN, polling them all in one request.
+
+        :param port_ids: The IDs of the ports to wait for.
+        :param ports: The ports, if they were just retrieved, to use as the
+                      first poll.
+        """
+        waiting = set(port_ids)
+        # Poll with an exponential backoff, capped at retry_interval, so
+        # ports that go down quickly are not waited on for a full interval.
+        timeout = (CONF.networking.max_retries *
+                   CONF.networking.retry_interval)
+        delay = min(ADMIN_DOWN_PORT_FIRST_POLL_DELAY,
+                    CONF.networking.retry_interval)
+        waited = 0
+        while True:
+            if ports is None:
+                try:
+                    ports = self.network_driver.get_ports(waiting)
+                except base.PortNotFound:
+                    # At least one of the ports was deleted, deleted ports
+                    # are not up. Look up the others one by one.
+                    ports = []
+                    if len(waiting) > 1:
+                        for port_id in waiting:
+                            try:
+                                ports.append(
+                                    self.network_driver.get_port(port_id))
+                            except base.PortNotFound:
+                                pass
+            statuses = {port.id: port.status for port in ports
+                        if port.id in waiting}
+            ports = None
+            # Only build the debug message arguments when they are logged.
+            if LOG.isEnabledFor(logging.DEBUG):
+                for port_id in waiting - statuses.keys():
+                    LOG.debug('Port %s no longer exists.', port_id)
+            waiting = set()
+            for port_id, status in statuses.items():
+                if status == constants.DOWN:
+                    LOG.debug('Disabled port: %s', port_id)
+                else:
+                    waiting.add(port_id)
+            if not waiting or waited >= timeout:
+                break
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug('Ports %s are not DOWN yet, waiting.',
+                          ', '.join(sorted(waiting)))
+            wait = min(delay, timeout - waited)
+            time.sleep(wait)
+            waited += wait
+            delay = min(delay * 2, CONF.networking.retry_interval)
+        for port_id in sorted(waiting):
+            LOG.error('Port %s failed to go DOWN. Port status is still %s. '
+                      'Ignoring and continuing.', port_id, statuses[port_id])
 
     def revert(self, result, port_id, *args, **kwargs):
         if isinstance(result, failure.Failure):
             return
         try:
             self.network_driver.set_port_admin_state_up(port_id, True)
+        except base.PortNotFound:
+            LOG.debug('Port %s no longer exists, not bringing it admin up on '
+                      'revert.', port_id)
         except Exception as e:
             LOG.error('Failed to bring port %s admin up on revert due to: %s.',
                       port_id, str(e))
@@ -893,11 +1033,41 @@ class AdminDownPort(BaseNetworkTask):
 
 class GetVIPSecurityGroupID(BaseNetworkTask):
 
+    # The VIP security group IDs found, keyed by load balancer ID. Shared by
+    # all of the tasks of the process, and created on first use so it gets
+    # the configured object_cache_ttl.
+    _sg_id_cache = None
+    _sg_id_cache_lock = threading.Lock()
+
+    @classmethod
+    def _get_sg_id_cache(cls):
+        """Return the VIP security group ID cache, with the lock held."""
+        if cls._sg_id_cache is None:
+            cls._sg_id_cache = cachetools.TTLCache(
+                maxsize=SG_ID_CACHE_SIZE,
+                ttl=CONF.networking.object_cache_ttl, timer=time.monotonic)
+        return cls._sg_id_cache
+
+    @classmethod
+    def invalidate(cls, loadbalancer_id):
+        """Drop the cached VIP security group ID of a load balancer."""
+        with cls._sg_id_cache_lock:
+            cls._get_sg_id_cache().pop(loadbalancer_id, None)
+
     def execute(self, loadbalancer_id):
+        if CONF.networking.object_cache_ttl:
+            with self._sg_id_cache_lock:
+                sg_id = self._get_sg_id_cache().get(loadbalancer_id)
+            if sg_id:
+                return sg_id
         sg_name = utils.get_vip_security_group_name(loadbalancer_id)
         try:
             security_group = self.network_driver.get_security_group(sg_name)
             if security_group:
+                if CONF.networking.object_cache_ttl:
+                    with self._sg_id_cache_lock:
+                        self._get_sg_id_cache()[loadbalancer_id] = (
+                            security_group.id)
                 return security_group.id
         except base.SecurityGroupNotFound:
             with excutils.save_and_reraise_exception() as ctxt:
@@ -42,6 +42,16 @@ CONF = cfg.CONF
 
 LOG = logging.getLogger(__name__)
 
+# Maximum number of IDs in the IN clause of a single batched query, to stay
+# under the bound parameter limits of the database backends.
+MAX_IDS_PER_QUERY = 500
+
+
+def _id_chunks(ids):
+    ids = list(ids)
+    for i in range(0, len(ids), MAX_IDS_PER_QUERY):
+        yield ids[i:i + MAX_IDS_PER_QUERY]
+
 
 class BaseRepository(object):
     model_class = None
@@ -189,21 +199,49 @@ class BaseRepository(object):
                         it is considered expired
         :returns: A list of resource IDs
                 """
+        return [resource_id
+                for page in self.get_all_deleted_expiring_paginated(
+                    session, exp_age)
+                for resource_id in page]
+
+    def get_all_deleted_expiring_paginated(self, session, exp_age,
+                                           page_size=1000):
+        """Get previously deleted resources that are now expiring, by pages.
+
+        The pages are retrieved one at a time, ordered by ID, with a keyset
+        query starting after the last ID of the previous page, so resources
+        of the pages already returned may be deleted between two pages.
+
+        :param session: A Sql Alchemy database session.
+        :param exp_age: A standard datetime delta which is used to see for how
+                        long can a resource live without updates before
+                        it is considered expired
+        :param page_size: The maximum number of IDs in a page
+        :returns: A generator of lists of resource IDs
+        """
 
         expiry_time = datetime.datetime.utcnow() - exp_age
 
-        query = session.query(self.model_class).filter(
+        query = session.query(self.model_class.id).filter(
             self.model_class.updated_at < expiry_time)
         if hasattr(self.model_class, 'status'):
             query = query.filter_by(status=consts.DELETED)
         else:
             query = query.filter_by(provisioning_status=consts.DELETED)
-        # Do not load any relationship
-        query = query.options(noload('*'))
-        model_list = query.all()
-
-        id_list = [model.id for model in model_list]
-        return id_list
+        query = query.order_by(self.model_class.id)
+
+        last_id = None
+        while True:
+            page_query = query
+            if last_id is not None:
+                page_query = page_query.filter(self.model_class.id > last_id)
+            id_list = [resource_id for resource_id,
+                       in page_query.limit(page_size)]
+            if id_list:
+                yield id_list
+            if len(id_list) < page_size:
+                return
+            last_id = id_list[-1]
 
 
 class Repositories(object):
@@ -831,6 +869,20 @@ class Repositories(object):
 class LoadBalancerRepository(BaseRepository):
     model_class = models.LoadBalancer
 
+    def delete_batch(self, session, ids=None):
+        """Batch deletes load balancers by id.
+
+        The load balancers are retrieved with one query per chunk of ids and
+        deleted in a single transaction, so that their children are still
+        deleted by the ORM cascades.
+        """
+        with session.begin(subtransactions=True):
+            for chunk in _id_chunks(ids or []):
+                for lb in session.query(self.model_class).filter(
+                        self.model_class.id.in_(chunk)):
+                    session.delete(lb)
+            session.flush()
+
     def get_all_API_list(self, session, pagination_helper=None, **filters):
         """Get a list of load balancers for the API list call.
 
@@ -1287,6 +1339,14 @@ class ListenerStatisticsRepository(BaseRepository):
 class AmphoraRepository(BaseRepository):
     model_class = models.Amphora
 
+    def delete_batch(self, session, ids=None):
+        """Batch deletes amphorae by id, with one query per chunk of ids."""
+        with session.begin(subtransactions=True):
+            for chunk in _id_chunks(ids or []):
+                session.query(self.model_class).filter(
+                    self.model_class.id.in_(chunk)).delete(
+                        synchronize_session=False)
+
     def get_all_API_list(self, session, pagination_helper=None, **filters):
         """Get a list of amphorae for the API list call.
 
@@ -1391,6 +1451,18 @@ class AmphoraRepository(BaseRepository):
         :param session: A Sql Alchemy database session.
         :returns: one amphora with expiring certificate
         """
+        amps = self.get_cert_expiring_amphorae(session, limit=1)
+        return amps[0] if amps else None
+
+    def get_cert_expiring_amphorae(self, session, limit):
+        """Retrieves amphorae whose certs are close to expiring.
+
+        The amphorae returned are marked as cert busy.
+
+        :param session: A Sql Alchemy database session.
+        :param limit: The maximum number of amphorae to retrieve.
+        :returns: [octavia.common.data_model]
+        """
         # get amphorae with certs that will expire within the
         # configured buffer period, so we can rotate their certs ahead of time
         expired_seconds = CONF.house_keeping.cert_expiry_buffer
@@ -1398,19 +1470,17 @@ class AmphoraRepository(BaseRepository):
             seconds=expired_seconds)
 
         with session.begin(subtransactions=True):
-            amp = session.query(self.model_class).with_for_update().filter(
+            amps = session.query(self.model_class).with_for_update().filter(
                 self.model_class.status.notin_(
                     [consts.DELETED, consts.PENDING_DELETE]),
                 self.model_class.cert_busy == false(),
                 self.model_class.cert_expiration < expired_date
-            ).first()
+            ).limit(limit).all()
 
-            if amp is None:
-                return None
+            for amp in amps:
+                amp.cert_busy = True
 
-            amp.cert_busy = True
-
-        return amp.to_data_model()
+        return [amp.to_data_model() for amp in amps]
 
     def get_lb_for_health_update(self, session, amphora_id):
         """This method is for the health manager status update process.
@@ -1596,6 +1666,17 @@ class SNIRepository(BaseRepository):
 class AmphoraHealthRepository(BaseRepository):
     model_class = models.AmphoraHealth
 
+    def delete_batch(self, session, ids=None):
+        """Batch deletes amphora health records by amphora id.
+
+        Amphorae without a health record are ignored.
+        """
+        with session.begin(subtransactions=True):
+            for chunk in _id_chunks(ids or []):
+                session.query(self.model_class).filter(
+                    self.model_class.amphora_id.in_(chunk)).delete(
+                        synchronize_session=False)
+
     def update(self, session, amphora_id, **model_kwargs):
         """Updates a healthmanager entity in the database by amphora_id."""
         with session.begin(subtransactions=True):
@@ -1650,6 +1731,37 @@ class AmphoraHealthRepository(BaseRepository):
         # In this case, the amphora is expired.
         return amphora_model is None
 
+    def check_amphora_health_expired_batch(self, session, amphora_ids,
+                                           exp_age=None):
+        """check which amphorae are expired in the amphora_health table
+
+        :param session: A Sql Alchemy database session.
+        :param amphora_ids: ids of amphora objects
+        :param exp_age: A standard datetime delta which is used to see for how
+                        long can an amphora live without updates before it is
+                        considered expired (default:
+                        CONF.house_keeping.amphora_expiry_age)
+        :returns: set of the ids of the expired amphorae
+        """
+        if not exp_age:
+            exp_age = datetime.timedelta(
+                seconds=CONF.house_keeping.amphora_expiry_age)
+
+        expiry_time = datetime.datetime.utcnow() - exp_age
+
+        expired_ids = set(amphora_ids)
+        for chunk in _id_chunks(expired_ids):
+            # Same rules as check_amphora_health_expired, an amphora with a
+            # recent enough entry in the table is unexpired.
+            unexpired = (
+                session.query(models.AmphoraHealth.amphora_id)
+                .filter(models.AmphoraHealth.amphora_id.in_(chunk))
+                .filter(models.AmphoraHealth.last_update > expiry_time)
+            )
+            expired_ids.difference_update(
+                amphora_id for amphora_id, in unexpired)
+        return expired_ids
+
     def get_stale_amphora(self, session):
         """Retrieves a stale amphora from the health manager database.
 
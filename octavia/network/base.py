@@ -133,10 +133,12 @@ class AbstractNetworkDriver(object, metaclass=abc.ABCMeta):
         """
 
     @abc.abstractmethod
-    def delete_port(self, port_id):
+    def delete_port(self, port_id, admin_down_on_failure=False):
         """Delete a network port.
 
         :param port_id: The port ID to delete.
+        :param admin_down_on_failure: Attempt to disable (admin down) the
+                                      port if it cannot be deleted.
         :returns: None
         """
 
@@ -216,6 +218,17 @@ class AbstractNetworkDriver(object, metaclass=abc.ABCMeta):
         :return: None
         """
 
+    def invalidate_cache(self, resource_id):
+        """Hook for the driver to drop a cached network resource.
+
+        This method will be called when a network resource may have been
+        modified. It is an optional method to be implemented by drivers
+        that cache the resources they retrieve.
+
+        :param resource_id: id of the network or subnet to drop
+        :return: None
+        """
+
     @abc.abstractmethod
     def get_network(self, network_id, context=None):
         """Retrieves network from network id.
@@ -226,6 +239,16 @@ class AbstractNetworkDriver(object, metaclass=abc.ABCMeta):
         :raises: NetworkException, NetworkNotFound
         """
 
+    @abc.abstractmethod
+    def get_networks(self, network_ids):
+        """Retrieves networks from a list of network ids in a single request.
+
+        :param network_ids: iterable of network ids to retrieve
+        :return: [octavia.network.data_models.Network]
+        :raises: NetworkException, NetworkNotFound if any of the networks
+                 is not found
+        """
+
     @abc.abstractmethod
     def get_subnet(self, subnet_id, context=None):
         """Retrieves subnet from subnet id.
@@ -236,6 +259,16 @@ class AbstractNetworkDriver(object, metaclass=abc.ABCMeta):
         :raises: NetworkException, SubnetNotFound
         """
 
+    @abc.abstractmethod
+    def get_subnets(self, subnet_ids):
+        """Retrieves subnets from a list of subnet ids in a single request.
+
+        :param subnet_ids: iterable of subnet ids to retrieve
+        :return: [octavia.network.data_models.Subnet]
+        :raises: NetworkException, SubnetNotFound if any of the subnets is not
+                 found
+        """
+
     @abc.abstractmethod
     def get_port(self, port_id, context=None):
         """Retrieves port from port id.
@@ -246,6 +279,16 @@ class AbstractNetworkDriver(object, metaclass=abc.ABCMeta):
         :raises: NetworkException, PortNotFound
         """
 
+    @abc.abstractmethod
+    def get_ports(self, port_ids):
+        """Retrieves ports from a list of port ids in a single request.
+
+        :param port_ids: iterable of port ids to retrieve
+        :return: [octavia.network.data_models.Port]
+        :raises: NetworkException, PortNotFound if any of the ports is not
+                 found
+        """
+
     @abc.abstractmethod
     def get_network_by_name(self, network_name):
         """Retrieves network from network name.
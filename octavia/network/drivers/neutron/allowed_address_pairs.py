@@ -583,6 +583,7 @@ class AllowedAddressPairsDriver(neutron_base.BaseNeutronDriver):
             self.unplug_aap_port(vip, amphora, subnet)
 
     def plug_network(self, compute_id, network_id, ip_address=None):
+        self.invalidate_cache(network_id)
         try:
             interface = self.compute.attach_network_or_port(
                 compute_id=compute_id, network_id=network_id,
@@ -604,6 +605,7 @@ class AllowedAddressPairsDriver(neutron_base.BaseNeutronDriver):
         return self._nova_interface_to_octavia_interface(compute_id, interface)
 
     def unplug_network(self, compute_id, network_id, ip_address=None):
+        self.invalidate_cache(network_id)
         interfaces = self.get_plugged_networks(compute_id)
         if not interfaces:
             msg = ('Amphora with compute id {compute_id} does not have any '
@@ -617,6 +619,9 @@ class AllowedAddressPairsDriver(neutron_base.BaseNeutronDriver):
                 compute_id=compute_id, port_id=unplugger.port_id)
 
     def update_vip(self, load_balancer, for_delete=False):
+        if load_balancer.vip:
+            self.invalidate_cache(load_balancer.vip.network_id)
+            self.invalidate_cache(load_balancer.vip.subnet_id)
         sec_grp = self._get_lb_security_group(load_balancer.id)
         if sec_grp:
             self._update_security_group_rules(load_balancer,
@@ -778,10 +783,12 @@ class AllowedAddressPairsDriver(neutron_base.BaseNeutronDriver):
                     neutron_client_exceptions.PortNotFoundClient):
                 pass
 
-    def delete_port(self, port_id):
+    def delete_port(self, port_id, admin_down_on_failure=False):
         """delete a neutron port.
 
         :param port_id: The port ID to delete.
+        :param admin_down_on_failure: Attempt to disable (admin down) the
+                                      port if it cannot be deleted.
         :returns: None
         """
         try:
@@ -791,6 +798,17 @@ class AllowedAddressPairsDriver(neutron_base.BaseNeutronDriver):
             LOG.debug('VIP instance port %s already deleted. Skipping.',
                       port_id)
         except Exception as e:
+            if admin_down_on_failure:
+                # Let's at least attempt to disable it so if the instance
+                # comes back from the dead it doesn't conflict with anything.
+                try:
+                    self.set_port_admin_state_up(port_id, False)
+                    LOG.info('Successfully disabled (admin down) network '
+                             'port %s that failed to delete.', port_id)
+                except Exception:
+                    LOG.warning('Attempt to disable (admin down) network port '
+                                '%s failed. The network service has failed. '
+                                'Continuing.', port_id)
             raise exceptions.NetworkServiceError(net_error=str(e))
 
     def set_port_admin_state_up(self, port_id, state):
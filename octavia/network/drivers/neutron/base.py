@@ -12,6 +12,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import copy
+import threading
+import time
+
+import cachetools
 from neutronclient.common import exceptions as neutron_client_exceptions
 from oslo_config import cfg
 from oslo_log import log as logging
@@ -28,6 +33,7 @@ LOG = logging.getLogger(__name__)
 DNS_INT_EXT_ALIAS = 'dns-integration'
 SEC_GRP_EXT_ALIAS = 'security-group'
 QOS_EXT_ALIAS = 'qos'
+RESOURCE_CACHE_SIZE = 4096
 
 CONF = cfg.CONF
 
@@ -44,6 +50,10 @@ class BaseNeutronDriver(base.AbstractNetworkDriver):
             ca_cert=CONF.neutron.ca_certificates_file
         )
         self._check_extension_cache = {}
+        self._resource_cache = cachetools.TTLCache(
+            maxsize=RESOURCE_CACHE_SIZE,
+            ttl=CONF.networking.object_cache_ttl, timer=time.monotonic)
+        self._resource_cache_lock = threading.Lock()
         self.sec_grp_enabled = self._check_extension_enabled(SEC_GRP_EXT_ALIAS)
         self.dns_integration_enabled = self._check_extension_enabled(
             DNS_INT_EXT_ALIAS)
@@ -241,15 +251,96 @@ class BaseNeutronDriver(base.AbstractNetworkDriver):
             LOG.exception(message)
             raise base.NetworkException(message) from e
 
+    def _get_resources_by_ids(self, resource_type, resource_ids):
+        """Retrieves resources by id, failing if any of them is missing."""
+        resources = self._get_resources_by_filters(resource_type,
+                                                   id=resource_ids)
+        missing_ids = set(resource_ids) - {resource.id
+                                           for resource in resources}
+        if missing_ids:
+            message = _('{resource_type}s not found: {ids}.').format(
+                resource_type=resource_type,
+                ids=', '.join(sorted(missing_ids)))
+            raise getattr(base, '%sNotFound' % ''.join(
+                [w.capitalize() for w in resource_type.split('_')]
+            ))(message)
+        return resources
+
+    def _get_cached_resources(self, resource_ids):
+        """Returns copies of the cached resources that have not expired yet.
+
+        The cached resources are shared between threads, so callers get
+        their own copies that they are free to modify.
+        """
+        cached = {}
+        with self._resource_cache_lock:
+            for resource_id in resource_ids:
+                resource = self._resource_cache.get(resource_id)
+                if resource is not None:
+                    cached[resource_id] = resource
+        return {resource_id: copy.deepcopy(resource)
+                for resource_id, resource in cached.items()}
+
+    def _cache_resources(self, resources):
+        copies = [copy.deepcopy(resource) for resource in resources]
+        with self._resource_cache_lock:
+            for resource in copies:
+                self._resource_cache[resource.id] = resource
+
+    def _get_cacheable_resource(self, resource_type, resource_id,
+                                context=None):
+        # Resources retrieved on behalf of a user are not shared
+        if context or not CONF.networking.object_cache_ttl:
+            return self._get_resource(resource_type, resource_id,
+                                      context=context)
+        resource = self._get_cached_resources([resource_id]).get(resource_id)
+        if resource is None:
+            resource = self._get_resource(resource_type, resource_id)
+            self._cache_resources([resource])
+        return resource
+
+    def _get_cacheable_resources(self, resource_type, resource_ids):
+        resource_ids = list(resource_ids)
+        if not resource_ids:
+            return []
+        if not CONF.networking.object_cache_ttl:
+            return self._get_resources_by_ids(resource_type, resource_ids)
+        cached = self._get_cached_resources(resource_ids)
+        missing_ids = [resource_id for resource_id in resource_ids
+                       if resource_id not in cached]
+        if not missing_ids:
+            return list(cached.values())
+        resources = self._get_resources_by_ids(resource_type, missing_ids)
+        self._cache_resources(resources)
+        return list(cached.values()) + resources
+
+    def invalidate_cache(self, resource_id):
+        with self._resource_cache_lock:
+            self._resource_cache.pop(resource_id, None)
+
     def get_network(self, network_id, context=None):
-        return self._get_resource('network', network_id, context=context)
+        return self._get_cacheable_resource('network', network_id,
+                                            context=context)
+
+    def get_networks(self, network_ids):
+        return self._get_cacheable_resources('network', network_ids)
 
     def get_subnet(self, subnet_id, context=None):
-        return self._get_resource('subnet', subnet_id, context=context)
+        return self._get_cacheable_resource('subnet', subnet_id,
+                                            context=context)
+
+    def get_subnets(self, subnet_ids):
+        return self._get_cacheable_resources('subnet', subnet_ids)
 
     def get_port(self, port_id, context=None):
         return self._get_resource('port', port_id, context=context)
 
+    def get_ports(self, port_ids):
+        port_ids = list(port_ids)
+        if not port_ids:
+            return []
+        return self._get_resources_by_ids('port', port_ids)
+
     def get_network_by_name(self, network_name):
         return self._get_resources_by_filters(
             'network', unique_item=True, name=network_name)
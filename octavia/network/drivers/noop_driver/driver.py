@@ -165,18 +165,43 @@ class NoopManager(object):
         network.subnets = ItIsInsideMe()
         return network
 
+    def get_networks(self, network_ids):
+        network_ids = tuple(network_ids)
+        LOG.debug("Network %s no-op, get_networks network_ids %s",
+                  self.__class__.__name__, network_ids)
+        self.networkconfigconfig[network_ids] = (network_ids, 'get_networks')
+        return [network_models.Network(id=network_id,
+                                       port_security_enabled=True)
+                for network_id in network_ids]
+
     def get_subnet(self, subnet_id):
         LOG.debug("Subnet %s no-op, get_subnet subnet_id %s",
                   self.__class__.__name__, subnet_id)
         self.networkconfigconfig[subnet_id] = (subnet_id, 'get_subnet')
         return network_models.Subnet(id=uuidutils.generate_uuid())
 
+    def get_subnets(self, subnet_ids):
+        subnet_ids = tuple(subnet_ids)
+        LOG.debug("Subnet %s no-op, get_subnets subnet_ids %s",
+                  self.__class__.__name__, subnet_ids)
+        self.networkconfigconfig[subnet_ids] = (subnet_ids, 'get_subnets')
+        return [network_models.Subnet(id=subnet_id,
+                                      network_id=uuidutils.generate_uuid())
+                for subnet_id in subnet_ids]
+
     def get_port(self, port_id):
         LOG.debug("Port %s no-op, get_port port_id %s",
                   self.__class__.__name__, port_id)
         self.networkconfigconfig[port_id] = (port_id, 'get_port')
         return network_models.Port(id=uuidutils.generate_uuid())
 
+    def get_ports(self, port_ids):
+        port_ids = tuple(port_ids)
+        LOG.debug("Port %s no-op, get_ports port_ids %s",
+                  self.__class__.__name__, port_ids)
+        self.networkconfigconfig[port_ids] = (port_ids, 'get_ports')
+        return [network_models.Port(id=port_id) for port_id in port_ids]
+
     def get_network_by_name(self, network_name):
         LOG.debug("Network %s no-op, get_network_by_name network_name %s",
                   self.__class__.__name__, network_name)
@@ -290,7 +315,7 @@ class NoopManager(object):
         ip_avail.subnet_ip_availability = subnet_ip_availability
         return ip_avail
 
-    def delete_port(self, port_id):
+    def delete_port(self, port_id, admin_down_on_failure=False):
         LOG.debug("Network %s no-op, delete_port port_id %s",
                   self.__class__.__name__, port_id)
         self.networkconfigconfig[port_id] = (port_id, 'delete_port')
@@ -371,12 +396,21 @@ class NoopNetworkDriver(driver_base.AbstractNetworkDriver):
     def get_network(self, network_id, context=None):
         return self.driver.get_network(network_id)
 
+    def get_networks(self, network_ids):
+        return self.driver.get_networks(network_ids)
+
     def get_subnet(self, subnet_id, context=None):
         return self.driver.get_subnet(subnet_id)
 
+    def get_subnets(self, subnet_ids):
+        return self.driver.get_subnets(subnet_ids)
+
     def get_port(self, port_id, context=None):
         return self.driver.get_port(port_id)
 
+    def get_ports(self, port_ids):
+        return self.driver.get_ports(port_ids)
+
     def get_qos_policy(self, qos_policy_id):
         return self.driver.get_qos_policy(qos_policy_id)
 
@@ -425,8 +459,9 @@ class NoopNetworkDriver(driver_base.AbstractNetworkDriver):
     def get_network_ip_availability(self, network):
         return self.driver.get_network_ip_availability(network)
 
-    def delete_port(self, port_id):
-        self.driver.delete_port(port_id)
+    def delete_port(self, port_id, admin_down_on_failure=False):
+        self.driver.delete_port(port_id,
+                                admin_down_on_failure=admin_down_on_failure)
 
     def set_port_admin_state_up(self, port_id, state):
         self.driver.set_port_admin_state_up(port_id, state)
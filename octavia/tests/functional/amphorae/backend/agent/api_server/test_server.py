@@ -66,6 +66,12 @@ class TestServerTestCase(base.TestCase):
             self.centos_test_server = server.Server()
             self.centos_app = self.centos_test_server.app.test_client()
 
+    def _close_netlink_sockets(self):
+        # The plug handlers keep their netlink socket open, drop the ones
+        # opened with the mocks of a previous run of the same test.
+        self.ubuntu_test_server._plug._close_iproute()
+        self.centos_test_server._plug._close_iproute()
+
     @mock.patch('octavia.amphorae.backends.agent.api_server.util.'
                 'get_os_init_system', return_value=consts.INIT_SYSTEMD)
     def test_ubuntu_haproxy_systemd(self, mock_init_system):
@@ -975,14 +981,13 @@ class TestServerTestCase(base.TestCase):
     def _test_plug_network(self, distro, mock_isfile, mock_int_exists,
                            mock_check_output, mock_netns, mock_pyroute2,
                            mock_os_chmod):
-        mock_ipr = mock.MagicMock()
         mock_ipr_instance = mock.MagicMock()
         mock_ipr_instance.link_lookup.side_effect = [
             [], [], [33], [33], [33], [33], [33], [33], [33], [33]]
         mock_ipr_instance.get_links.return_value = ({
             'attrs': [('IFLA_IFNAME', FAKE_INTERFACE)]},)
-        mock_ipr.__enter__.return_value = mock_ipr_instance
-        mock_pyroute2.return_value = mock_ipr
+        mock_pyroute2.return_value = mock_ipr_instance
+        self._close_netlink_sockets()
 
         self.assertIn(distro, [consts.UBUNTU, consts.CENTOS])
         port_info = {'mac_address': '123'}
@@ -1362,13 +1367,12 @@ class TestServerTestCase(base.TestCase):
     def _test_plug_network_host_routes(self, distro, mock_check_output,
                                        mock_netns, mock_pyroute2,
                                        mock_os_chmod):
-        mock_ipr = mock.MagicMock()
         mock_ipr_instance = mock.MagicMock()
         mock_ipr_instance.link_lookup.return_value = [33]
         mock_ipr_instance.get_links.return_value = ({
             'attrs': [('IFLA_IFNAME', FAKE_INTERFACE)]},)
-        mock_ipr.__enter__.return_value = mock_ipr_instance
-        mock_pyroute2.return_value = mock_ipr
+        mock_pyroute2.return_value = mock_ipr_instance
+        self._close_netlink_sockets()
 
         self.assertIn(distro, [consts.UBUNTU, consts.CENTOS])
 
@@ -1384,6 +1388,7 @@ class TestServerTestCase(base.TestCase):
         netns_handle = mock_netns.return_value.__enter__.return_value
         netns_handle.get_links.return_value = [{
             'attrs': [['IFLA_IFNAME', consts.NETNS_PRIMARY_INTERFACE]]}]
+        netns_handle.link_lookup.return_value = []
 
         port_info = {'mac_address': MAC, 'mtu': 1450, 'fixed_ips': [
             {'ip_address': IP, 'subnet_cidr': SUBNET_CIDR,
@@ -1493,14 +1498,13 @@ class TestServerTestCase(base.TestCase):
                         mock_copytree, mock_check_output, mock_netns,
                         mock_netns_create, mock_pyroute2, mock_int_exists,
                         mock_nspopen, mock_copy2, mock_os_chmod):
-        mock_ipr = mock.MagicMock()
         mock_ipr_instance = mock.MagicMock()
         mock_ipr_instance.link_lookup.side_effect = [[], [], [33], [33], [33],
                                                      [33], [33], [33]]
         mock_ipr_instance.get_links.return_value = ({
             'attrs': [('IFLA_IFNAME', FAKE_INTERFACE)]},)
-        mock_ipr.__enter__.return_value = mock_ipr_instance
-        mock_pyroute2.return_value = mock_ipr
+        mock_pyroute2.return_value = mock_ipr_instance
+        self._close_netlink_sockets()
 
         mock_isfile.return_value = True
 
@@ -1730,10 +1734,8 @@ class TestServerTestCase(base.TestCase):
                  mock.call('amphora-haproxy', ['modprobe', 'ip_vs'],
                            stdout=subprocess.PIPE),
                  mock.call('amphora-haproxy',
-                           ['/sbin/sysctl', '-w', 'net.ipv4.ip_forward=1'],
-                           stdout=subprocess.PIPE),
-                 mock.call('amphora-haproxy',
-                           ['/sbin/sysctl', '-w', 'net.ipv4.vs.conntrack=1'],
+                           ['/sbin/sysctl', '-w', 'net.ipv4.vs.conntrack=1',
+                            'net.ipv4.ip_forward=1'],
                            stdout=subprocess.PIPE)]
         mock_nspopen.assert_has_calls(calls, any_order=True)
 
@@ -1864,14 +1866,15 @@ class TestServerTestCase(base.TestCase):
                         mock_copytree, mock_check_output, mock_netns,
                         mock_netns_create, mock_pyroute2, mock_nspopen,
                         mock_copy2, mock_os_chmod):
-        mock_ipr = mock.MagicMock()
         mock_ipr_instance = mock.MagicMock()
         mock_ipr_instance.link_lookup.side_effect = [[], [], [33], [33], [33],
                                                      [33], [33], [33]]
         mock_ipr_instance.get_links.return_value = ({
             'attrs': [('IFLA_IFNAME', FAKE_INTERFACE)]},)
-        mock_ipr.__enter__.return_value = mock_ipr_instance
-        mock_pyroute2.return_value = mock_ipr
+        mock_pyroute2.return_value = mock_ipr_instance
+        self._close_netlink_sockets()
+        netns_handle = mock_netns.return_value.__enter__.return_value
+        netns_handle.link_lookup.return_value = []
 
         mock_isfile.return_value = True
 
@@ -2088,11 +2091,8 @@ class TestServerTestCase(base.TestCase):
                  mock.call('amphora-haproxy', ['modprobe', 'ip_vs'],
                            stdout=subprocess.PIPE),
                  mock.call('amphora-haproxy',
-                           ['/sbin/sysctl', '-w',
+                           ['/sbin/sysctl', '-w', 'net.ipv4.vs.conntrack=1',
                             'net.ipv6.conf.all.forwarding=1'],
-                           stdout=subprocess.PIPE),
-                 mock.call('amphora-haproxy',
-                           ['/sbin/sysctl', '-w', 'net.ipv4.vs.conntrack=1'],
                            stdout=subprocess.PIPE)]
         mock_nspopen.assert_has_calls(calls, any_order=True)
 
@@ -3739,6 +3739,17 @@ class LoadBalancerRepositoryTest(BaseRepositoryTest):
         self.assertIn(lb1.id, expiring_ids)
         self.assertNotIn(lb2.id, expiring_ids)
 
+    def test_delete_batch(self):
+        lb1 = self.create_loadbalancer(self.FAKE_UUID_1)
+        lb2 = self.create_loadbalancer(self.FAKE_UUID_2)
+        lb3 = self.create_loadbalancer(self.FAKE_UUID_3)
+
+        self.lb_repo.delete_batch(self.session, ids=[lb1.id, lb2.id])
+
+        self.assertIsNone(self.lb_repo.get(self.session, id=lb1.id))
+        self.assertIsNone(self.lb_repo.get(self.session, id=lb2.id))
+        self.assertIsNotNone(self.lb_repo.get(self.session, id=lb3.id))
+
 
 class VipRepositoryTest(BaseRepositoryTest):
 
@@ -3992,6 +4003,35 @@ class AmphoraRepositoryTest(BaseRepositoryTest):
         self.assertIn(amphora1.id, expiring_ids)
         self.assertNotIn(amphora2.id, expiring_ids)
 
+    def test_get_all_deleted_expiring_paginated(self):
+        exp_age = datetime.timedelta(seconds=self.FAKE_EXP_AGE)
+        updated_at = datetime.datetime.utcnow() - exp_age
+        amphora_ids = sorted(uuidutils.generate_uuid() for _ in range(5))
+        for amphora_id in amphora_ids:
+            self.create_amphora(amphora_id, updated_at=updated_at,
+                                status=constants.DELETED)
+        self.create_amphora(self.FAKE_UUID_1, status=constants.DELETED)
+
+        pages = list(self.amphora_repo.get_all_deleted_expiring_paginated(
+            self.session, exp_age=exp_age, page_size=2))
+
+        self.assertEqual([amphora_ids[0:2], amphora_ids[2:4],
+                          amphora_ids[4:]], pages)
+
+    @mock.patch('octavia.db.repositories.MAX_IDS_PER_QUERY', 1)
+    def test_delete_batch(self):
+        amphora1 = self.create_amphora(self.FAKE_UUID_1)
+        amphora2 = self.create_amphora(self.FAKE_UUID_2)
+        amphora3 = self.create_amphora(self.FAKE_UUID_3)
+
+        self.amphora_repo.delete_batch(self.session,
+                                       ids=[amphora1.id, amphora2.id])
+
+        self.assertIsNone(self.amphora_repo.get(self.session, id=amphora1.id))
+        self.assertIsNone(self.amphora_repo.get(self.session, id=amphora2.id))
+        self.assertIsNotNone(self.amphora_repo.get(self.session,
+                                                   id=amphora3.id))
+
     def test_get_none_cert_expired_amphora(self):
         # test with no expired amphora
         amp = self.amphora_repo.get_cert_expiring_amphora(self.session)
@@ -4023,6 +4063,29 @@ class AmphoraRepositoryTest(BaseRepositoryTest):
         self.assertEqual(cert_expired_amphora.cert_expiration, expiration)
         self.assertEqual(cert_expired_amphora.id, amphora2.id)
 
+    def test_get_cert_expiring_amphorae(self):
+        expiration = datetime.datetime.utcnow() + datetime.timedelta(
+            seconds=1)
+        amphora_ids = {self.FAKE_UUID_1, self.FAKE_UUID_2}
+        for amphora_id in amphora_ids:
+            amphora = self.create_amphora(amphora_id)
+            self.amphora_repo.update(self.session, amphora.id,
+                                     cert_expiration=expiration)
+
+        amps1 = self.amphora_repo.get_cert_expiring_amphorae(self.session,
+                                                             limit=1)
+        amps2 = self.amphora_repo.get_cert_expiring_amphorae(self.session,
+                                                             limit=2)
+        amps3 = self.amphora_repo.get_cert_expiring_amphorae(self.session,
+                                                             limit=2)
+
+        # The amphorae returned are cert busy, so they are returned once
+        self.assertEqual(1, len(amps1))
+        self.assertEqual(1, len(amps2))
+        self.assertEqual(amphora_ids, {amps1[0].id, amps2[0].id})
+        self.assertTrue(amps1[0].cert_busy)
+        self.assertEqual([], amps3)
+
     def test_get_cert_expired_amphora_deleted(self):
         amphora = self.create_amphora(self.FAKE_UUID_3)
         expiration = datetime.datetime.utcnow() + datetime.timedelta(seconds=1)
@@ -4206,6 +4269,32 @@ class AmphoraHealthRepositoryTest(BaseRepositoryTest):
             self.session, self.amphora.id)
         self.assertTrue(checkres)
 
+    def test_check_amphora_health_expired_batch(self):
+        exp_age = datetime.timedelta(seconds=self.FAKE_EXP_AGE)
+        missing_amphora_id = uuidutils.generate_uuid()
+        recent_amphora_id = uuidutils.generate_uuid()
+        self.create_amphora_health(self.amphora.id)
+        self.amphora_health_repo.create(
+            self.session, amphora_id=recent_amphora_id,
+            last_update=datetime.datetime.utcnow(), busy=False)
+
+        expired_ids = (
+            self.amphora_health_repo.check_amphora_health_expired_batch(
+                self.session,
+                [self.amphora.id, missing_amphora_id, recent_amphora_id],
+                exp_age))
+
+        self.assertEqual({self.amphora.id, missing_amphora_id}, expired_ids)
+
+    def test_delete_batch(self):
+        self.create_amphora_health(self.amphora.id)
+
+        self.amphora_health_repo.delete_batch(
+            self.session, ids=[self.amphora.id, uuidutils.generate_uuid()])
+
+        self.assertIsNone(self.amphora_health_repo.get(
+            self.session, amphora_id=self.amphora.id))
+
     def test_get_stale_amphora(self):
         stale_amphora = self.amphora_health_repo.get_stale_amphora(
             self.session)
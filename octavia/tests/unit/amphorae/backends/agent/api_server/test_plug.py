@@ -50,17 +50,58 @@ class TestPlug(base.TestCase):
         mock_ipr_instance.link_lookup.return_value = [33]
         mock_ipr_instance.get_links.return_value = ({
             'attrs': [('IFLA_IFNAME', FAKE_INTERFACE)]},)
-        mock_ipr().__enter__.return_value = mock_ipr_instance
+        mock_ipr.return_value = mock_ipr_instance
 
         interface = self.test_plug._interface_by_mac(FAKE_MAC_ADDRESS.upper())
         self.assertEqual(FAKE_INTERFACE, interface)
         mock_ipr_instance.get_links.assert_called_once_with(33)
 
+        # The interface name is cached
+        interface = self.test_plug._interface_by_mac(FAKE_MAC_ADDRESS)
+        self.assertEqual(FAKE_INTERFACE, interface)
+        mock_ipr_instance.get_links.assert_called_once_with(33)
+
+    @mock.patch('pyroute2.IPRoute', create=True)
+    def test__interface_by_mac_shared_netlink_socket(self, mock_ipr):
+        mock_ipr_instance = mock.MagicMock()
+        mock_ipr_instance.link_lookup.return_value = [33]
+        mock_ipr_instance.get_links.return_value = ({
+            'attrs': [('IFLA_IFNAME', FAKE_INTERFACE)]},)
+        mock_ipr.return_value = mock_ipr_instance
+
+        self.test_plug._interface_by_mac(FAKE_MAC_ADDRESS)
+        self.test_plug._interface_by_mac('ab:cd:ef:00:ff:23')
+
+        mock_ipr.assert_called_once_with()
+        self.assertEqual(2, mock_ipr_instance.get_links.call_count)
+        mock_ipr_instance.close.assert_not_called()
+
+    @mock.patch('pyroute2.IPRoute', create=True)
+    def test__interface_by_mac_netlink_error(self, mock_ipr):
+        broken_ipr_instance = mock.MagicMock()
+        broken_ipr_instance.link_lookup.side_effect = OSError
+        mock_ipr_instance = mock.MagicMock()
+        mock_ipr_instance.link_lookup.return_value = [33]
+        mock_ipr_instance.get_links.return_value = ({
+            'attrs': [('IFLA_IFNAME', FAKE_INTERFACE)]},)
+        mock_ipr.side_effect = [broken_ipr_instance, mock_ipr_instance]
+
+        with mock.patch('os.path.isfile', return_value=False):
+            self.assertRaises(wz_exceptions.HTTPException,
+                              self.test_plug._interface_by_mac,
+                              FAKE_MAC_ADDRESS)
+
+        # The socket that failed is closed and not used again
+        broken_ipr_instance.close.assert_called_once_with()
+        interface = self.test_plug._interface_by_mac(FAKE_MAC_ADDRESS)
+        self.assertEqual(FAKE_INTERFACE, interface)
+        self.assertEqual(2, mock_ipr.call_count)
+
     @mock.patch('pyroute2.IPRoute', create=True)
     def test__interface_by_mac_not_found(self, mock_ipr):
         mock_ipr_instance = mock.MagicMock()
         mock_ipr_instance.link_lookup.return_value = []
-        mock_ipr().__enter__.return_value = mock_ipr_instance
+        mock_ipr.return_value = mock_ipr_instance
 
         fd_mock = mock.mock_open()
         open_mock = mock.Mock()
@@ -80,7 +121,7 @@ class TestPlug(base.TestCase):
         mock_ipr_instance.link_lookup.return_value = [33]
         mock_ipr_instance.get_links.return_value = ({
             'attrs': [('IFLA_IFNAME', FAKE_INTERFACE)]},)
-        mock_ipr().__enter__.return_value = mock_ipr_instance
+        mock_ipr.return_value = mock_ipr_instance
 
         with mock.patch('distro.id', return_value='centos'):
             osutil = osutils.BaseOS.get_os_util()
@@ -104,6 +145,8 @@ class TestPlug(base.TestCase):
                            mock_check_output, mock_netns, mock_netns_create,
                            mock_pyroute2, mock_webob, mock_nspopen,
                            mock_by_mac):
+        netns_handle = mock_netns.return_value.__enter__.return_value
+        netns_handle.link_lookup.return_value = []
         m = mock.mock_open()
         with mock.patch('os.open'), mock.patch.object(os, 'fdopen', m):
             self.test_plug.plug_vip(
@@ -122,12 +165,41 @@ class TestPlug(base.TestCase):
                  mock.call('amphora-haproxy', ['modprobe', 'ip_vs'],
                            stdout=subprocess.PIPE),
                  mock.call('amphora-haproxy',
-                           ['/sbin/sysctl', '-w', 'net.ipv4.ip_forward=1'],
-                           stdout=subprocess.PIPE),
-                 mock.call('amphora-haproxy',
-                           ['/sbin/sysctl', '-w', 'net.ipv4.vs.conntrack=1'],
+                           ['/sbin/sysctl', '-w', 'net.ipv4.vs.conntrack=1',
+                            'net.ipv4.ip_forward=1'],
                            stdout=subprocess.PIPE)]
         mock_nspopen.assert_has_calls(calls, any_order=True)
+        self.assertEqual(len(calls), mock_nspopen.call_count)
+
+    @mock.patch('octavia.amphorae.backends.agent.api_server.plug.Plug.'
+                '_interface_by_mac', return_value=FAKE_INTERFACE)
+    @mock.patch('pyroute2.NSPopen', create=True)
+    @mock.patch.object(plug, "webob")
+    @mock.patch('pyroute2.IPRoute', create=True)
+    @mock.patch('pyroute2.netns.create', create=True)
+    @mock.patch('pyroute2.NetNS', create=True)
+    @mock.patch('subprocess.check_output')
+    @mock.patch('shutil.copytree')
+    @mock.patch('os.makedirs')
+    def test_plug_vip_netlink_error(self, mock_makedirs, mock_copytree,
+                                    mock_check_output, mock_netns,
+                                    mock_netns_create, mock_pyroute2,
+                                    mock_webob, mock_nspopen, mock_by_mac):
+        netns_handle = mock_netns.return_value.__enter__.return_value
+        netns_handle.link_lookup.return_value = []
+        mock_ipr_instance = mock_pyroute2.return_value
+        mock_ipr_instance.link.side_effect = OSError
+        m = mock.mock_open()
+        with mock.patch('os.open'), mock.patch.object(os, 'fdopen', m):
+            self.assertRaises(OSError, self.test_plug.plug_vip,
+                              vip=FAKE_IP_IPV4,
+                              subnet_cidr=FAKE_CIDR_IPV4,
+                              gateway=FAKE_GATEWAY_IPV4,
+                              mac_address=FAKE_MAC_ADDRESS)
+
+        # The netlink socket is closed so the next request opens a new one
+        mock_ipr_instance.close.assert_called_once_with()
+        self.assertIsNone(self.test_plug._ipr)
 
     @mock.patch('octavia.amphorae.backends.agent.api_server.plug.Plug.'
                 '_interface_by_mac', return_value=FAKE_INTERFACE)
@@ -143,6 +215,8 @@ class TestPlug(base.TestCase):
                            mock_check_output, mock_netns, mock_netns_create,
                            mock_pyroute2, mock_webob, mock_nspopen,
                            mock_by_mac):
+        netns_handle = mock_netns.return_value.__enter__.return_value
+        netns_handle.link_lookup.return_value = []
         conf = self.useFixture(oslo_fixture.Config(cfg.CONF))
         conf.config(group='controller_worker',
                     loadbalancer_topology=constants.TOPOLOGY_ACTIVE_STANDBY)
@@ -164,13 +238,11 @@ class TestPlug(base.TestCase):
                  mock.call('amphora-haproxy', ['modprobe', 'ip_vs'],
                            stdout=subprocess.PIPE),
                  mock.call('amphora-haproxy',
-                           ['/sbin/sysctl', '-w',
+                           ['/sbin/sysctl', '-w', 'net.ipv4.vs.conntrack=1',
                             'net.ipv6.conf.all.forwarding=1'],
-                           stdout=subprocess.PIPE),
-                 mock.call('amphora-haproxy',
-                           ['/sbin/sysctl', '-w', 'net.ipv4.vs.conntrack=1'],
                            stdout=subprocess.PIPE)]
         mock_nspopen.assert_has_calls(calls, any_order=True)
+        self.assertEqual(len(calls), mock_nspopen.call_count)
 
     @mock.patch.object(plug, "webob")
     @mock.patch('pyroute2.IPRoute', create=True)
@@ -198,14 +270,15 @@ class TestPlug(base.TestCase):
 
         netns_handle = mock_netns.return_value.__enter__.return_value
 
-        netns_handle.get_links.return_value = [{
-            'attrs': [['IFLA_ADDRESS', '123']]}]
+        netns_handle.link_lookup.side_effect = [[2], []]
 
         # Interface is found in netns
         self.assertTrue(self.test_plug._netns_interface_exists('123'))
+        netns_handle.link_lookup.assert_called_once_with(address='123')
 
         # Interface is not found in netns
         self.assertFalse(self.test_plug._netns_interface_exists('321'))
+        netns_handle.link_lookup.assert_called_with(address='321')
 
 
 class TestPlugNetwork(base.TestCase):
@@ -70,13 +70,19 @@ class TestDatabaseCleanup(base.TestCase):
                                   vrrp_ip=self.FAKE_IP,
                                   ha_ip=self.FAKE_IP,
                                   updated_at=expired_time)
-        self.amp_repo.get_all_deleted_expiring.return_value = [amphora.id]
-        self.amp_health_repo.check_amphora_health_expired.return_value = True
+        self.amp_repo.get_all_deleted_expiring_paginated.return_value = [
+            [amphora.id]]
+        check_expired = self.amp_health_repo.check_amphora_health_expired_batch
+        check_expired.return_value = {amphora.id}
         self.dbclean.delete_old_amphorae()
-        self.assertTrue(self.amp_repo.get_all_deleted_expiring.called)
         self.assertTrue(
-            self.amp_health_repo.check_amphora_health_expired.called)
-        self.assertTrue(self.amp_repo.delete.called)
+            self.amp_repo.get_all_deleted_expiring_paginated.called)
+        self.assertTrue(
+            self.amp_health_repo.check_amphora_health_expired_batch.called)
+        self.amp_repo.delete_batch.assert_called_once_with(
+            session, ids=[amphora.id])
+        self.amp_health_repo.delete_batch.assert_called_once_with(
+            session, ids=[amphora.id])
 
     @mock.patch('octavia.db.api.get_session')
     def test_delete_old_amphorae_False(self, session):
@@ -91,12 +97,13 @@ class TestDatabaseCleanup(base.TestCase):
                         vrrp_ip=self.FAKE_IP,
                         ha_ip=self.FAKE_IP,
                         updated_at=datetime.datetime.now())
-        self.amp_repo.get_all_deleted_expiring.return_value = []
+        self.amp_repo.get_all_deleted_expiring_paginated.return_value = []
         self.dbclean.delete_old_amphorae()
-        self.assertTrue(self.amp_repo.get_all_deleted_expiring.called)
+        self.assertTrue(
+            self.amp_repo.get_all_deleted_expiring_paginated.called)
         self.assertFalse(
-            self.amp_health_repo.check_amphora_health_expired.called)
-        self.assertFalse(self.amp_repo.delete.called)
+            self.amp_health_repo.check_amphora_health_expired_batch.called)
+        self.assertFalse(self.amp_repo.delete_batch.called)
 
     @mock.patch('octavia.db.api.get_session')
     def test_delete_old_amphorae_Zombie(self, session):
@@ -118,13 +125,16 @@ class TestDatabaseCleanup(base.TestCase):
                                   vrrp_ip=self.FAKE_IP,
                                   ha_ip=self.FAKE_IP,
                                   updated_at=expired_time)
-        self.amp_repo.get_all_deleted_expiring.return_value = [amphora.id]
-        self.amp_health_repo.check_amphora_health_expired.return_value = False
+        self.amp_repo.get_all_deleted_expiring_paginated.return_value = [
+            [amphora.id]]
+        check_expired = self.amp_health_repo.check_amphora_health_expired_batch
+        check_expired.return_value = set()
         self.dbclean.delete_old_amphorae()
-        self.assertTrue(self.amp_repo.get_all_deleted_expiring.called)
         self.assertTrue(
-            self.amp_health_repo.check_amphora_health_expired.called)
-        self.assertFalse(self.amp_repo.delete.called)
+            self.amp_repo.get_all_deleted_expiring_paginated.called)
+        self.assertTrue(
+            self.amp_health_repo.check_amphora_health_expired_batch.called)
+        self.assertFalse(self.amp_repo.delete_batch.called)
 
     @mock.patch('octavia.db.api.get_session')
     def test_delete_old_load_balancer(self, session):
@@ -141,16 +151,18 @@ class TestDatabaseCleanup(base.TestCase):
             lb_repo = mock.MagicMock()
             self.dbclean.lb_repo = lb_repo
             if expired_status:
-                expiring_lbs = [load_balancer.id]
+                expiring_lbs = [[load_balancer.id]]
             else:
                 expiring_lbs = []
-            lb_repo.get_all_deleted_expiring.return_value = expiring_lbs
+            lb_repo.get_all_deleted_expiring_paginated.return_value = (
+                expiring_lbs)
             self.dbclean.cleanup_load_balancers()
-            self.assertTrue(lb_repo.get_all_deleted_expiring.called)
+            self.assertTrue(lb_repo.get_all_deleted_expiring_paginated.called)
             if expired_status:
-                self.assertTrue(lb_repo.delete.called)
+                lb_repo.delete_batch.assert_called_once_with(
+                    session, ids=[load_balancer.id])
             else:
-                self.assertFalse(lb_repo.delete.called)
+                self.assertFalse(lb_repo.delete_batch.called)
 
 
 class TestCertRotation(base.TestCase):
@@ -161,7 +173,7 @@ class TestCertRotation(base.TestCase):
     @mock.patch('octavia.controller.worker.v1.controller_worker.'
                 'ControllerWorker.amphora_cert_rotation')
     @mock.patch('octavia.db.repositories.AmphoraRepository.'
-                'get_cert_expiring_amphora')
+                'get_cert_expiring_amphorae')
     @mock.patch('octavia.db.api.get_session')
     def test_cert_rotation_expired_amphora_with_exception(self, session,
                                                           cert_exp_amp_mock,
@@ -173,7 +185,7 @@ class TestCertRotation(base.TestCase):
         amphora.id = AMPHORA_ID
 
         session.return_value = session
-        cert_exp_amp_mock.side_effect = [amphora, TestException(
+        cert_exp_amp_mock.side_effect = [[amphora], TestException(
             'break_while')]
 
         cr = house_keeping.CertRotation()
@@ -183,7 +195,7 @@ class TestCertRotation(base.TestCase):
     @mock.patch('octavia.controller.worker.v1.controller_worker.'
                 'ControllerWorker.amphora_cert_rotation')
     @mock.patch('octavia.db.repositories.AmphoraRepository.'
-                'get_cert_expiring_amphora')
+                'get_cert_expiring_amphorae')
     @mock.patch('octavia.db.api.get_session')
     def test_cert_rotation_expired_amphora_without_exception(self, session,
                                                              cert_exp_amp_mock,
@@ -195,7 +207,7 @@ class TestCertRotation(base.TestCase):
         amphora.id = AMPHORA_ID
 
         session.return_value = session
-        cert_exp_amp_mock.side_effect = [amphora, None]
+        cert_exp_amp_mock.side_effect = [[amphora], []]
 
         cr = house_keeping.CertRotation()
 
@@ -205,7 +217,7 @@ class TestCertRotation(base.TestCase):
     @mock.patch('octavia.controller.worker.v1.controller_worker.'
                 'ControllerWorker.amphora_cert_rotation')
     @mock.patch('octavia.db.repositories.AmphoraRepository.'
-                'get_cert_expiring_amphora')
+                'get_cert_expiring_amphorae')
     @mock.patch('octavia.db.api.get_session')
     def test_cert_rotation_non_expired_amphora(self, session,
                                                cert_exp_amp_mock,
@@ -214,7 +226,7 @@ class TestCertRotation(base.TestCase):
                          default_provider_driver='amphora')
 
         session.return_value = session
-        cert_exp_amp_mock.return_value = None
+        cert_exp_amp_mock.return_value = []
         cr = house_keeping.CertRotation()
         cr.rotate()
         self.assertFalse(amp_cert_mock.called)
@@ -222,7 +234,7 @@ class TestCertRotation(base.TestCase):
     @mock.patch('octavia.controller.worker.v2.controller_worker.'
                 'ControllerWorker.amphora_cert_rotation')
     @mock.patch('octavia.db.repositories.AmphoraRepository.'
-                'get_cert_expiring_amphora')
+                'get_cert_expiring_amphorae')
     @mock.patch('octavia.db.api.get_session')
     def test_cert_rotation_expired_amphora_with_exception_amphorav2(
             self, session, cert_exp_amp_mock, amp_cert_mock):
@@ -233,7 +245,7 @@ class TestCertRotation(base.TestCase):
         amphora.id = AMPHORA_ID
 
         session.return_value = session
-        cert_exp_amp_mock.side_effect = [amphora, TestException(
+        cert_exp_amp_mock.side_effect = [[amphora], TestException(
             'break_while')]
 
         cr = house_keeping.CertRotation()
@@ -243,7 +255,7 @@ class TestCertRotation(base.TestCase):
     @mock.patch('octavia.controller.worker.v2.controller_worker.'
                 'ControllerWorker.amphora_cert_rotation')
     @mock.patch('octavia.db.repositories.AmphoraRepository.'
-                'get_cert_expiring_amphora')
+                'get_cert_expiring_amphorae')
     @mock.patch('octavia.db.api.get_session')
     def test_cert_rotation_expired_amphora_without_exception_amphorav2(
             self, session, cert_exp_amp_mock, amp_cert_mock):
@@ -253,7 +265,7 @@ class TestCertRotation(base.TestCase):
         amphora.id = AMPHORA_ID
 
         session.return_value = session
-        cert_exp_amp_mock.side_effect = [amphora, None]
+        cert_exp_amp_mock.side_effect = [[amphora], []]
 
         cr = house_keeping.CertRotation()
 
@@ -263,14 +275,14 @@ class TestCertRotation(base.TestCase):
     @mock.patch('octavia.controller.worker.v2.controller_worker.'
                 'ControllerWorker.amphora_cert_rotation')
     @mock.patch('octavia.db.repositories.AmphoraRepository.'
-                'get_cert_expiring_amphora')
+                'get_cert_expiring_amphorae')
     @mock.patch('octavia.db.api.get_session')
     def test_cert_rotation_non_expired_amphora_amphorav2(
             self, session, cert_exp_amp_mock, amp_cert_mock):
         self.CONF.config(group="api_settings",
                          default_provider_driver='amphorav2')
         session.return_value = session
-        cert_exp_amp_mock.return_value = None
+        cert_exp_amp_mock.return_value = []
         cr = house_keeping.CertRotation()
         cr.rotate()
         self.assertFalse(amp_cert_mock.called)
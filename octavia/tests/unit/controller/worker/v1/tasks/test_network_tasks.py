@@ -25,6 +25,7 @@ from octavia.common import exceptions
 from octavia.controller.worker.v1.tasks import network_tasks
 from octavia.network import base as net_base
 from octavia.network import data_models
+from octavia.network.drivers.neutron import allowed_address_pairs
 from octavia.tests.common import constants as t_constants
 import octavia.tests.unit.base as base
 
@@ -579,9 +580,10 @@ class TestNetworkTasks(base.TestCase):
         mock_driver.reset_mock()
         update_dict[constants.TOPOLOGY] = standby_topology
         net.execute(LB, AMPS_DATA, update_dict)
-        mock_driver.apply_qos_on_port.assert_called_with(
-            t_constants.MOCK_QOS_POLICY_ID1, mock.ANY)
-        self.assertEqual(2, mock_driver.apply_qos_on_port.call_count)
+        self.assertCountEqual(
+            [mock.call(t_constants.MOCK_QOS_POLICY_ID1, amp.vrrp_port_id)
+             for amp in AMPS_DATA],
+            mock_driver.apply_qos_on_port.call_args_list)
 
         # revert
         mock_driver.reset_mock()
@@ -634,9 +636,10 @@ class TestNetworkTasks(base.TestCase):
         tmp_lb.amphorae = AMPS_DATA
         tmp_lb.topology = constants.TOPOLOGY_ACTIVE_STANDBY
         net.execute(tmp_lb, update_dict=update_dict)
-        mock_driver.apply_qos_on_port.assert_called_with(
-            t_constants.MOCK_QOS_POLICY_ID1, mock.ANY)
-        self.assertEqual(2, mock_driver.apply_qos_on_port.call_count)
+        self.assertCountEqual(
+            [mock.call(t_constants.MOCK_QOS_POLICY_ID1, amp.vrrp_port_id)
+             for amp in AMPS_DATA],
+            mock_driver.apply_qos_on_port.call_args_list)
 
         mock_driver.reset_mock()
         update_dict = {'description': 'fool',
@@ -645,9 +648,10 @@ class TestNetworkTasks(base.TestCase):
         tmp_lb.amphorae = AMPS_DATA
         tmp_lb.topology = constants.TOPOLOGY_ACTIVE_STANDBY
         net.execute(tmp_lb, update_dict=update_dict)
-        mock_driver.apply_qos_on_port.assert_called_with(
-            t_constants.MOCK_QOS_POLICY_ID1, mock.ANY)
-        self.assertEqual(2, mock_driver.apply_qos_on_port.call_count)
+        self.assertCountEqual(
+            [mock.call(t_constants.MOCK_QOS_POLICY_ID1, amp.vrrp_port_id)
+             for amp in AMPS_DATA],
+            mock_driver.apply_qos_on_port.call_args_list)
 
         mock_driver.reset_mock()
         update_dict = {}
@@ -682,9 +686,10 @@ class TestNetworkTasks(base.TestCase):
         ori_lb_db.amphorae = [AMPS_DATA[0]]
         mock_get_lb_db.return_value = ori_lb_db
         net.revert(None, tmp_lb, update_dict=update_dict)
-        mock_driver.apply_qos_on_port.assert_called_with(
-            t_constants.MOCK_QOS_POLICY_ID2, mock.ANY)
-        self.assertEqual(2, mock_driver.apply_qos_on_port.call_count)
+        self.assertCountEqual(
+            [mock.call(t_constants.MOCK_QOS_POLICY_ID2, amp.vrrp_port_id)
+             for amp in AMPS_DATA],
+            mock_driver.apply_qos_on_port.call_args_list)
 
     def test_unplug_vip(self, mock_get_net_driver):
         mock_driver = mock.MagicMock()
@@ -911,7 +916,9 @@ class TestNetworkTasks(base.TestCase):
                 'update_progress')
     def test_delete_port(self, mock_update_progress, mock_get_net_driver):
         PORT_ID = uuidutils.generate_uuid()
-        mock_driver = mock.MagicMock()
+        # Autospec the driver so only methods it really has can be called
+        mock_driver = mock.create_autospec(
+            allowed_address_pairs.AllowedAddressPairsDriver, instance=True)
         mock_get_net_driver.return_value = mock_driver
         mock_driver.delete_port.side_effect = [
             mock.DEFAULT, exceptions.OctaviaException('boom'), mock.DEFAULT,
@@ -921,13 +928,16 @@ class TestNetworkTasks(base.TestCase):
             exceptions.OctaviaException('boom'),
             exceptions.OctaviaException('boom'),
             exceptions.OctaviaException('boom')]
-        mock_driver.admin_down_port.side_effect = [
+        mock_driver.set_port_admin_state_up.side_effect = [
             mock.DEFAULT, exceptions.OctaviaException('boom')]
 
         net_task = network_tasks.DeletePort()
 
-        # Limit the retry attempts for the test run to save time
-        net_task.execute.retry.stop = tenacity.stop_after_attempt(2)
+        # Limit the retry attempts and waits for the test run to save time
+        mock.patch.object(net_task.execute.retry, 'wait',
+                          tenacity.wait_none()).start()
+        mock.patch.object(net_task.execute.retry, 'stop',
+                          tenacity.stop_after_attempt(2)).start()
 
         # Test port ID is None (no-op)
         net_task.execute(None)
@@ -963,26 +973,28 @@ class TestNetworkTasks(base.TestCase):
         mock_update_progress.assert_has_calls([mock.call(0.5), mock.call(1.0)])
         mock_driver.delete_port.assert_has_calls([mock.call(PORT_ID),
                                                   mock.call(PORT_ID)])
-        mock_driver.admin_down_port.assert_called_once_with(PORT_ID)
+        mock_driver.set_port_admin_state_up.assert_called_once_with(
+            PORT_ID, False)
 
         # Test passive failure admin down failure
         mock_update_progress.reset_mock()
         mock_driver.reset_mock()
-        mock_driver.admin_down_port.reset_mock()
+        mock_driver.set_port_admin_state_up.reset_mock()
 
         net_task.execute(PORT_ID, passive_failure=True)
 
         mock_update_progress.assert_has_calls([mock.call(0.5), mock.call(1.0)])
         mock_driver.delete_port.assert_has_calls([mock.call(PORT_ID),
                                                   mock.call(PORT_ID)])
-        mock_driver.admin_down_port.assert_called_once_with(PORT_ID)
+        mock_driver.set_port_admin_state_up.assert_called_once_with(
+            PORT_ID, False)
 
         # Test non-passive failure
         mock_update_progress.reset_mock()
         mock_driver.reset_mock()
-        mock_driver.admin_down_port.reset_mock()
+        mock_driver.set_port_admin_state_up.reset_mock()
 
-        mock_driver.admin_down_port.side_effect = [
+        mock_driver.set_port_admin_state_up.side_effect = [
             exceptions.OctaviaException('boom')]
 
         self.assertRaises(exceptions.OctaviaException, net_task.execute,
@@ -991,7 +1003,7 @@ class TestNetworkTasks(base.TestCase):
         mock_update_progress.assert_has_calls([mock.call(0.5), mock.call(1.0)])
         mock_driver.delete_port.assert_has_calls([mock.call(PORT_ID),
                                                   mock.call(PORT_ID)])
-        mock_driver.admin_down_port.assert_not_called()
+        mock_driver.set_port_admin_state_up.assert_not_called()
 
     def test_create_vip_base_port(self, mock_get_net_driver):
         AMP_ID = uuidutils.generate_uuid()
@@ -1019,8 +1031,11 @@ class TestNetworkTasks(base.TestCase):
 
         net_task = network_tasks.CreateVIPBasePort()
 
-        # Limit the retry attempts for the test run to save time
-        net_task.execute.retry.stop = tenacity.stop_after_attempt(2)
+        # Limit the retry attempts and waits for the test run to save time
+        mock.patch.object(net_task.execute.retry, 'wait',
+                          tenacity.wait_none()).start()
+        mock.patch.object(net_task.execute.retry, 'stop',
+                          tenacity.stop_after_attempt(2)).start()
 
         # Test execute
         result = net_task.execute(vip_mock, VIP_SG_ID, AMP_ID)
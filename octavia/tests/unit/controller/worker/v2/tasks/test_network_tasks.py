@@ -12,6 +12,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 #
+import itertools
+import time
+import types
 from unittest import mock
 
 from oslo_config import cfg
@@ -20,13 +23,13 @@ from oslo_utils import uuidutils
 from taskflow.types import failure
 import tenacity
 
-from octavia.api.drivers import utils as provider_utils
 from octavia.common import constants
 from octavia.common import data_models as o_data_models
 from octavia.common import exceptions
 from octavia.controller.worker.v2.tasks import network_tasks
 from octavia.network import base as net_base
 from octavia.network import data_models
+from octavia.network.drivers.neutron import allowed_address_pairs
 from octavia.tests.common import constants as t_constants
 import octavia.tests.unit.base as base
 
@@ -37,6 +40,18 @@ PORT_ID = uuidutils.generate_uuid()
 SUBNET_ID = uuidutils.generate_uuid()
 NETWORK_ID = uuidutils.generate_uuid()
 SG_ID = uuidutils.generate_uuid()
+LB_ID = uuidutils.generate_uuid()
+VRRP_PORT_ID = uuidutils.generate_uuid()
+ADD_NETWORK_ID = uuidutils.generate_uuid()
+DELETE_NETWORK_ID = uuidutils.generate_uuid()
+MEMBER_NETWORK_ID = uuidutils.generate_uuid()
+MEMBER_SUBNET_ID = uuidutils.generate_uuid()
+MEMBER_PORT_ID = uuidutils.generate_uuid()
+AMP_ID = uuidutils.generate_uuid()
+VIP_NETWORK_ID = uuidutils.generate_uuid()
+VIP_QOS_ID = uuidutils.generate_uuid()
+VIP_SG_ID = uuidutils.generate_uuid()
+VIP_SUBNET_ID = uuidutils.generate_uuid()
 IP_ADDRESS = "172.24.41.1"
 VIP = o_data_models.Vip(port_id=t_constants.MOCK_PORT_ID,
                         subnet_id=t_constants.MOCK_SUBNET_ID,
@@ -58,10 +73,43 @@ AMPS_DATA = [o_data_models.Amphora(id=t_constants.MOCK_AMP_ID1,
                                    vrrp_port_id=t_constants.MOCK_VRRP_PORT_ID2,
                                    vrrp_ip=t_constants.MOCK_VRRP_IP2)
              ]
+VIP_DICT = VIP.to_dict()
+AMP_DATA_DICT = AMPS_DATA[0].to_dict()
+# Provider dicts of load balancers with and without a QoS policy on the VIP,
+# with the only keys the ApplyQos task reads
+NULL_QOS_LB_DICT = {constants.LOADBALANCER_ID: LB_ID,
+                    constants.VIP_QOS_POLICY_ID: None}
+PR_TM_DICT = {constants.LOADBALANCER_ID: LB_ID,
+              constants.VIP_QOS_POLICY_ID: t_constants.MOCK_QOS_POLICY_ID1}
 UPDATE_DICT = {constants.TOPOLOGY: None}
+EMPTY_DELTA = {constants.AMPHORA_ID: AMPHORA_ID,
+               constants.COMPUTE_ID: COMPUTE_ID,
+               constants.ADD_NICS: [],
+               constants.DELETE_NICS: []}
+EMPTY_NIC = {constants.ID: None,
+             constants.COMPUTE_ID: None,
+             constants.NETWORK_ID: None,
+             constants.PORT_ID: None,
+             constants.FIXED_IPS: None}
 _session_mock = mock.MagicMock()
 
 
+def _delta(add_networks=(), delete_networks=()):
+    """Return the dict of a delta of the amphora with NICs on the networks."""
+    delta = dict(EMPTY_DELTA)
+    delta[constants.ADD_NICS] = [dict(EMPTY_NIC, network_id=network_id)
+                                 for network_id in add_networks]
+    delta[constants.DELETE_NICS] = [dict(EMPTY_NIC, network_id=network_id)
+                                    for network_id in delete_networks]
+    return delta
+
+
+def _network_driver():
+    """Return a mock of the network driver, restricted to its interface."""
+    return mock.create_autospec(
+        allowed_address_pairs.AllowedAddressPairsDriver, instance=True)
+
+
 class TestException(Exception):
 
     def __init__(self, value):
@@ -101,46 +149,48 @@ class TestNetworkTasks(base.TestCase):
             constants.VIP_QOS_POLICY_ID: t_constants.MOCK_QOS_POLICY_ID1
         }
 
-        conf = oslo_fixture.Config(cfg.CONF)
-        conf.config(group="controller_worker",
-                    amp_boot_network_list=[self.boot_net_id])
-
         super().setUp()
+        # The network driver and the VIP security group IDs are cached for
+        # the whole process, don't share them between the tests.
+        self.addCleanup(setattr, network_tasks.BaseNetworkTask,
+                        '_network_driver', None)
+        self.addCleanup(setattr, network_tasks.GetVIPSecurityGroupID,
+                        '_sg_id_cache', None)
+
+    def test_network_driver_shared(self, mock_get_net_driver):
+        mock_driver = _network_driver()
+        mock_get_net_driver.return_value = mock_driver
+
+        self.assertEqual(mock_driver,
+                         network_tasks.GetPlumbedNetworks().network_driver)
+        self.assertEqual(mock_driver,
+                         network_tasks.PlugNetworks().network_driver)
+        mock_get_net_driver.assert_called_once_with()
 
     @mock.patch('octavia.db.repositories.LoadBalancerRepository.get')
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_calculate_amphora_delta(self, mock_get_session, mock_lb_repo_get,
                                      mock_get_net_driver):
-        LB_ID = uuidutils.generate_uuid()
-        DELETE_NETWORK_ID = uuidutils.generate_uuid()
-        MEMBER_NETWORK_ID = uuidutils.generate_uuid()
-        MEMBER_SUBNET_ID = uuidutils.generate_uuid()
-        VRRP_PORT_ID = uuidutils.generate_uuid()
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
-        member_mock = mock.MagicMock()
-        member_mock.subnet_id = MEMBER_SUBNET_ID
-        pool_mock = mock.MagicMock()
-        pool_mock.members = [member_mock]
-        lb_mock = mock.MagicMock()
-        lb_mock.pools = [pool_mock]
+        member_mock = types.SimpleNamespace(subnet_id=MEMBER_SUBNET_ID)
+        pool_mock = types.SimpleNamespace(members=[member_mock])
+        lb_mock = types.SimpleNamespace(pools=[pool_mock])
         lb_dict = {constants.LOADBALANCER_ID: LB_ID}
         amphora_dict = {constants.ID: AMPHORA_ID,
                         constants.COMPUTE_ID: COMPUTE_ID,
                         constants.VRRP_PORT_ID: VRRP_PORT_ID}
-        vrrp_port_mock = mock.MagicMock()
-        vrrp_port_mock.network_id = self.boot_net_id
+        vrrp_port_mock = types.SimpleNamespace(network_id=self.boot_net_id)
         vrrp_port_dict = {constants.NETWORK_ID: self.boot_net_id}
-        mock_subnet = mock.MagicMock()
-        mock_subnet.network_id = MEMBER_NETWORK_ID
-        nic1_delete_mock = mock.MagicMock()
-        nic1_delete_mock.network_id = DELETE_NETWORK_ID
-        nic2_keep_mock = mock.MagicMock()
-        nic2_keep_mock.network_id = self.boot_net_id
+        mock_subnet = types.SimpleNamespace(id=MEMBER_SUBNET_ID,
+                                            network_id=MEMBER_NETWORK_ID)
+        nic1_delete_mock = types.SimpleNamespace(
+            network_id=DELETE_NETWORK_ID)
+        nic2_keep_mock = types.SimpleNamespace(network_id=self.boot_net_id)
 
         mock_lb_repo_get.return_value = lb_mock
         mock_driver.get_port.return_value = vrrp_port_mock
-        mock_driver.get_subnet.return_value = mock_subnet
+        mock_driver.get_subnets.return_value = [mock_subnet]
         mock_driver.get_plugged_networks.return_value = [nic1_delete_mock,
                                                          nic2_keep_mock]
 
@@ -159,7 +209,7 @@ class TestNetworkTasks(base.TestCase):
             DELETE_NETWORK_ID,
             result[constants.DELETE_NICS][0][constants.NETWORK_ID])
         mock_driver.get_port.assert_called_once_with(VRRP_PORT_ID)
-        mock_driver.get_subnet.assert_called_once_with(MEMBER_SUBNET_ID)
+        mock_driver.get_subnets.assert_called_once_with({MEMBER_SUBNET_ID})
         mock_driver.get_plugged_networks.assert_called_once_with(COMPUTE_ID)
 
         # Test with vrrp_port_id
@@ -178,14 +228,22 @@ class TestNetworkTasks(base.TestCase):
             DELETE_NETWORK_ID,
             result[constants.DELETE_NICS][0][constants.NETWORK_ID])
         mock_driver.get_port.assert_not_called()
-        mock_driver.get_subnet.assert_called_once_with(MEMBER_SUBNET_ID)
+        mock_driver.get_subnets.assert_called_once_with({MEMBER_SUBNET_ID})
         mock_driver.get_plugged_networks.assert_called_once_with(COMPUTE_ID)
 
+        # Test a member on a deleted subnet
+        mock_driver.reset_mock()
+        mock_driver.get_subnets.side_effect = net_base.SubnetNotFound
+
+        self.assertRaises(net_base.SubnetNotFound, calc_amp_delta.execute,
+                          lb_dict, amphora_dict, {}, vrrp_port=vrrp_port_dict)
+        mock_driver.get_plugged_networks.assert_not_called()
+
     @mock.patch('octavia.db.repositories.LoadBalancerRepository.get')
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_calculate_delta(self, mock_get_session, mock_get_lb,
                              mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_lb.return_value = self.db_load_balancer_mock
 
         self.db_amphora_mock.to_dict.return_value = {
@@ -197,11 +255,7 @@ class TestNetworkTasks(base.TestCase):
         mock_driver.get_port.return_value = data_models.Port(
             network_id=self.boot_net_id)
         EMPTY = {}
-        empty_deltas = {self.db_amphora_mock.id: data_models.Delta(
-            amphora_id=AMPHORA_ID,
-            compute_id=COMPUTE_ID,
-            add_nics=[],
-            delete_nics=[]).to_dict(recurse=True)}
+        empty_deltas = {self.db_amphora_mock.id: _delta()}
 
         calc_delta = network_tasks.CalculateDelta()
 
@@ -220,7 +274,7 @@ class TestNetworkTasks(base.TestCase):
         mock_driver.get_plugged_networks.assert_called_once_with(COMPUTE_ID)
 
         # Pool mock should be configured explicitly for each test
-        pool_mock = mock.MagicMock()
+        pool_mock = types.SimpleNamespace()
         self.db_load_balancer_mock.pools = [pool_mock]
 
         # Test with one amp and one pool but no members, nothing plugged
@@ -232,17 +286,12 @@ class TestNetworkTasks(base.TestCase):
         # Test with one amp and one pool and one member, nothing plugged
         # Delta should be one additional subnet to plug
         mock_driver.reset_mock()
-        member_mock = mock.MagicMock()
-        member_mock.subnet_id = 1
+        member_mock = types.SimpleNamespace(subnet_id=1)
         pool_mock.members = [member_mock]
-        mock_driver.get_subnet.return_value = data_models.Subnet(id=2,
-                                                                 network_id=3)
-
-        ndm = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                compute_id=self.db_amphora_mock.compute_id,
-                                add_nics=[
-                                    data_models.Interface(network_id=3)],
-                                delete_nics=[]).to_dict(recurse=True)
+        mock_driver.get_subnets.return_value = [
+            data_models.Subnet(id=1, network_id=3)]
+
+        ndm = _delta(add_networks=[3])
         self.assertEqual({self.db_amphora_mock.id: ndm},
                          calc_delta.execute(self.load_balancer_mock, {}))
 
@@ -250,15 +299,14 @@ class TestNetworkTasks(base.TestCase):
         mock_driver.get_port.assert_has_calls([vrrp_port_call])
         self.assertEqual(1, mock_driver.get_port.call_count)
 
-        member_subnet_call = mock.call(member_mock.subnet_id)
-        mock_driver.get_subnet.assert_has_calls([member_subnet_call])
-        self.assertEqual(1, mock_driver.get_subnet.call_count)
+        mock_driver.get_subnets.assert_called_once_with(
+            {member_mock.subnet_id})
+        mock_driver.get_subnet.assert_not_called()
 
         # Test with one amp and one pool and one member, already plugged
         # Delta should be empty
         mock_driver.reset_mock()
-        member_mock = mock.MagicMock()
-        member_mock.subnet_id = 1
+        member_mock = types.SimpleNamespace(subnet_id=1)
         pool_mock.members = [member_mock]
         mock_driver.get_plugged_networks.return_value = [
             data_models.Interface(network_id=3),
@@ -270,20 +318,13 @@ class TestNetworkTasks(base.TestCase):
         # Test with one amp and one pool and one member, wrong network plugged
         # Delta should be one network to add and one to remove
         mock_driver.reset_mock()
-        member_mock = mock.MagicMock()
-        member_mock.subnet_id = 1
+        member_mock = types.SimpleNamespace(subnet_id=1)
         pool_mock.members = [member_mock]
         mock_driver.get_plugged_networks.return_value = [
             data_models.Interface(network_id=2),
             data_models.Interface(network_id=self.boot_net_id)]
 
-        ndm = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                compute_id=self.db_amphora_mock.compute_id,
-                                add_nics=[
-                                    data_models.Interface(network_id=3)],
-                                delete_nics=[
-                                    data_models.Interface(network_id=2)]
-                                ).to_dict(recurse=True)
+        ndm = _delta(add_networks=[3], delete_networks=[2])
         self.assertEqual({self.db_amphora_mock.id: ndm},
                          calc_delta.execute(self.load_balancer_mock, {}))
 
@@ -296,17 +337,111 @@ class TestNetworkTasks(base.TestCase):
             data_models.Interface(network_id=self.boot_net_id)
         ]
 
-        ndm = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                compute_id=self.db_amphora_mock.compute_id,
-                                add_nics=[],
-                                delete_nics=[
-                                    data_models.Interface(network_id=2)]
-                                ).to_dict(recurse=True)
+        ndm = _delta(delete_networks=[2])
         self.assertEqual({self.db_amphora_mock.id: ndm},
                          calc_delta.execute(self.load_balancer_mock, {}))
 
+    @mock.patch('octavia.db.repositories.LoadBalancerRepository.get')
+    @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
+    def test_calculate_delta_shares_lookups(self, mock_get_session,
+                                            mock_get_lb, mock_get_net_driver):
+        MEMBER_NETWORK_ID = uuidutils.generate_uuid()
+        MEMBER_SUBNET_ID = uuidutils.generate_uuid()
+        mock_driver = _network_driver()
+        mock_get_net_driver.return_value = mock_driver
+        mock_get_lb.return_value = self.db_load_balancer_mock
+
+        amphorae = []
+        for amp_id in (AMPHORA_ID, AMPHORA_ID + 1):
+            amp_mock = mock.MagicMock()
+            amp_mock.id = amp_id
+            amp_mock.status = constants.AMPHORA_ALLOCATED
+            amp_mock.to_dict.return_value = {
+                constants.ID: amp_id, constants.COMPUTE_ID: COMPUTE_ID,
+                constants.VRRP_PORT_ID: PORT_ID}
+            amphorae.append(amp_mock)
+        member_mock = mock.MagicMock()
+        member_mock.subnet_id = MEMBER_SUBNET_ID
+        pool_mock = mock.MagicMock()
+        pool_mock.members = [member_mock]
+        self.db_load_balancer_mock.amphorae = amphorae
+        self.db_load_balancer_mock.pools = [pool_mock]
+        mock_driver.get_plugged_networks.return_value = [
+            data_models.Interface(network_id=self.boot_net_id)]
+        mock_driver.get_port.return_value = data_models.Port(
+            network_id=self.boot_net_id)
+        mock_driver.get_subnets.return_value = [
+            data_models.Subnet(id=MEMBER_SUBNET_ID,
+                               network_id=MEMBER_NETWORK_ID)]
+
+        calc_delta = network_tasks.CalculateDelta()
+        deltas = calc_delta.execute(self.load_balancer_mock, {})
+
+        self.assertEqual({AMPHORA_ID, AMPHORA_ID + 1}, set(deltas))
+        for delta in deltas.values():
+            self.assertEqual(
+                [MEMBER_NETWORK_ID],
+                [nic[constants.NETWORK_ID]
+                 for nic in delta[constants.ADD_NICS]])
+        mock_driver.get_port.assert_called_once_with(PORT_ID)
+        mock_driver.get_subnets.assert_called_once_with({MEMBER_SUBNET_ID})
+        self.assertEqual(2, mock_driver.get_plugged_networks.call_count)
+
+    @mock.patch('octavia.db.repositories.LoadBalancerRepository.get')
+    def test_calculate_amphora_delta_pool_network_ids(self, mock_get_lb,
+                                                      mock_get_net_driver):
+        MEMBER_NETWORK_ID = uuidutils.generate_uuid()
+        mock_driver = _network_driver()
+        mock_get_net_driver.return_value = mock_driver
+        mock_driver.get_plugged_networks.return_value = [
+            data_models.Interface(network_id=self.boot_net_id)]
+        vrrp_port = {constants.NETWORK_ID: self.boot_net_id}
+
+        calc_amp_delta = network_tasks.CalculateAmphoraDelta()
+        delta = calc_amp_delta.execute(self.load_balancer_mock,
+                                       self.amphora_mock, {},
+                                       vrrp_port=vrrp_port,
+                                       pool_network_ids={MEMBER_NETWORK_ID})
+
+        self.assertEqual(
+            [MEMBER_NETWORK_ID],
+            [nic[constants.NETWORK_ID] for nic in delta[constants.ADD_NICS]])
+        mock_get_lb.assert_not_called()
+        mock_driver.get_subnets.assert_not_called()
+
+        # Nothing to change
+        mock_driver.get_plugged_networks.return_value = [
+            data_models.Interface(network_id=self.boot_net_id),
+            data_models.Interface(network_id=MEMBER_NETWORK_ID)]
+        delta = calc_amp_delta.execute(self.load_balancer_mock,
+                                       self.amphora_mock, {},
+                                       vrrp_port=vrrp_port,
+                                       pool_network_ids={MEMBER_NETWORK_ID})
+        self.assertEqual([], delta[constants.ADD_NICS])
+        self.assertEqual([], delta[constants.DELETE_NICS])
+
+        # An availability zone without a management network uses the
+        # configured boot networks
+        delta = calc_amp_delta.execute(
+            self.load_balancer_mock, self.amphora_mock,
+            {constants.COMPUTE_ZONE: 'az1'}, vrrp_port=vrrp_port,
+            pool_network_ids={MEMBER_NETWORK_ID})
+        self.assertEqual([], delta[constants.ADD_NICS])
+        self.assertEqual([], delta[constants.DELETE_NICS])
+
+        # An availability zone management network replaces them
+        AZ_NETWORK_ID = uuidutils.generate_uuid()
+        delta = calc_amp_delta.execute(
+            self.load_balancer_mock, self.amphora_mock,
+            {constants.MANAGEMENT_NETWORK: AZ_NETWORK_ID},
+            vrrp_port=vrrp_port, pool_network_ids={MEMBER_NETWORK_ID})
+        self.assertEqual(
+            [AZ_NETWORK_ID],
+            [nic[constants.NETWORK_ID] for nic in delta[constants.ADD_NICS]])
+        self.assertEqual([], delta[constants.DELETE_NICS])
+
     def test_get_plumbed_networks(self, mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
         mock_driver.get_plugged_networks.side_effect = [['blah']]
         net = network_tasks.GetPlumbedNetworks()
@@ -316,28 +451,19 @@ class TestNetworkTasks(base.TestCase):
             COMPUTE_ID)
 
     def test_plug_networks(self, mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
 
-        def _interface(network_id):
-            return [data_models.Interface(network_id=network_id)]
-
         net = network_tasks.PlugNetworks()
 
         net.execute(self.amphora_mock, None)
         self.assertFalse(mock_driver.plug_network.called)
 
-        delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                  compute_id=self.db_amphora_mock.compute_id,
-                                  add_nics=[],
-                                  delete_nics=[]).to_dict(recurse=True)
+        delta = _delta()
         net.execute(self.amphora_mock, delta)
         self.assertFalse(mock_driver.plug_network.called)
 
-        delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                  compute_id=self.db_amphora_mock.compute_id,
-                                  add_nics=_interface(1),
-                                  delete_nics=[]).to_dict(recurse=True)
+        delta = _delta(add_networks=[1])
         net.execute(self.amphora_mock, delta)
         mock_driver.plug_network.assert_called_once_with(COMPUTE_ID, 1)
 
@@ -345,17 +471,11 @@ class TestNetworkTasks(base.TestCase):
         net.revert(self.amphora_mock, None)
         self.assertFalse(mock_driver.unplug_network.called)
 
-        delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                  compute_id=self.db_amphora_mock.compute_id,
-                                  add_nics=[],
-                                  delete_nics=[]).to_dict(recurse=True)
+        delta = _delta()
         net.revert(self.amphora_mock, delta)
         self.assertFalse(mock_driver.unplug_network.called)
 
-        delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                  compute_id=self.db_amphora_mock.compute_id,
-                                  add_nics=_interface(1),
-                                  delete_nics=[]).to_dict(recurse=True)
+        delta = _delta(add_networks=[1])
         net.revert(self.amphora_mock, delta)
         mock_driver.unplug_network.assert_called_once_with(COMPUTE_ID, 1)
 
@@ -372,30 +492,30 @@ class TestNetworkTasks(base.TestCase):
                           delta)
         mock_driver.unplug_network.assert_called_once_with(COMPUTE_ID, 1)
 
+        # Every nic is plugged even if one of them fails
+        mock_driver.reset_mock()
+        mock_driver.plug_network.side_effect = [TestException('test'), None]
+        delta = _delta(add_networks=[1, 2])
+        self.assertRaises(TestException, net.execute, self.amphora_mock,
+                          delta)
+        mock_driver.plug_network.assert_has_calls(
+            [mock.call(COMPUTE_ID, 1), mock.call(COMPUTE_ID, 2)],
+            any_order=True)
+
     def test_unplug_networks(self, mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
 
-        def _interface(network_id):
-            return [data_models.Interface(network_id=network_id)]
-
         net = network_tasks.UnPlugNetworks()
 
         net.execute(self.db_amphora_mock, None)
         self.assertFalse(mock_driver.unplug_network.called)
 
-        delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                  compute_id=self.db_amphora_mock.compute_id,
-                                  add_nics=[],
-                                  delete_nics=[]).to_dict(recurse=True)
+        delta = _delta()
         net.execute(self.amphora_mock, delta)
         self.assertFalse(mock_driver.unplug_network.called)
 
-        delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                  compute_id=self.db_amphora_mock.compute_id,
-                                  add_nics=[],
-                                  delete_nics=_interface(1)
-                                  ).to_dict(recurse=True)
+        delta = _delta(delete_networks=[1])
         net.execute(self.amphora_mock, delta)
         mock_driver.unplug_network.assert_called_once_with(COMPUTE_ID, 1)
 
@@ -411,7 +531,7 @@ class TestNetworkTasks(base.TestCase):
         mock_driver.unplug_network.assert_called_once_with(COMPUTE_ID, 1)
 
     def test_get_member_ports(self, mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
 
         def _interface(port_id):
@@ -425,11 +545,15 @@ class TestNetworkTasks(base.TestCase):
         mock_driver.reset_mock()
         net_task = network_tasks.GetMemberPorts()
         mock_driver.get_plugged_networks.return_value = _interface(1)
-        mock_driver.get_port.side_effect = [
-            data_models.Port(network_id=NETWORK_ID),
+        mock_driver.get_port.return_value = data_models.Port(
+            network_id=NETWORK_ID)
+        mock_driver.get_ports.return_value = [
             data_models.Port(network_id=NETWORK_ID)]
-        net_task.execute(self.load_balancer_mock, self.amphora_mock)
-        self.assertEqual(2, mock_driver.get_port.call_count)
+        ports = net_task.execute(self.load_balancer_mock, self.amphora_mock)
+        self.assertEqual([], ports)
+        mock_driver.get_port.assert_called_once_with(t_constants.MOCK_PORT_ID)
+        mock_driver.get_ports.assert_called_once_with([1])
+        mock_driver.get_networks.assert_called_once_with(set())
         self.assertFalse(mock_driver.get_network.called)
 
         mock_driver.reset_mock()
@@ -437,33 +561,52 @@ class TestNetworkTasks(base.TestCase):
         fixed_ip_mock = mock.MagicMock()
         fixed_ip_mock.subnet_id = 1
         port_mock.fixed_ips = [fixed_ip_mock]
+        network = data_models.Network(id=port_mock.network_id)
+        subnet = data_models.Subnet(id=1)
         net_task = network_tasks.GetMemberPorts()
         mock_driver.get_plugged_networks.return_value = _interface(1)
-        mock_driver.get_port.side_effect = [
-            data_models.Port(network_id=NETWORK_ID), port_mock]
+        mock_driver.get_ports.return_value = [port_mock]
+        mock_driver.get_networks.return_value = [network]
+        mock_driver.get_subnets.return_value = [subnet]
         ports = net_task.execute(self.load_balancer_mock, self.amphora_mock)
-        mock_driver.get_subnet.assert_called_once_with(1)
+        mock_driver.get_subnets.assert_called_once_with({1})
+        mock_driver.get_subnet.assert_not_called()
         self.assertEqual([port_mock], ports)
+        self.assertIs(network, port_mock.network)
+        self.assertIs(subnet, fixed_ip_mock.subnet)
+
+        # The port holding the management IP is not a member port
+        mock_driver.reset_mock()
+        fixed_ip_mock.ip_address = IP_ADDRESS
+        ports = net_task.execute(self.load_balancer_mock, self.amphora_mock)
+        self.assertEqual([], ports)
 
     def test_handle_network_delta(self, mock_get_net_driver):
-        mock_net_driver = mock.MagicMock()
+        mock_net_driver = _network_driver()
         self.db_amphora_mock.to_dict.return_value = {
             constants.ID: AMPHORA_ID, constants.COMPUTE_ID: COMPUTE_ID}
         mock_get_net_driver.return_value = mock_net_driver
 
         nic1 = data_models.Interface()
-        nic1.network_id = uuidutils.generate_uuid()
+        nic1.network_id = ADD_NETWORK_ID
         nic2 = data_models.Interface()
-        nic2.network_id = uuidutils.generate_uuid()
+        nic2.network_id = DELETE_NETWORK_ID
         interface1 = mock.MagicMock()
-        interface1.port_id = uuidutils.generate_uuid()
+        interface1.port_id = MEMBER_PORT_ID
         port1 = mock.MagicMock()
-        port1.network_id = uuidutils.generate_uuid()
+        port1.network_id = MEMBER_NETWORK_ID
         fixed_ip = mock.MagicMock()
-        fixed_ip.subnet_id = uuidutils.generate_uuid()
+        fixed_ip.subnet_id = MEMBER_SUBNET_ID
         port1.fixed_ips = [fixed_ip]
+        port1_dict = {constants.ID: MEMBER_PORT_ID,
+                      constants.NETWORK_ID: MEMBER_NETWORK_ID,
+                      constants.FIXED_IPS: [
+                          {constants.SUBNET_ID: MEMBER_SUBNET_ID}]}
+        port1.to_dict.return_value = port1_dict
         subnet = mock.MagicMock()
+        subnet.id = fixed_ip.subnet_id
         network = mock.MagicMock()
+        network.id = port1.network_id
 
         delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
                                   compute_id=self.db_amphora_mock.compute_id,
@@ -473,8 +616,8 @@ class TestNetworkTasks(base.TestCase):
 
         mock_net_driver.plug_network.return_value = interface1
         mock_net_driver.get_port.return_value = port1
-        mock_net_driver.get_network.return_value = network
-        mock_net_driver.get_subnet.return_value = subnet
+        mock_net_driver.get_networks.return_value = [network]
+        mock_net_driver.get_subnets.return_value = [subnet]
 
         mock_net_driver.unplug_network.side_effect = [
             None, net_base.NetworkNotFound, Exception]
@@ -486,10 +629,15 @@ class TestNetworkTasks(base.TestCase):
         mock_net_driver.plug_network.assert_called_once_with(
             self.db_amphora_mock.compute_id, nic1.network_id)
         mock_net_driver.get_port.assert_called_once_with(interface1.port_id)
-        mock_net_driver.get_network.assert_called_once_with(port1.network_id)
-        mock_net_driver.get_subnet.assert_called_once_with(fixed_ip.subnet_id)
+        mock_net_driver.get_networks.assert_called_once_with(
+            {port1.network_id})
+        mock_net_driver.get_subnets.assert_called_once_with(
+            {fixed_ip.subnet_id})
+        self.assertEqual(network, port1.network)
+        self.assertEqual(subnet, fixed_ip.subnet)
 
-        self.assertEqual({self.db_amphora_mock.id: [port1.to_dict()]}, result)
+        port1.to_dict.assert_called_once_with(recurse=True)
+        self.assertEqual({self.db_amphora_mock.id: [port1_dict]}, result)
 
         mock_net_driver.unplug_network.assert_called_with(
             self.db_amphora_mock.compute_id, nic2.network_id)
@@ -514,117 +662,144 @@ class TestNetworkTasks(base.TestCase):
         handle_net_delta_obj.revert(None, None, delta2)
 
     def test_handle_network_deltas(self, mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         self.db_amphora_mock.to_dict.return_value = {
             constants.ID: AMPHORA_ID, constants.COMPUTE_ID: COMPUTE_ID}
         mock_get_net_driver.return_value = mock_driver
-
-        def _interface(network_id):
-            return [data_models.Interface(network_id=network_id)]
+        mock_driver.get_port.return_value = data_models.Port(
+            id=PORT_ID, network_id=1, fixed_ips=[])
+        mock_driver.get_networks.return_value = [data_models.Network(id=1)]
+        mock_driver.get_subnets.return_value = []
 
         net = network_tasks.HandleNetworkDeltas()
-
-        net.execute({})
-        self.assertFalse(mock_driver.plug_network.called)
-
-        delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                  compute_id=self.db_amphora_mock.compute_id,
-                                  add_nics=[],
-                                  delete_nics=[]).to_dict(recurse=True)
-        net.execute({self.db_amphora_mock.id: delta})
-        self.assertFalse(mock_driver.plug_network.called)
-
-        delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                  compute_id=self.db_amphora_mock.compute_id,
-                                  add_nics=_interface(1),
-                                  delete_nics=[]).to_dict(recurse=True)
-        net.execute({self.db_amphora_mock.id: delta})
-        mock_driver.plug_network.assert_called_once_with(COMPUTE_ID, 1)
+        add_deltas = {self.db_amphora_mock.id: _delta(add_networks=[1])}
+        delete_deltas = {self.db_amphora_mock.id: _delta(delete_networks=[1])}
+
+        # Deltas with the expected plug_network and unplug_network calls
+        scenarios = [
+            ({}, [], []),
+            ({self.db_amphora_mock.id: _delta()}, [], []),
+            (add_deltas, [mock.call(COMPUTE_ID, 1)], []),
+            (delete_deltas, [], [mock.call(COMPUTE_ID, 1)]),
+        ]
+        for deltas, plug_calls, unplug_calls in scenarios:
+            mock_driver.reset_mock()
+            net.execute(deltas)
+            self.assertEqual(plug_calls,
+                             mock_driver.plug_network.call_args_list)
+            self.assertEqual(unplug_calls,
+                             mock_driver.unplug_network.call_args_list)
+
+        # Unplug failures are ignored, do a test with a general exception
+        # in case behavior changes
+        for side_effect in (net_base.NetworkNotFound, Exception()):
+            mock_driver.reset_mock()
+            mock_driver.unplug_network.side_effect = side_effect
+            net.execute(delete_deltas)
+            mock_driver.unplug_network.assert_called_once_with(COMPUTE_ID, 1)
 
         # revert
-        net.execute({self.db_amphora_mock.id: delta})
-        self.assertFalse(mock_driver.unplug_network.called)
-
-        delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                  compute_id=self.db_amphora_mock.compute_id,
-                                  add_nics=[],
-                                  delete_nics=[]).to_dict(recurse=True)
-        net.execute({self.db_amphora_mock.id: delta})
-        self.assertFalse(mock_driver.unplug_network.called)
-
-        delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                  compute_id=self.db_amphora_mock.compute_id,
-                                  add_nics=_interface(1),
-                                  delete_nics=[]).to_dict(recurse=True)
-
-        mock_driver.reset_mock()
-        mock_driver.unplug_network.side_effect = net_base.NetworkNotFound
-
         mock_driver.reset_mock()
         mock_driver.unplug_network.side_effect = TestException('test')
-        self.assertRaises(TestException, net.revert, mock.ANY,
-                          {self.db_amphora_mock.id: delta})
+        self.assertRaises(TestException, net.revert, mock.ANY, add_deltas)
         mock_driver.unplug_network.assert_called_once_with(COMPUTE_ID, 1)
 
-        mock_driver.reset_mock()
-        net.execute({})
-        self.assertFalse(mock_driver.unplug_network.called)
-
-        delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                  compute_id=self.db_amphora_mock.compute_id,
-                                  add_nics=[],
-                                  delete_nics=[]).to_dict(recurse=True)
-        net.execute({self.db_amphora_mock.id: delta})
-        self.assertFalse(mock_driver.unplug_network.called)
-
-        delta = data_models.Delta(amphora_id=self.db_amphora_mock.id,
-                                  compute_id=self.db_amphora_mock.compute_id,
-                                  add_nics=[],
-                                  delete_nics=_interface(1)
-                                  ).to_dict(recurse=True)
-        net.execute({self.db_amphora_mock.id: delta})
-        mock_driver.unplug_network.assert_called_once_with(COMPUTE_ID, 1)
-
-        mock_driver.reset_mock()
-        mock_driver.unplug_network.side_effect = net_base.NetworkNotFound
-        net.execute({self.db_amphora_mock.id: delta})
-        mock_driver.unplug_network.assert_called_once_with(COMPUTE_ID, 1)
+    def test_handle_network_deltas_multiple_amphorae(self,
+                                                     mock_get_net_driver):
+        mock_driver = _network_driver()
+        mock_get_net_driver.return_value = mock_driver
+        AMP_ID2 = uuidutils.generate_uuid()
+        COMPUTE_ID2 = uuidutils.generate_uuid()
+        NETWORK_ID2 = uuidutils.generate_uuid()
+        SUBNET_ID2 = uuidutils.generate_uuid()
+
+        def _plug_network(compute_id, network_id):
+            return data_models.Interface(compute_id=compute_id,
+                                         network_id=network_id,
+                                         port_id=compute_id)
+
+        def _get_port(port_id):
+            return data_models.Port(
+                id=port_id, network_id=NETWORK_ID2,
+                fixed_ips=[data_models.FixedIP(subnet_id=SUBNET_ID2)])
+
+        mock_driver.plug_network.side_effect = _plug_network
+        mock_driver.get_port.side_effect = _get_port
+        mock_driver.get_networks.return_value = [
+            data_models.Network(id=NETWORK_ID2)]
+        mock_driver.get_subnets.return_value = [
+            data_models.Subnet(id=SUBNET_ID2, network_id=NETWORK_ID2)]
+        deltas = {
+            AMPHORA_ID: data_models.Delta(
+                amphora_id=AMPHORA_ID, compute_id=COMPUTE_ID,
+                add_nics=[data_models.Interface(network_id=NETWORK_ID2)],
+                delete_nics=[]).to_dict(recurse=True),
+            AMP_ID2: data_models.Delta(
+                amphora_id=AMP_ID2, compute_id=COMPUTE_ID2,
+                add_nics=[data_models.Interface(network_id=NETWORK_ID2)],
+                delete_nics=[]).to_dict(recurse=True)}
 
-        # Do a test with a general exception in case behavior changes
-        mock_driver.reset_mock()
-        mock_driver.unplug_network.side_effect = Exception()
-        net.execute({self.db_amphora_mock.id: delta})
-        mock_driver.unplug_network.assert_called_once_with(COMPUTE_ID, 1)
+        net = network_tasks.HandleNetworkDeltas()
+        result = net.execute(deltas)
+
+        self.assertEqual({AMPHORA_ID, AMP_ID2}, set(result))
+        self.assertEqual(COMPUTE_ID, result[AMPHORA_ID][0][constants.ID])
+        self.assertEqual(COMPUTE_ID2, result[AMP_ID2][0][constants.ID])
+        for ports in result.values():
+            self.assertEqual(NETWORK_ID2, ports[0]['network'][constants.ID])
+            self.assertEqual(
+                SUBNET_ID2, ports[0]['fixed_ips'][0]['subnet'][constants.ID])
+        mock_driver.plug_network.assert_has_calls(
+            [mock.call(COMPUTE_ID, NETWORK_ID2),
+             mock.call(COMPUTE_ID2, NETWORK_ID2)], any_order=True)
+        self.assertEqual(2, mock_driver.get_networks.call_count)
+        self.assertEqual(2, mock_driver.get_subnets.call_count)
+        mock_driver.get_network.assert_not_called()
+        mock_driver.get_subnet.assert_not_called()
 
     @mock.patch('octavia.db.repositories.LoadBalancerRepository.get')
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_plug_vip(self, mock_get_session, mock_get_lb,
                       mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
-        LB.amphorae = AMPS_DATA
-        mock_get_lb.return_value = LB
-        LB.amphorae = AMPS_DATA
+        lb = o_data_models.LoadBalancer(vip=VIP, amphorae=AMPS_DATA)
+        mock_get_lb.return_value = lb
         net = network_tasks.PlugVIP()
         amp = mock.MagicMock()
         amp.to_dict.return_value = 'vip'
         mock_driver.plug_vip.return_value = [amp]
 
         data = net.execute(self.load_balancer_mock)
-        mock_driver.plug_vip.assert_called_once_with(LB, LB.vip)
+        mock_driver.plug_vip.assert_called_once_with(lb, lb.vip)
         self.assertEqual(["vip"], data)
 
         # revert
         net.revert([o_data_models.Amphora().to_dict()],
                    self.load_balancer_mock)
-        mock_driver.unplug_vip.assert_called_once_with(LB, LB.vip)
+        mock_driver.unplug_vip.assert_called_once_with(lb, lb.vip)
+
+        # revert updates the port IDs of the matching amphora
+        mock_driver.reset_mock()
+        amp1 = o_data_models.Amphora(id=t_constants.MOCK_AMP_ID1)
+        amp2 = o_data_models.Amphora(id=t_constants.MOCK_AMP_ID2)
+        mock_get_lb.return_value = o_data_models.LoadBalancer(
+            vip=VIP, amphorae=[amp1, amp2])
+        net.revert([o_data_models.Amphora(
+            id=t_constants.MOCK_AMP_ID2, vrrp_port_id=PORT_ID,
+            ha_port_id=t_constants.MOCK_PORT_ID2).to_dict()],
+            self.load_balancer_mock)
+        self.assertIsNone(amp1.vrrp_port_id)
+        self.assertEqual(PORT_ID, amp2.vrrp_port_id)
+        self.assertEqual(t_constants.MOCK_PORT_ID2, amp2.ha_port_id)
+        mock_get_lb.return_value = lb
 
         # revert with exception
         mock_driver.reset_mock()
         mock_driver.unplug_vip.side_effect = Exception('UnplugVipException')
         net.revert([o_data_models.Amphora().to_dict()],
                    self.load_balancer_mock)
-        mock_driver.unplug_vip.assert_called_once_with(LB, LB.vip)
+        mock_driver.unplug_vip.assert_called_once_with(lb, lb.vip)
 
     @mock.patch('octavia.controller.worker.task_utils.TaskUtils.'
                 'get_current_loadbalancer_from_db')
@@ -632,30 +807,40 @@ class TestNetworkTasks(base.TestCase):
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_apply_qos_on_creation(self, mock_get_session, mock_get_lb,
                                    mock_get_lb_db, mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
         net = network_tasks.ApplyQos()
         mock_get_lb_db.return_value = LB
         mock_get_lb.return_value = LB
 
         # execute
-        UPDATE_DICT[constants.TOPOLOGY] = constants.TOPOLOGY_SINGLE
-        update_dict = UPDATE_DICT
+        update_dict = dict(UPDATE_DICT)
+        update_dict[constants.TOPOLOGY] = constants.TOPOLOGY_SINGLE
         net.execute(self.load_balancer_mock, [AMPS_DATA[0]], update_dict)
         mock_driver.apply_qos_on_port.assert_called_once_with(
             VIP.qos_policy_id, AMPS_DATA[0].vrrp_port_id)
-        self.assertEqual(1, mock_driver.apply_qos_on_port.call_count)
         standby_topology = constants.TOPOLOGY_ACTIVE_STANDBY
         mock_driver.reset_mock()
         update_dict[constants.TOPOLOGY] = standby_topology
         net.execute(self.load_balancer_mock, AMPS_DATA, update_dict)
-        mock_driver.apply_qos_on_port.assert_called_with(
-            t_constants.MOCK_QOS_POLICY_ID1, mock.ANY)
-        self.assertEqual(2, mock_driver.apply_qos_on_port.call_count)
+        self.assertCountEqual(
+            [mock.call(t_constants.MOCK_QOS_POLICY_ID1, amp.vrrp_port_id)
+             for amp in AMPS_DATA],
+            mock_driver.apply_qos_on_port.call_args_list)
+
+        # The policy is applied on every port even if one of them fails
+        mock_driver.reset_mock()
+        mock_driver.apply_qos_on_port.side_effect = [TestException('test'),
+                                                     None]
+        self.assertRaises(TestException, net.execute,
+                          self.load_balancer_mock, AMPS_DATA, update_dict)
+        mock_driver.apply_qos_on_port.assert_has_calls(
+            [mock.call(VIP.qos_policy_id, amp.vrrp_port_id)
+             for amp in AMPS_DATA], any_order=True)
+        mock_driver.apply_qos_on_port.side_effect = None
 
         # revert
         mock_driver.reset_mock()
-        update_dict = UPDATE_DICT
         net.revert(None, self.load_balancer_mock, [AMPS_DATA[0]], update_dict)
         self.assertEqual(0, mock_driver.apply_qos_on_port.call_count)
         mock_driver.reset_mock()
@@ -669,113 +854,101 @@ class TestNetworkTasks(base.TestCase):
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_apply_qos_on_update(self, mock_get_session, mock_get_lb,
                                  mock_get_lb_db, mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
         net = network_tasks.ApplyQos()
-        null_qos_vip = o_data_models.Vip(qos_policy_id=None)
         null_qos_lb = o_data_models.LoadBalancer(
-            vip=null_qos_vip, topology=constants.TOPOLOGY_SINGLE,
-            amphorae=[AMPS_DATA[0]])
-        null_qos_lb_dict = (
-            provider_utils.db_loadbalancer_to_provider_loadbalancer(
-                null_qos_lb).to_dict())
-
-        tmp_vip_object = o_data_models.Vip(
+            vip=o_data_models.Vip(qos_policy_id=None),
+            topology=constants.TOPOLOGY_SINGLE, amphorae=[AMPS_DATA[0]])
+        qos_vip = o_data_models.Vip(
             qos_policy_id=t_constants.MOCK_QOS_POLICY_ID1)
-        tmp_lb = o_data_models.LoadBalancer(
-            vip=tmp_vip_object, topology=constants.TOPOLOGY_SINGLE,
+        qos_lb = o_data_models.LoadBalancer(
+            vip=qos_vip, topology=constants.TOPOLOGY_SINGLE,
             amphorae=[AMPS_DATA[0]])
-        pr_tm_dict = provider_utils.db_loadbalancer_to_provider_loadbalancer(
-            tmp_lb).to_dict()
-        mock_get_lb.return_value = tmp_lb
-        # execute
-        update_dict = {'description': 'fool'}
-        net.execute(pr_tm_dict, update_dict=update_dict)
+        qos_act_stdby_lb = o_data_models.LoadBalancer(
+            vip=qos_vip, topology=constants.TOPOLOGY_ACTIVE_STANDBY,
+            amphorae=AMPS_DATA)
+        qos_calls = [mock.call(t_constants.MOCK_QOS_POLICY_ID1,
+                               amp.vrrp_port_id) for amp in AMPS_DATA]
+
+        # execute, with the load balancer in the database, its provider
+        # dict, the update and the expected apply_qos_on_port calls
+        scenarios = [
+            (qos_lb, PR_TM_DICT, {'description': 'fool'}, qos_calls[:1]),
+            (null_qos_lb, NULL_QOS_LB_DICT, {'vip': {'qos_policy_id': None}},
+             [mock.call(None, AMPS_DATA[0].vrrp_port_id)]),
+            (null_qos_lb, NULL_QOS_LB_DICT, {'name': '123'}, []),
+            (qos_act_stdby_lb, PR_TM_DICT, {'description': 'fool'},
+             qos_calls),
+            (qos_act_stdby_lb, PR_TM_DICT,
+             {'description': 'fool',
+              'vip': {'qos_policy_id': t_constants.MOCK_QOS_POLICY_ID1}},
+             qos_calls),
+            (null_qos_lb, NULL_QOS_LB_DICT, {}, []),
+        ]
+        for db_lb, lb_dict, update_dict, calls in scenarios:
+            with self.subTest(update_dict=update_dict):
+                mock_driver.reset_mock()
+                mock_get_lb.return_value = db_lb
+                net.execute(lb_dict, update_dict=update_dict)
+                self.assertCountEqual(
+                    calls, mock_driver.apply_qos_on_port.call_args_list)
+
+        # revert, with the original load balancer in the database, the
+        # provider dict, the update and the expected apply_qos_on_port
+        # calls on the amphorae of the load balancer
+        ori_lb = o_data_models.LoadBalancer(vip=VIP2,
+                                            amphorae=[AMPS_DATA[0]])
+        ori_qos_call = mock.call(t_constants.MOCK_QOS_POLICY_ID2,
+                                 AMPS_DATA[0].vrrp_port_id)
+        mock_get_lb.return_value = null_qos_lb
+        scenarios = [
+            (qos_lb, PR_TM_DICT, {'description': 'fool'}, []),
+            (ori_lb, NULL_QOS_LB_DICT, {'vip': {'qos_policy_id': None}},
+             [ori_qos_call]),
+            (ori_lb, PR_TM_DICT,
+             {'vip': {'qos_policy_id': t_constants.MOCK_QOS_POLICY_ID2}},
+             [ori_qos_call]),
+        ]
+        for ori_db_lb, lb_dict, update_dict, calls in scenarios:
+            with self.subTest(revert_update_dict=update_dict):
+                mock_driver.reset_mock()
+                mock_get_lb_db.return_value = ori_db_lb
+                net.revert(None, lb_dict, update_dict=update_dict)
+                self.assertEqual(
+                    calls, mock_driver.apply_qos_on_port.call_args_list)
+
+    def test_apply_qos_amphora(self, mock_get_net_driver):
+        mock_driver = _network_driver()
+        mock_get_net_driver.return_value = mock_driver
+        net = network_tasks.ApplyQosAmphora()
+        amp_data = AMP_DATA_DICT
+        qos_lb_dict = {'vip_qos_policy_id': t_constants.MOCK_QOS_POLICY_ID1}
+        null_qos_lb_dict = {'vip_qos_policy_id': None}
+
+        net.execute(qos_lb_dict, amp_data, {})
         mock_driver.apply_qos_on_port.assert_called_once_with(
             t_constants.MOCK_QOS_POLICY_ID1, AMPS_DATA[0].vrrp_port_id)
-        self.assertEqual(1, mock_driver.apply_qos_on_port.call_count)
 
+        # Removing the QoS policy from the VIP
         mock_driver.reset_mock()
-        mock_get_lb.reset_mock()
-        mock_get_lb.return_value = null_qos_lb
-        update_dict = {'vip': {'qos_policy_id': None}}
-        net.execute(null_qos_lb_dict, update_dict=update_dict)
+        net.execute(null_qos_lb_dict, amp_data,
+                    {constants.VIP: {constants.QOS_POLICY_ID: None}})
         mock_driver.apply_qos_on_port.assert_called_once_with(
             None, AMPS_DATA[0].vrrp_port_id)
-        self.assertEqual(1, mock_driver.apply_qos_on_port.call_count)
-
-        mock_driver.reset_mock()
-        update_dict = {'name': '123'}
-        net.execute(null_qos_lb_dict, update_dict=update_dict)
-        self.assertEqual(0, mock_driver.apply_qos_on_port.call_count)
-
-        mock_driver.reset_mock()
-        mock_get_lb.reset_mock()
-        update_dict = {'description': 'fool'}
-        tmp_lb.amphorae = AMPS_DATA
-        tmp_lb.topology = constants.TOPOLOGY_ACTIVE_STANDBY
-        mock_get_lb.return_value = tmp_lb
-        net.execute(pr_tm_dict, update_dict=update_dict)
-        mock_driver.apply_qos_on_port.assert_called_with(
-            t_constants.MOCK_QOS_POLICY_ID1, mock.ANY)
-        self.assertEqual(2, mock_driver.apply_qos_on_port.call_count)
-
-        mock_driver.reset_mock()
-        update_dict = {'description': 'fool',
-                       'vip': {
-                           'qos_policy_id': t_constants.MOCK_QOS_POLICY_ID1}}
-        tmp_lb.amphorae = AMPS_DATA
-        tmp_lb.topology = constants.TOPOLOGY_ACTIVE_STANDBY
-        net.execute(pr_tm_dict, update_dict=update_dict)
-        mock_driver.apply_qos_on_port.assert_called_with(
-            t_constants.MOCK_QOS_POLICY_ID1, mock.ANY)
-        self.assertEqual(2, mock_driver.apply_qos_on_port.call_count)
-
-        mock_get_lb.return_value = null_qos_lb
-        mock_driver.reset_mock()
-        update_dict = {}
-        net.execute(null_qos_lb_dict, update_dict=update_dict)
-        self.assertEqual(0, mock_driver.apply_qos_on_port.call_count)
-
-        # revert
-        mock_driver.reset_mock()
-        mock_get_lb.reset_mock()
-        tmp_lb.amphorae = [AMPS_DATA[0]]
-        tmp_lb.topology = constants.TOPOLOGY_SINGLE
-        update_dict = {'description': 'fool'}
-        mock_get_lb_db.return_value = tmp_lb
-        net.revert(None, pr_tm_dict, update_dict=update_dict)
-        self.assertEqual(0, mock_driver.apply_qos_on_port.call_count)
-
-        mock_driver.reset_mock()
-        update_dict = {'vip': {'qos_policy_id': None}}
-        ori_lb_db = LB2
-        ori_lb_db.amphorae = [AMPS_DATA[0]]
-        mock_get_lb_db.return_value = ori_lb_db
-        net.revert(None, null_qos_lb_dict, update_dict=update_dict)
-        mock_driver.apply_qos_on_port.assert_called_once_with(
-            t_constants.MOCK_QOS_POLICY_ID2, AMPS_DATA[0].vrrp_port_id)
-        self.assertEqual(1, mock_driver.apply_qos_on_port.call_count)
 
+        # Nothing to apply
         mock_driver.reset_mock()
-        mock_get_lb.reset_mock()
-        update_dict = {'vip': {
-            'qos_policy_id': t_constants.MOCK_QOS_POLICY_ID2}}
-        tmp_lb.amphorae = AMPS_DATA
-        tmp_lb.topology = constants.TOPOLOGY_ACTIVE_STANDBY
-        ori_lb_db = LB2
-        ori_lb_db.amphorae = [AMPS_DATA[0]]
-        mock_get_lb_db.return_value = ori_lb_db
-        net.revert(None, pr_tm_dict, update_dict=update_dict)
-        mock_driver.apply_qos_on_port.assert_called_with(
-            t_constants.MOCK_QOS_POLICY_ID2, mock.ANY)
-        self.assertEqual(1, mock_driver.apply_qos_on_port.call_count)
+        for update_dict in (None, {}, {constants.TOPOLOGY: 'SINGLE'},
+                            {constants.VIP: {}}):
+            net.execute(null_qos_lb_dict, amp_data, update_dict)
+        mock_driver.apply_qos_on_port.assert_not_called()
 
     @mock.patch('octavia.db.repositories.LoadBalancerRepository.get')
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_unplug_vip(self, mock_get_session, mock_get_lb,
                         mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_lb.return_value = LB
         mock_get_net_driver.return_value = mock_driver
         net = network_tasks.UnplugVIP()
@@ -787,7 +960,7 @@ class TestNetworkTasks(base.TestCase):
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_allocate_vip(self, mock_get_session, mock_get_lb,
                           mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_lb.return_value = LB
         mock_get_net_driver.return_value = mock_driver
         net = network_tasks.AllocateVIP()
@@ -795,12 +968,12 @@ class TestNetworkTasks(base.TestCase):
         mock_driver.allocate_vip.return_value = LB.vip
 
         mock_driver.reset_mock()
-        self.assertEqual(LB.vip.to_dict(),
+        self.assertEqual(VIP_DICT,
                          net.execute(self.load_balancer_mock))
         mock_driver.allocate_vip.assert_called_once_with(LB)
 
         # revert
-        vip_mock = VIP.to_dict()
+        vip_mock = VIP_DICT
         net.revert(vip_mock, self.load_balancer_mock)
         mock_driver.deallocate_vip.assert_called_once_with(
             o_data_models.Vip(**vip_mock))
@@ -808,7 +981,7 @@ class TestNetworkTasks(base.TestCase):
         # revert exception
         mock_driver.reset_mock()
         mock_driver.deallocate_vip.side_effect = Exception('DeallVipException')
-        vip_mock = VIP.to_dict()
+        vip_mock = VIP_DICT
         net.revert(vip_mock, self.load_balancer_mock)
         mock_driver.deallocate_vip.assert_called_once_with(o_data_models.Vip(
             **vip_mock))
@@ -817,7 +990,7 @@ class TestNetworkTasks(base.TestCase):
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_allocate_vip_for_failover(self, mock_get_session, mock_get_lb,
                                        mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_lb.return_value = LB
         mock_get_net_driver.return_value = mock_driver
         net = network_tasks.AllocateVIPforFailover()
@@ -825,12 +998,12 @@ class TestNetworkTasks(base.TestCase):
         mock_driver.allocate_vip.return_value = LB.vip
 
         mock_driver.reset_mock()
-        self.assertEqual(LB.vip.to_dict(),
+        self.assertEqual(VIP_DICT,
                          net.execute(self.load_balancer_mock))
         mock_driver.allocate_vip.assert_called_once_with(LB)
 
         # revert
-        vip_mock = VIP.to_dict()
+        vip_mock = VIP_DICT
         net.revert(vip_mock, self.load_balancer_mock)
         mock_driver.deallocate_vip.assert_not_called()
 
@@ -838,7 +1011,7 @@ class TestNetworkTasks(base.TestCase):
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_deallocate_vip(self, mock_get_session, mock_get_lb,
                             mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
         net = network_tasks.DeallocateVIP()
         vip = o_data_models.Vip()
@@ -851,7 +1024,7 @@ class TestNetworkTasks(base.TestCase):
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_update_vip(self, mock_get_session, mock_get_lb,
                         mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
         vip = o_data_models.Vip()
         lb = o_data_models.LoadBalancer(vip=vip)
@@ -865,7 +1038,7 @@ class TestNetworkTasks(base.TestCase):
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_update_vip_for_delete(self, mock_get_session, mock_get_lb,
                                    mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
         vip = o_data_models.Vip()
         lb = o_data_models.LoadBalancer(vip=vip)
@@ -883,7 +1056,7 @@ class TestNetworkTasks(base.TestCase):
             mock_get_session, mock_get_net_driver):
         LB_ID = uuidutils.generate_uuid()
         AMP_ID = uuidutils.generate_uuid()
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
         mock_amp_get.return_value = 'mock amphora'
         mock_lb_get.return_value = 'mock load balancer'
@@ -896,12 +1069,13 @@ class TestNetworkTasks(base.TestCase):
             'mock load balancer', amphora='mock amphora')
         mock_amp_get.assert_called_once_with('TEST', id=AMP_ID)
         mock_lb_get.assert_called_once_with('TEST', id=LB_ID)
+        mock_get_session.assert_called_once_with()
 
     @mock.patch('octavia.db.repositories.LoadBalancerRepository.get')
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_get_amphorae_network_configs(self, mock_session, mock_lb_get,
                                           mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_lb_get.return_value = LB
         mock_get_net_driver.return_value = mock_driver
         lb = o_data_models.LoadBalancer()
@@ -913,7 +1087,7 @@ class TestNetworkTasks(base.TestCase):
     @mock.patch('octavia.db.api.get_session', return_value=mock.MagicMock())
     def test_failover_preparation_for_amphora(self, mock_session, mock_get,
                                               mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get.return_value = self.db_amphora_mock
         mock_get_net_driver.return_value = mock_driver
         failover = network_tasks.FailoverPreparationForAmphora()
@@ -923,7 +1097,7 @@ class TestNetworkTasks(base.TestCase):
 
     def test_retrieve_portids_on_amphora_except_lb_network(
             self, mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
 
         def _interface(port_id):
@@ -934,40 +1108,44 @@ class TestNetworkTasks(base.TestCase):
         net_task.execute(self.amphora_mock)
         mock_driver.get_plugged_networks.assert_called_once_with(
             compute_id=COMPUTE_ID)
+        mock_driver.get_ports.assert_called_once_with([])
         self.assertFalse(mock_driver.get_port.called)
 
         mock_driver.reset_mock()
         net_task = network_tasks.RetrievePortIDsOnAmphoraExceptLBNetwork()
         mock_driver.get_plugged_networks.return_value = _interface(1)
         net_task.execute(self.amphora_mock)
-        mock_driver.get_port.assert_called_once_with(port_id=1)
+        mock_driver.get_ports.assert_called_once_with([1])
+
+        # Duplicate interfaces only fetch the port once
+        mock_driver.reset_mock()
+        mock_driver.get_plugged_networks.return_value = (
+            _interface(1) + _interface(1) + _interface(2))
+        net_task.execute(self.amphora_mock)
+        mock_driver.get_ports.assert_called_once_with([1, 2])
 
         mock_driver.reset_mock()
         net_task = network_tasks.RetrievePortIDsOnAmphoraExceptLBNetwork()
-        port_mock = mock.MagicMock()
-        fixed_ip_mock = mock.MagicMock()
-        fixed_ip_mock.ip_address = IP_ADDRESS
-        port_mock.fixed_ips = [fixed_ip_mock]
+        fixed_ip_mock = types.SimpleNamespace(ip_address=IP_ADDRESS)
+        port_mock = types.SimpleNamespace(fixed_ips=[fixed_ip_mock])
         mock_driver.get_plugged_networks.return_value = _interface(1)
-        mock_driver.get_port.return_value = port_mock
+        mock_driver.get_ports.return_value = [port_mock]
         ports = net_task.execute(self.amphora_mock)
         self.assertEqual([], ports)
 
         mock_driver.reset_mock()
         net_task = network_tasks.RetrievePortIDsOnAmphoraExceptLBNetwork()
-        port_mock = mock.MagicMock()
-        fixed_ip_mock = mock.MagicMock()
-        fixed_ip_mock.ip_address = "172.17.17.17"
-        port_mock.fixed_ips = [fixed_ip_mock]
+        fixed_ip_mock = types.SimpleNamespace(ip_address="172.17.17.17")
+        port_mock = types.SimpleNamespace(fixed_ips=[fixed_ip_mock])
         mock_driver.get_plugged_networks.return_value = _interface(1)
-        mock_driver.get_port.return_value = port_mock
+        mock_driver.get_ports.return_value = [port_mock]
         ports = net_task.execute(self.amphora_mock)
         self.assertEqual(1, len(ports))
 
     @mock.patch('octavia.db.repositories.AmphoraRepository.get')
     @mock.patch('octavia.db.api.get_session', return_value=mock.MagicMock())
     def test_plug_ports(self, mock_session, mock_get, mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get.return_value = self.db_amphora_mock
         mock_get_net_driver.return_value = mock_driver
 
@@ -985,18 +1163,22 @@ class TestNetworkTasks(base.TestCase):
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_update_vip_sg(self, mock_session, mock_lb_get,
                            mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_driver.update_vip_sg.return_value = SG_ID
         mock_lb_get.return_value = LB
         mock_get_net_driver.return_value = mock_driver
         net = network_tasks.UpdateVIPSecurityGroup()
+        network_tasks.GetVIPSecurityGroupID._get_sg_id_cache()[LB.id] = (
+            'stale-sg-id')
 
-        sg_id = net.execute(self.load_balancer_mock)
+        sg_id = net.execute(LB.id)
         mock_driver.update_vip_sg.assert_called_once_with(LB, LB.vip)
         self.assertEqual(sg_id, SG_ID)
+        self.assertNotIn(LB.id,
+                         network_tasks.GetVIPSecurityGroupID._sg_id_cache)
 
     def test_get_subnet_from_vip(self, mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
         net = network_tasks.GetSubnetFromVIP()
 
@@ -1008,32 +1190,34 @@ class TestNetworkTasks(base.TestCase):
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_plug_vip_amphora(self, mock_session, mock_lb_get, mock_get,
                               mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         amphora = {constants.ID: AMPHORA_ID,
                    constants.LB_NETWORK_IP: IP_ADDRESS}
         mock_lb_get.return_value = LB
         mock_get.return_value = self.db_amphora_mock
         mock_get_net_driver.return_value = mock_driver
         net = network_tasks.PlugVIPAmphora()
-        mockSubnet = mock_driver.get_subnet()
-        net.execute(self.load_balancer_mock, amphora, mockSubnet)
+        mock_driver.get_subnet.return_value = mock.sentinel.subnet
+        net.execute(self.load_balancer_mock, amphora,
+                    {constants.ID: SUBNET_ID})
+        mock_driver.get_subnet.assert_called_once_with(SUBNET_ID)
         mock_driver.plug_aap_port.assert_called_once_with(
-            LB, LB.vip, self.db_amphora_mock, mockSubnet)
+            LB, LB.vip, self.db_amphora_mock, mock.sentinel.subnet)
 
     @mock.patch('octavia.db.repositories.AmphoraRepository.get')
     @mock.patch('octavia.db.repositories.LoadBalancerRepository.get')
     @mock.patch('octavia.db.api.get_session', return_value=_session_mock)
     def test_revert_plug_vip_amphora(self, mock_session, mock_lb_get, mock_get,
                                      mock_get_net_driver):
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_lb_get.return_value = LB
         mock_get.return_value = self.db_amphora_mock
         mock_get_net_driver.return_value = mock_driver
         net = network_tasks.PlugVIPAmphora()
-        mockSubnet = mock.MagicMock()
+        mockSubnet = mock.sentinel.subnet
         amphora = {constants.ID: AMPHORA_ID,
                    constants.LB_NETWORK_IP: IP_ADDRESS}
-        net.revert(AMPS_DATA[0].to_dict(), self.load_balancer_mock,
+        net.revert(AMP_DATA_DICT, self.load_balancer_mock,
                    amphora, mockSubnet)
         mock_driver.unplug_aap_port.assert_called_once_with(
             LB.vip, self.db_amphora_mock, mockSubnet)
@@ -1041,24 +1225,35 @@ class TestNetworkTasks(base.TestCase):
     @mock.patch('octavia.controller.worker.v2.tasks.network_tasks.DeletePort.'
                 'update_progress')
     def test_delete_port(self, mock_update_progress, mock_get_net_driver):
-        PORT_ID = uuidutils.generate_uuid()
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
         mock_driver.delete_port.side_effect = [
             mock.DEFAULT, exceptions.OctaviaException('boom'), mock.DEFAULT,
             exceptions.OctaviaException('boom'),
             exceptions.OctaviaException('boom'),
             exceptions.OctaviaException('boom'),
-            exceptions.OctaviaException('boom'),
-            exceptions.OctaviaException('boom'),
             exceptions.OctaviaException('boom')]
-        mock_driver.admin_down_port.side_effect = [
-            mock.DEFAULT, exceptions.OctaviaException('boom')]
+        attempt_call = mock.call(PORT_ID, admin_down_on_failure=False)
+        last_attempt_call = mock.call(PORT_ID, admin_down_on_failure=True)
 
         net_task = network_tasks.DeletePort()
 
-        # Limit the retry attempts for the test run to save time
-        net_task.execute.retry.stop = tenacity.stop_after_attempt(2)
+        # The retries are limited by the number of attempts only
+        self.assertIsInstance(net_task.execute.retry.stop,
+                              tenacity.stop_after_attempt)
+
+        # The jittered wait before the first retry is at least retry_interval
+        retry_state = tenacity.RetryCallState(
+            retry_object=net_task.execute.retry, fn=None, args=(), kwargs={})
+        for _ in range(10):
+            self.assertGreaterEqual(net_task.execute.retry.wait(retry_state),
+                                    cfg.CONF.networking.retry_interval)
+
+        # Limit the retry attempts and waits for the test run to save time
+        mock.patch.object(net_task.execute.retry, 'wait',
+                          tenacity.wait_none()).start()
+        mock.patch.object(net_task.execute.retry, 'stop',
+                          tenacity.stop_after_attempt(2)).start()
 
         # Test port ID is None (no-op)
         net_task.execute(None)
@@ -1072,8 +1267,9 @@ class TestNetworkTasks(base.TestCase):
 
         net_task.execute(PORT_ID)
 
-        mock_update_progress.assert_called_once_with(0.5)
-        mock_driver.delete_port.assert_called_once_with(PORT_ID)
+        mock_update_progress.assert_not_called()
+        mock_driver.delete_port.assert_called_once_with(
+            PORT_ID, admin_down_on_failure=False)
 
         # Test exception and successful retry
         mock_update_progress.reset_mock()
@@ -1081,58 +1277,53 @@ class TestNetworkTasks(base.TestCase):
 
         net_task.execute(PORT_ID)
 
-        mock_update_progress.assert_has_calls([mock.call(0.5), mock.call(1.0)])
-        mock_driver.delete_port.assert_has_calls([mock.call(PORT_ID),
-                                                  mock.call(PORT_ID)])
+        mock_update_progress.assert_called_once_with(1.0)
+        self.assertEqual([attempt_call, attempt_call],
+                         mock_driver.delete_port.call_args_list)
 
-        # Test passive failure
+        # Test passive failure, the driver disables the port
         mock_update_progress.reset_mock()
         mock_driver.reset_mock()
 
         net_task.execute(PORT_ID, passive_failure=True)
 
-        mock_update_progress.assert_has_calls([mock.call(0.5), mock.call(1.0)])
-        mock_driver.delete_port.assert_has_calls([mock.call(PORT_ID),
-                                                  mock.call(PORT_ID)])
-        mock_driver.admin_down_port.assert_called_once_with(PORT_ID)
+        mock_update_progress.assert_called_once_with(1.0)
+        self.assertEqual([attempt_call, last_attempt_call],
+                         mock_driver.delete_port.call_args_list)
+        mock_driver.set_port_admin_state_up.assert_not_called()
 
-        # Test passive failure admin down failure
+        # Test non-passive failure
         mock_update_progress.reset_mock()
         mock_driver.reset_mock()
-        mock_driver.admin_down_port.reset_mock()
 
-        net_task.execute(PORT_ID, passive_failure=True)
+        self.assertRaises(exceptions.OctaviaException, net_task.execute,
+                          PORT_ID)
 
-        mock_update_progress.assert_has_calls([mock.call(0.5), mock.call(1.0)])
-        mock_driver.delete_port.assert_has_calls([mock.call(PORT_ID),
-                                                  mock.call(PORT_ID)])
-        mock_driver.admin_down_port.assert_called_once_with(PORT_ID)
+        mock_update_progress.assert_called_once_with(1.0)
+        self.assertEqual([attempt_call, attempt_call],
+                         mock_driver.delete_port.call_args_list)
+        mock_driver.set_port_admin_state_up.assert_not_called()
 
-        # Test non-passive failure
+        # Test passive failure when the retries take longer than
+        # retry_total_timeout, only the attempt limit ends the retries
         mock_update_progress.reset_mock()
         mock_driver.reset_mock()
-        mock_driver.admin_down_port.reset_mock()
-
-        mock_driver.admin_down_port.side_effect = [
+        mock_driver.delete_port.side_effect = [
+            exceptions.OctaviaException('boom'),
             exceptions.OctaviaException('boom')]
 
-        self.assertRaises(exceptions.OctaviaException, net_task.execute,
-                          PORT_ID)
+        with mock.patch('time.monotonic', side_effect=itertools.count(
+                step=cfg.CONF.networking.retry_total_timeout)):
+            net_task.execute(PORT_ID, passive_failure=True)
 
-        mock_update_progress.assert_has_calls([mock.call(0.5), mock.call(1.0)])
-        mock_driver.delete_port.assert_has_calls([mock.call(PORT_ID),
-                                                  mock.call(PORT_ID)])
-        mock_driver.admin_down_port.assert_not_called()
+        mock_update_progress.assert_called_once_with(1.0)
+        self.assertEqual([attempt_call, last_attempt_call],
+                         mock_driver.delete_port.call_args_list)
+        mock_driver.set_port_admin_state_up.assert_not_called()
 
     def test_create_vip_base_port(self, mock_get_net_driver):
-        AMP_ID = uuidutils.generate_uuid()
-        PORT_ID = uuidutils.generate_uuid()
-        VIP_NETWORK_ID = uuidutils.generate_uuid()
-        VIP_QOS_ID = uuidutils.generate_uuid()
-        VIP_SG_ID = uuidutils.generate_uuid()
-        VIP_SUBNET_ID = uuidutils.generate_uuid()
         VIP_IP_ADDRESS = '203.0.113.81'
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
         vip_dict = {constants.IP_ADDRESS: VIP_IP_ADDRESS,
                     constants.NETWORK_ID: VIP_NETWORK_ID,
@@ -1149,8 +1340,11 @@ class TestNetworkTasks(base.TestCase):
 
         net_task = network_tasks.CreateVIPBasePort()
 
-        # Limit the retry attempts for the test run to save time
-        net_task.execute.retry.stop = tenacity.stop_after_attempt(2)
+        # Limit the retry attempts and waits for the test run to save time
+        mock.patch.object(net_task.execute.retry, 'wait',
+                          tenacity.wait_none()).start()
+        mock.patch.object(net_task.execute.retry, 'stop',
+                          tenacity.stop_after_attempt(2)).start()
 
         # Test execute
         result = net_task.execute(vip_dict, VIP_SG_ID, AMP_ID)
@@ -1192,44 +1386,103 @@ class TestNetworkTasks(base.TestCase):
 
     @mock.patch('time.sleep')
     def test_admin_down_port(self, mock_sleep, mock_get_net_driver):
-        PORT_ID = uuidutils.generate_uuid()
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
         port_down_mock = mock.MagicMock()
+        port_down_mock.id = PORT_ID
         port_down_mock.status = constants.DOWN
+        port_down_mock.admin_state_up = True
+        port_disabled_mock = mock.MagicMock()
+        port_disabled_mock.id = PORT_ID
+        port_disabled_mock.status = constants.DOWN
+        port_disabled_mock.admin_state_up = False
         port_up_mock = mock.MagicMock()
+        port_up_mock.id = PORT_ID
         port_up_mock.status = constants.UP
+        port_up_mock.admin_state_up = True
         mock_driver.set_port_admin_state_up.side_effect = [
-            mock.DEFAULT, net_base.PortNotFound, mock.DEFAULT, mock.DEFAULT,
-            Exception('boom')]
-        mock_driver.get_port.side_effect = [port_down_mock, port_up_mock]
+            mock.DEFAULT, mock.DEFAULT, net_base.PortNotFound, mock.DEFAULT,
+            mock.DEFAULT, mock.DEFAULT, Exception('boom')]
+        mock_driver.get_port.return_value = port_up_mock
+        mock_driver.get_ports.side_effect = [[port_disabled_mock]]
 
         net_task = network_tasks.AdminDownPort()
 
-        # Test execute
+        # Test execute, the port retrieved first is used as the first poll
         net_task.execute(PORT_ID)
 
+        mock_driver.get_port.assert_called_once_with(PORT_ID)
         mock_driver.set_port_admin_state_up.assert_called_once_with(PORT_ID,
                                                                     False)
-        mock_driver.get_port.assert_called_once_with(PORT_ID)
+        mock_driver.get_ports.assert_called_once_with({PORT_ID})
+        mock_sleep.assert_called_once_with(0.1)
+
+        # Test execute with a port that is down but still admin up
+        mock_driver.reset_mock()
+        mock_sleep.reset_mock()
+        mock_driver.get_port.return_value = port_down_mock
+
+        net_task.execute(PORT_ID)
+
+        mock_driver.set_port_admin_state_up.assert_called_once_with(PORT_ID,
+                                                                    False)
+        mock_driver.get_ports.assert_not_called()
+        mock_sleep.assert_not_called()
+
+        # Test execute with a port that is already disabled
+        mock_driver.reset_mock()
+        mock_driver.get_port.return_value = port_disabled_mock
+
+        net_task.execute(PORT_ID)
+
+        mock_driver.set_port_admin_state_up.assert_not_called()
+        mock_driver.get_ports.assert_not_called()
 
         # Test passive fail on port not found
         mock_driver.reset_mock()
+        mock_driver.get_port.side_effect = net_base.PortNotFound
+
+        net_task.execute(PORT_ID)
+
+        mock_driver.set_port_admin_state_up.assert_not_called()
+        mock_driver.get_ports.assert_not_called()
+
+        # Test passive fail on port not found when disabling it
+        mock_driver.reset_mock()
+        mock_driver.get_port.side_effect = None
+        mock_driver.get_port.return_value = port_up_mock
 
         net_task.execute(PORT_ID)
 
         mock_driver.set_port_admin_state_up.assert_called_once_with(PORT_ID,
                                                                     False)
-        mock_driver.get_port.assert_not_called()
+        mock_driver.get_ports.assert_not_called()
+
+        # Test the port being deleted while waiting for it to go down
+        mock_driver.reset_mock()
+        mock_driver.get_ports.side_effect = net_base.PortNotFound
+
+        net_task.execute(PORT_ID)
+
+        mock_driver.get_ports.assert_called_once_with({PORT_ID})
+        mock_sleep.assert_called_once_with(0.1)
 
-        # Test passive fail on port stays up
+        # Test passive fail on port stays up, polling with a backoff until
+        # max_retries * retry_interval seconds have been waited
         mock_driver.reset_mock()
+        mock_sleep.reset_mock()
+        mock_driver.get_ports.side_effect = None
+        mock_driver.get_ports.return_value = [port_up_mock]
 
         net_task.execute(PORT_ID)
 
         mock_driver.set_port_admin_state_up.assert_called_once_with(PORT_ID,
                                                                     False)
-        mock_driver.get_port.assert_called_once_with(PORT_ID)
+        self.assertEqual(4, mock_driver.get_ports.call_count)
+        sleeps = [args[0] for args, kwargs in mock_sleep.call_args_list]
+        self.assertEqual([0.1, 0.2, 0.4], sleeps[:3])
+        self.assertEqual(4, len(sleeps))
+        self.assertAlmostEqual(1, sum(sleeps))
 
         # Test revert when this task failed
         mock_driver.reset_mock()
@@ -1247,27 +1500,83 @@ class TestNetworkTasks(base.TestCase):
         mock_driver.set_port_admin_state_up.assert_called_once_with(PORT_ID,
                                                                     True)
 
+        # Test revert when the port no longer exists
+        mock_driver.reset_mock()
+        mock_driver.set_port_admin_state_up.side_effect = (
+            net_base.PortNotFound)
+
+        net_task.revert(None, PORT_ID)
+
+        mock_driver.set_port_admin_state_up.assert_called_once_with(PORT_ID,
+                                                                    True)
+        mock_driver.get_port.assert_not_called()
+
         # Test revert exception passive failure
         mock_driver.reset_mock()
+        mock_driver.set_port_admin_state_up.side_effect = Exception('boom')
 
         net_task.revert(None, PORT_ID)
 
         mock_driver.set_port_admin_state_up.assert_called_once_with(PORT_ID,
                                                                     True)
 
+    @mock.patch('time.sleep')
+    def test_admin_down_port_wait_deleted_ports(self, mock_sleep,
+                                                mock_get_net_driver):
+        PORT_ID2 = uuidutils.generate_uuid()
+        mock_driver = _network_driver()
+        mock_get_net_driver.return_value = mock_driver
+        port_down_mock = mock.MagicMock()
+        port_down_mock.id = PORT_ID
+        port_down_mock.status = constants.DOWN
+
+        def _get_port(port_id):
+            if port_id != PORT_ID:
+                raise net_base.PortNotFound
+            return port_down_mock
+
+        mock_driver.get_ports.side_effect = net_base.PortNotFound
+        mock_driver.get_port.side_effect = _get_port
+
+        net_task = network_tasks.AdminDownPort()
+
+        # A deleted port doesn't stop the wait on the other ports
+        net_task._wait_ports_down([PORT_ID, PORT_ID2])
+
+        mock_driver.get_ports.assert_called_once_with({PORT_ID, PORT_ID2})
+        mock_driver.get_port.assert_has_calls(
+            [mock.call(PORT_ID), mock.call(PORT_ID2)], any_order=True)
+        mock_sleep.assert_not_called()
+
+    @mock.patch('octavia.controller.worker.v2.tasks.network_tasks.'
+                'SG_ID_CACHE_SIZE', 1)
+    def test_get_vip_security_group_id_cache_size(self, mock_get_net_driver):
+        mock_driver = _network_driver()
+        mock_get_net_driver.return_value = mock_driver
+        mock_driver.get_security_group.return_value = types.SimpleNamespace(
+            id=SG_ID)
+        LB_ID2 = uuidutils.generate_uuid()
+
+        net_task = network_tasks.GetVIPSecurityGroupID()
+        net_task.execute(LB_ID)
+        net_task.execute(LB_ID2)
+
+        # Only the most recently found ID is kept
+        self.assertEqual(
+            [LB_ID2],
+            list(network_tasks.GetVIPSecurityGroupID._sg_id_cache))
+
     @mock.patch('octavia.common.utils.get_vip_security_group_name')
     def test_get_vip_security_group_id(self, mock_get_sg_name,
                                        mock_get_net_driver):
-        LB_ID = uuidutils.generate_uuid()
-        SG_ID = uuidutils.generate_uuid()
         SG_NAME = 'fake_SG_name'
-        mock_driver = mock.MagicMock()
+        mock_driver = _network_driver()
         mock_get_net_driver.return_value = mock_driver
         mock_get_sg_name.return_value = SG_NAME
         sg_mock = mock.MagicMock()
         sg_mock.id = SG_ID
         mock_driver.get_security_group.side_effect = [
-            sg_mock, None, net_base.SecurityGroupNotFound,
+            sg_mock, sg_mock, None, net_base.SecurityGroupNotFound,
             net_base.SecurityGroupNotFound]
 
         net_task = network_tasks.GetVIPSecurityGroupID()
@@ -1275,10 +1584,31 @@ class TestNetworkTasks(base.TestCase):
         # Test execute
         result = net_task.execute(LB_ID)
 
+        self.assertEqual(SG_ID, result)
         mock_driver.get_security_group.assert_called_once_with(SG_NAME)
         mock_get_sg_name.assert_called_once_with(LB_ID)
 
+        # Test execute with a cached security group ID
+        mock_driver.reset_mock()
+        mock_get_sg_name.reset_mock()
+
+        result = net_task.execute(LB_ID)
+
+        self.assertEqual(SG_ID, result)
+        mock_driver.get_security_group.assert_not_called()
+        mock_get_sg_name.assert_not_called()
+
+        # Test execute with an expired security group ID
+        network_tasks.GetVIPSecurityGroupID._sg_id_cache.expire(
+            time.monotonic() + cfg.CONF.networking.object_cache_ttl)
+
+        result = net_task.execute(LB_ID)
+
+        self.assertEqual(SG_ID, result)
+        mock_driver.get_security_group.assert_called_once_with(SG_NAME)
+
         # Test execute with empty get subnet response
+        network_tasks.GetVIPSecurityGroupID.invalidate(LB_ID)
         mock_driver.reset_mock()
         mock_get_sg_name.reset_mock()
 
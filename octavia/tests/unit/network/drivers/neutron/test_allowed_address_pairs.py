@@ -913,6 +913,14 @@ class TestAllowedAddressPairsDriver(base.TestCase):
                          oct_interface.compute_id)
         self.assertEqual(net_id, oct_interface.network_id)
 
+    def test_plug_network_invalidates_cache(self):
+        net_id = t_constants.MOCK_NOVA_INTERFACE.net_id
+        self.driver.compute.attach_network_or_port.return_value = (
+            t_constants.MOCK_NOVA_INTERFACE)
+        self.driver._cache_resources([network_models.Network(id=net_id)])
+        self.driver.plug_network(t_constants.MOCK_COMPUTE_ID, net_id)
+        self.assertNotIn(net_id, self.driver._resource_cache)
+
     def test_unplug_network_when_compute_port_cant_be_found(self):
         net_id = t_constants.MOCK_NOVA_INTERFACE.net_id
         list_ports = self.driver.neutron_client.list_ports
@@ -1402,6 +1410,27 @@ class TestAllowedAddressPairsDriver(base.TestCase):
         # Test unknown exception
         self.assertRaises(exceptions.NetworkServiceError,
                           self.driver.delete_port, PORT_ID)
+        self.driver.neutron_client.update_port.assert_not_called()
+
+    def test_delete_port_admin_down_on_failure(self):
+        PORT_ID = uuidutils.generate_uuid()
+
+        self.driver.neutron_client.delete_port.side_effect = Exception('boom')
+        self.driver.neutron_client.update_port.side_effect = [
+            mock.DEFAULT, Exception('boom')]
+
+        # Test the port is disabled
+        self.assertRaises(exceptions.NetworkServiceError,
+                          self.driver.delete_port, PORT_ID,
+                          admin_down_on_failure=True)
+        self.driver.neutron_client.update_port.assert_called_once_with(
+            PORT_ID, {'port': {'admin_state_up': False}})
+
+        # Test the disable failure does not replace the delete failure
+        self.assertRaises(exceptions.NetworkServiceError,
+                          self.driver.delete_port, PORT_ID,
+                          admin_down_on_failure=True)
+        self.assertEqual(2, self.driver.neutron_client.update_port.call_count)
 
     def test_set_port_admin_state_up(self):
         PORT_ID = uuidutils.generate_uuid()
@@ -11,6 +11,7 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
+import time
 from unittest import mock
 
 from neutronclient.common import exceptions as neutron_client_exceptions
@@ -261,6 +262,192 @@ class TestBaseNeutronNetworkDriver(base.TestCase):
         self.assertEqual(t_constants.MOCK_IP_ADDRESS, subnet.gateway_ip)
         self.assertEqual(t_constants.MOCK_CIDR, subnet.cidr)
 
+    def test_get_networks(self):
+        list_networks = self.driver.neutron_client.list_networks
+        list_networks.return_value = {'networks': [
+            {'id': t_constants.MOCK_NETWORK_ID,
+             'subnets': [t_constants.MOCK_SUBNET_ID]},
+            {'id': t_constants.MOCK_NETWORK_ID2,
+             'subnets': [t_constants.MOCK_SUBNET_ID2]}]}
+        networks = self.driver.get_networks([t_constants.MOCK_NETWORK_ID,
+                                             t_constants.MOCK_NETWORK_ID2])
+        list_networks.assert_called_once_with(
+            id=[t_constants.MOCK_NETWORK_ID, t_constants.MOCK_NETWORK_ID2])
+        self.assertEqual(2, len(networks))
+        self.assertIsInstance(networks[0], network_models.Network)
+        self.assertEqual(t_constants.MOCK_NETWORK_ID, networks[0].id)
+        self.assertEqual([t_constants.MOCK_SUBNET_ID], networks[0].subnets)
+        self.assertEqual(t_constants.MOCK_NETWORK_ID2, networks[1].id)
+
+        # No network IDs means no request at all
+        list_networks.reset_mock()
+        self.assertEqual([], self.driver.get_networks([]))
+        list_networks.assert_not_called()
+
+        # Negative
+        self.driver.invalidate_cache(t_constants.MOCK_NETWORK_ID)
+        list_networks.side_effect = neutron_client_exceptions.NotFound
+        self.assertRaises(network_base.NetworkNotFound,
+                          self.driver.get_networks,
+                          [t_constants.MOCK_NETWORK_ID])
+        list_networks.side_effect = Exception
+        self.assertRaises(network_base.NetworkException,
+                          self.driver.get_networks,
+                          [t_constants.MOCK_NETWORK_ID])
+
+    def test_get_networks_partially_missing(self):
+        list_networks = self.driver.neutron_client.list_networks
+        list_networks.return_value = {'networks': [
+            {'id': t_constants.MOCK_NETWORK_ID}]}
+
+        self.assertRaisesRegex(network_base.NetworkNotFound,
+                               t_constants.MOCK_NETWORK_ID2,
+                               self.driver.get_networks,
+                               [t_constants.MOCK_NETWORK_ID,
+                                t_constants.MOCK_NETWORK_ID2])
+
+        # Also fails when the other networks are served from the cache
+        list_networks.return_value = {'networks': []}
+        self.assertRaisesRegex(network_base.NetworkNotFound,
+                               t_constants.MOCK_NETWORK_ID2,
+                               self.driver.get_networks,
+                               [t_constants.MOCK_NETWORK_ID,
+                                t_constants.MOCK_NETWORK_ID2])
+
+    def test_get_subnets(self):
+        list_subnets = self.driver.neutron_client.list_subnets
+        list_subnets.return_value = {'subnets': [
+            {'id': t_constants.MOCK_SUBNET_ID,
+             'network_id': t_constants.MOCK_NETWORK_ID},
+            {'id': t_constants.MOCK_SUBNET_ID2,
+             'network_id': t_constants.MOCK_NETWORK_ID2}]}
+        subnets = self.driver.get_subnets([t_constants.MOCK_SUBNET_ID,
+                                           t_constants.MOCK_SUBNET_ID2])
+        list_subnets.assert_called_once_with(
+            id=[t_constants.MOCK_SUBNET_ID, t_constants.MOCK_SUBNET_ID2])
+        self.assertEqual(2, len(subnets))
+        self.assertIsInstance(subnets[0], network_models.Subnet)
+        self.assertEqual(t_constants.MOCK_SUBNET_ID, subnets[0].id)
+        self.assertEqual(t_constants.MOCK_NETWORK_ID, subnets[0].network_id)
+        self.assertEqual(t_constants.MOCK_SUBNET_ID2, subnets[1].id)
+        self.assertEqual(t_constants.MOCK_NETWORK_ID2, subnets[1].network_id)
+
+        # No subnet IDs means no request at all
+        list_subnets.reset_mock()
+        self.assertEqual([], self.driver.get_subnets([]))
+        list_subnets.assert_not_called()
+
+        # Negative
+        self.driver.invalidate_cache(t_constants.MOCK_SUBNET_ID)
+        list_subnets.side_effect = neutron_client_exceptions.NotFound
+        self.assertRaises(network_base.SubnetNotFound,
+                          self.driver.get_subnets,
+                          [t_constants.MOCK_SUBNET_ID])
+        list_subnets.side_effect = Exception
+        self.assertRaises(network_base.NetworkException,
+                          self.driver.get_subnets,
+                          [t_constants.MOCK_SUBNET_ID])
+
+    def test_get_subnets_partially_missing(self):
+        list_subnets = self.driver.neutron_client.list_subnets
+        list_subnets.return_value = {'subnets': [
+            {'id': t_constants.MOCK_SUBNET_ID}]}
+
+        self.assertRaisesRegex(network_base.SubnetNotFound,
+                               t_constants.MOCK_SUBNET_ID2,
+                               self.driver.get_subnets,
+                               [t_constants.MOCK_SUBNET_ID,
+                                t_constants.MOCK_SUBNET_ID2])
+
+    def test_get_network_cached(self):
+        show_network = self.driver.neutron_client.show_network
+        show_network.return_value = {'network': {
+            'id': t_constants.MOCK_NETWORK_ID}}
+        list_networks = self.driver.neutron_client.list_networks
+        list_networks.return_value = {'networks': [
+            {'id': t_constants.MOCK_NETWORK_ID2}]}
+
+        network = self.driver.get_network(t_constants.MOCK_NETWORK_ID)
+        cached_network = self.driver.get_network(t_constants.MOCK_NETWORK_ID)
+        show_network.assert_called_once_with(t_constants.MOCK_NETWORK_ID)
+
+        # Every caller gets its own copy of the cached network
+        self.assertEqual(network, cached_network)
+        self.assertIsNot(network, cached_network)
+        network.name = 'changed'
+        self.assertIsNone(
+            self.driver.get_network(t_constants.MOCK_NETWORK_ID).name)
+
+        # Only the networks missing from the cache are requested
+        networks = self.driver.get_networks([t_constants.MOCK_NETWORK_ID,
+                                             t_constants.MOCK_NETWORK_ID2])
+        list_networks.assert_called_once_with(
+            id=[t_constants.MOCK_NETWORK_ID2])
+        self.assertEqual([t_constants.MOCK_NETWORK_ID,
+                          t_constants.MOCK_NETWORK_ID2],
+                         [net.id for net in networks])
+        list_networks.reset_mock()
+        self.driver.get_networks([t_constants.MOCK_NETWORK_ID2])
+        list_networks.assert_not_called()
+
+        # Invalidated networks are requested again
+        show_network.reset_mock()
+        self.driver.invalidate_cache(t_constants.MOCK_NETWORK_ID)
+        self.driver.get_network(t_constants.MOCK_NETWORK_ID)
+        show_network.assert_called_once_with(t_constants.MOCK_NETWORK_ID)
+
+        # Expired networks are requested again
+        show_network.reset_mock()
+        self.driver._resource_cache.expire(
+            time.monotonic() + cfg.CONF.networking.object_cache_ttl)
+        self.driver.get_network(t_constants.MOCK_NETWORK_ID)
+        show_network.assert_called_once_with(t_constants.MOCK_NETWORK_ID)
+
+    @mock.patch('octavia.network.drivers.neutron.base.RESOURCE_CACHE_SIZE', 2)
+    def test_get_networks_cache_eviction(self):
+        driver = self._instantiate_partial_abc(neutron_base.BaseNeutronDriver)
+        list_networks = driver.neutron_client.list_networks
+        list_networks.return_value = {'networks': [
+            {'id': t_constants.MOCK_NETWORK_ID},
+            {'id': t_constants.MOCK_NETWORK_ID2}]}
+        driver.get_networks([t_constants.MOCK_NETWORK_ID,
+                             t_constants.MOCK_NETWORK_ID2])
+        list_networks.return_value = {'networks': [{'id': 'mock-network-3'}]}
+        driver.get_networks(['mock-network-3'])
+
+        # Only the least recently used network is evicted
+        list_networks.reset_mock()
+        driver.get_networks([t_constants.MOCK_NETWORK_ID2, 'mock-network-3'])
+        list_networks.assert_not_called()
+        list_networks.return_value = {'networks': [
+            {'id': t_constants.MOCK_NETWORK_ID}]}
+        driver.get_networks([t_constants.MOCK_NETWORK_ID])
+        list_networks.assert_called_once_with(
+            id=[t_constants.MOCK_NETWORK_ID])
+
+    @mock.patch("octavia.common.clients.NeutronAuth.get_user_neutron_client")
+    def test_get_user_subnet_not_cached(self, neutron_client_mock):
+        show_subnet = neutron_client_mock.return_value.show_subnet
+        show_subnet.return_value = {'subnet': {
+            'id': t_constants.MOCK_SUBNET_ID}}
+
+        self.driver.get_subnet(t_constants.MOCK_SUBNET_ID, context=mock.ANY)
+        self.driver.get_subnet(t_constants.MOCK_SUBNET_ID, context=mock.ANY)
+
+        self.assertEqual(2, show_subnet.call_count)
+
+    def test_get_subnet_cache_disabled(self):
+        config = self.useFixture(oslo_fixture.Config(cfg.CONF))
+        config.config(group="networking", object_cache_ttl=0)
+        show_subnet = self.driver.neutron_client.show_subnet
+        show_subnet.return_value = {'subnet': {
+            'id': t_constants.MOCK_SUBNET_ID}}
+
+        self.driver.get_subnet(t_constants.MOCK_SUBNET_ID)
+        self.driver.get_subnet(t_constants.MOCK_SUBNET_ID)
+
+        self.assertEqual(2, show_subnet.call_count)
+
     def test_get_port(self):
         config = self.useFixture(oslo_fixture.Config(cfg.CONF))
         config.config(group="networking", allow_invisible_resource_usage=True)
@@ -311,6 +498,48 @@ class TestBaseNeutronNetworkDriver(base.TestCase):
         self.assertEqual(t_constants.MOCK_IP_ADDRESS,
                          port.fixed_ips[0].ip_address)
 
+    def test_get_ports(self):
+        list_ports = self.driver.neutron_client.list_ports
+        list_ports.return_value = {'ports': [
+            {'id': t_constants.MOCK_PORT_ID,
+             'network_id': t_constants.MOCK_NETWORK_ID,
+             'fixed_ips': [{'subnet_id': t_constants.MOCK_SUBNET_ID,
+                            'ip_address': t_constants.MOCK_IP_ADDRESS}]}]}
+        ports = self.driver.get_ports([t_constants.MOCK_PORT_ID])
+        list_ports.assert_called_once_with(id=[t_constants.MOCK_PORT_ID])
+        self.assertEqual(1, len(ports))
+        self.assertIsInstance(ports[0], network_models.Port)
+        self.assertEqual(t_constants.MOCK_PORT_ID, ports[0].id)
+        self.assertEqual(t_constants.MOCK_NETWORK_ID, ports[0].network_id)
+        self.assertEqual(t_constants.MOCK_SUBNET_ID,
+                         ports[0].fixed_ips[0].subnet_id)
+
+        # No port IDs means no request at all
+        list_ports.reset_mock()
+        self.assertEqual([], self.driver.get_ports([]))
+        list_ports.assert_not_called()
+
+        # Negative
+        list_ports.side_effect = neutron_client_exceptions.NotFound
+        self.assertRaises(network_base.PortNotFound,
+                          self.driver.get_ports,
+                          [t_constants.MOCK_PORT_ID])
+        list_ports.side_effect = Exception
+        self.assertRaises(network_base.NetworkException,
+                          self.driver.get_ports,
+                          [t_constants.MOCK_PORT_ID])
+
+    def test_get_ports_partially_missing(self):
+        list_ports = self.driver.neutron_client.list_ports
+        list_ports.return_value = {'ports': [
+            {'id': t_constants.MOCK_PORT_ID}]}
+
+        self.assertRaisesRegex(network_base.PortNotFound,
+                               t_constants.MOCK_PORT_ID2,
+                               self.driver.get_ports,
+                               [t_constants.MOCK_PORT_ID,
+                                t_constants.MOCK_PORT_ID2])
+
     def test_get_network_by_name(self):
         list_network = self.driver.neutron_client.list_networks
         list_network.return_value = {'networks': [{'network': {
@@ -149,6 +149,23 @@ class TestNoopNetworkDriver(base.TestCase):
             self.driver.driver.networkconfigconfig[self.subnet_id]
         )
 
+    def test_get_networks(self):
+        networks = self.driver.get_networks([self.network_id])
+        self.assertEqual(
+            ((self.network_id,), 'get_networks'),
+            self.driver.driver.networkconfigconfig[(self.network_id,)]
+        )
+        self.assertEqual([self.network_id],
+                         [network.id for network in networks])
+
+    def test_get_subnets(self):
+        subnets = self.driver.get_subnets([self.subnet_id])
+        self.assertEqual(
+            ((self.subnet_id,), 'get_subnets'),
+            self.driver.driver.networkconfigconfig[(self.subnet_id,)]
+        )
+        self.assertEqual([self.subnet_id], [subnet.id for subnet in subnets])
+
     def test_get_port(self):
         self.driver.get_port(self.port_id)
         self.assertEqual(
@@ -156,6 +173,14 @@ class TestNoopNetworkDriver(base.TestCase):
             self.driver.driver.networkconfigconfig[self.port_id]
         )
 
+    def test_get_ports(self):
+        ports = self.driver.get_ports([self.port_id])
+        self.assertEqual(
+            ((self.port_id,), 'get_ports'),
+            self.driver.driver.networkconfigconfig[(self.port_id,)]
+        )
+        self.assertEqual([self.port_id], [port.id for port in ports])
+
     def test_get_network_by_name(self):
         self.driver.get_network_by_name(self.network_name)
         self.assertEqual(